@@ -0,0 +1 @@
+from src.commands.cli import cli
@@ -0,0 +1,4 @@
+from src.commands.cli import cli
+
+if __name__ == "__main__":
+    cli(prog_name="scoffy")
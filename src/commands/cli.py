@@ -0,0 +1,520 @@
+import functools
+import math
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO, Literal
+
+import click
+
+from src.helpers.context import (
+    load_context_file,
+    parse_assignments,
+    validate_context,
+)
+
+
+def _collect_context(
+    config: Path | None, assignments: tuple[str, ...]
+) -> dict[str, object]:
+    context: dict[str, object] = {}
+    if config is not None:
+        try:
+            context.update(load_context_file(config))
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="--config") from exc
+    try:
+        context.update(parse_assignments(assignments))
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--set") from exc
+    try:
+        validate_context(context)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--set/--config") from exc
+    return context
+
+
+def _instrumented(command: Callable[..., None]) -> Callable[..., None]:
+    """Add ``--timings`` and ``--trace`` to a command."""
+
+    @click.option(
+        "--timings",
+        is_flag=True,
+        help="Print a breakdown of where the time went to stderr.",
+    )
+    @click.option(
+        "--trace",
+        type=click.Path(dir_okay=False, path_type=Path),
+        default=None,
+        help="Write a Chrome trace-event JSON file (chrome://tracing, Perfetto).",
+    )
+    @functools.wraps(command)
+    def wrapper(*args: Any, timings: bool, trace: Path | None, **kwargs: Any) -> None:
+        if not timings and trace is None:
+            return command(*args, **kwargs)
+
+        from src.core.timing import Tracer, tracing
+
+        tracer = Tracer()
+        try:
+            with tracing(tracer), tracer.span(command.__name__, "command"):
+                command(*args, **kwargs)
+        finally:
+            if timings:
+                click.echo(tracer.format_table(), err=True)
+            if trace is not None:
+                trace.write_bytes(tracer.to_chrome_trace())
+                click.echo(f"trace written to {trace}", err=True)
+
+    return wrapper
+
+
+@click.group()
+def cli() -> None:
+    """Scaffold FastAPI projects from scoffy templates."""
+
+
+@cli.command()
+@click.argument(
+    "destination", type=click.Path(file_okay=False, path_type=Path), default="."
+)
+@click.option(
+    "--config",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSON or YAML file with template options.",
+)
+@click.option(
+    "--set",
+    "assignments",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Template option, e.g. --set database_type=postgresql. Repeatable.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads used to render and write files (default: CPU count + 4).",
+)
+@_instrumented
+def new(
+    destination: Path,
+    config: Path | None,
+    assignments: tuple[str, ...],
+    workers: int | None,
+) -> None:
+    """Generate a project into DESTINATION."""
+    from src.core.scaffold import build_context, scaffold
+    from src.core.timing import span
+
+    with span("resolve context", "context"):
+        context = build_context(
+            {
+                "project_name": destination.resolve().name,
+                **_collect_context(config, assignments),
+            }
+        )
+    written = scaffold(context, destination, workers=workers)
+    for path in written:
+        click.echo(f"created {path}")
+
+
+@cli.command()
+@click.argument(
+    "destination",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=".",
+)
+@click.option(
+    "--config",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSON or YAML file with template options to change.",
+)
+@click.option(
+    "--set",
+    "assignments",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Template option to change, e.g. --set use_redis=true. Repeatable.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads used to render and write files (default: CPU count + 4).",
+)
+@_instrumented
+def update(
+    destination: Path,
+    config: Path | None,
+    assignments: tuple[str, ...],
+    workers: int | None,
+) -> None:
+    """Regenerate the project in DESTINATION, rewriting only changed files."""
+    from src.core.update import update_project
+
+    try:
+        result = update_project(
+            destination, _collect_context(config, assignments), workers=workers
+        )
+    except FileNotFoundError as exc:
+        raise click.ClickException(str(exc)) from exc
+    for path in result.written:
+        click.echo(f"updated {path}")
+    for path in result.removed:
+        click.echo(f"removed {path}")
+    click.echo(
+        f"{len(result.written)} written, {len(result.removed)} removed, "
+        f"{len(result.unchanged) + len(result.skipped)} unchanged"
+    )
+
+
+ARCHIVE_SUFFIXES = {".tar.gz": "tar.gz", ".tgz": "tar.gz", ".tar": "tar", ".zip": "zip"}
+
+
+@cli.command()
+@click.argument(
+    "output",
+    type=click.Path(dir_okay=False, allow_dash=True, path_type=Path),
+    default="-",
+)
+@click.option(
+    "--format",
+    "archive_format",
+    type=click.Choice(["tar.gz", "tar", "zip"]),
+    default=None,
+    help="Archive format (default: from OUTPUT's extension, else tar.gz).",
+)
+@click.option(
+    "--name",
+    default=None,
+    help="Project name and top-level directory (default: OUTPUT without suffix).",
+)
+@click.option(
+    "--config",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSON or YAML file with template options.",
+)
+@click.option(
+    "--set",
+    "assignments",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Template option, e.g. --set database_type=postgresql. Repeatable.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads used to render files (default: CPU count + 4).",
+)
+@_instrumented
+def archive(
+    output: Path,
+    archive_format: str | None,
+    name: str | None,
+    config: Path | None,
+    assignments: tuple[str, ...],
+    workers: int | None,
+) -> None:
+    """Stream a generated project as an archive to OUTPUT (- for stdout).
+
+    Files go into the archive as they are rendered; nothing is written to
+    disk besides OUTPUT itself.
+    """
+    from src.core.project import stream
+    from src.core.sinks import Sink, TarSink, ZipSink
+
+    to_stdout = str(output) == "-"
+    suffix = next(
+        (suffix for suffix in ARCHIVE_SUFFIXES if output.name.endswith(suffix)), ""
+    )
+    archive_format = archive_format or ARCHIVE_SUFFIXES.get(suffix, "tar.gz")
+    if name is None and not to_stdout:
+        name = output.name.removesuffix(suffix)
+    options = _collect_context(config, assignments)
+    if name:
+        options = {"project_name": name, **options}
+
+    handle: BinaryIO = sys.stdout.buffer if to_stdout else output.open("wb")
+    sink: Sink
+    if archive_format == "zip":
+        sink = ZipSink(handle, prefix=name or "")
+    else:
+        compression: Literal["gz", ""] = "gz" if archive_format == "tar.gz" else ""
+        sink = TarSink(handle, compression=compression, prefix=name or "")
+    try:
+        stream(sink, options, workers=workers)
+    except BaseException:
+        if not to_stdout:
+            handle.close()
+            output.unlink(missing_ok=True)
+        raise
+    if to_stdout:
+        handle.flush()
+    else:
+        handle.close()
+
+
+@cli.command()
+@click.argument(
+    "manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=".",
+    show_default=True,
+    help="Directory the projects are generated into, one subdirectory each.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Threads used to render and write each project (default: CPU count + 4).",
+)
+@_instrumented
+def batch(manifest: Path, output_dir: Path, workers: int | None) -> None:
+    """Generate every project listed in a YAML or JSONL MANIFEST."""
+    from src.core.batch import iter_specs, run_batch
+
+    failures = 0
+    total = 0
+    for entry in run_batch(iter_specs(manifest), output_dir, workers=workers):
+        total += 1
+        if entry.ok:
+            click.echo(f"ok    {entry.seconds * 1000:8.1f} ms  {entry.name}")
+        else:
+            failures += 1
+            click.echo(
+                f"FAIL  {entry.seconds * 1000:8.1f} ms  {entry.name}: {entry.error}"
+            )
+    click.echo(f"{total - failures} generated, {failures} failed")
+    if failures:
+        raise SystemExit(1)
+
+
+FULL_MATRIX_LIMIT = 100_000
+
+
+@cli.command()
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Render every combination instead of a pairwise-covering subset.",
+)
+@click.option(
+    "--option",
+    "options",
+    multiple=True,
+    metavar="KEY",
+    help="Only vary this option (repeatable); the others stay unset.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Processes used to render and validate (default: CPU count).",
+)
+def matrix(full: bool, options: tuple[str, ...], workers: int | None) -> None:
+    """Render combinations of template options and parse every output."""
+    from src.core.matrix import (
+        OPTION_SPACE,
+        full_combinations,
+        pairwise_combinations,
+        run_matrix,
+    )
+
+    if unknown := sorted(set(options) - set(OPTION_SPACE)):
+        raise click.BadParameter(
+            f"unknown option(s) {', '.join(unknown)}; "
+            f"choose from {', '.join(OPTION_SPACE)}",
+            param_hint="--option",
+        )
+    space = {key: OPTION_SPACE[key] for key in options} if options else OPTION_SPACE
+    if full and (total := math.prod(map(len, space.values()))) > FULL_MATRIX_LIMIT:
+        raise click.UsageError(
+            f"the full matrix has {total:,} combinations; "
+            "narrow it with --option or drop --full"
+        )
+    combinations = (
+        list(full_combinations(space)) if full else pairwise_combinations(space)
+    )
+    report = run_matrix(combinations, workers=workers)
+    for failure in report.failures:
+        click.echo(f"FAIL  {failure.format()}")
+    click.echo(
+        f"{report.combinations} combinations, {report.files} files, "
+        f"{len(report.failures)} failed"
+    )
+    if not report.ok:
+        raise SystemExit(1)
+
+
+@cli.command("startup-report", context_settings={"ignore_unknown_options": True})
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+@click.option(
+    "--budget-ms",
+    type=float,
+    default=None,
+    help="Fail when imports for `scoffy ARGS` take longer than this.",
+)
+@click.option("--top", type=int, default=10, show_default=True)
+def startup_report(args: tuple[str, ...], budget_ms: float | None, top: int) -> None:
+    """Measure the import cost of `scoffy ARGS` (default: --help)."""
+    import subprocess
+
+    from src.helpers.importtime import measure_startup, strip_importtime
+
+    argv = args or ("--help",)
+    try:
+        report = measure_startup(argv)
+    except subprocess.CalledProcessError as exc:
+        raise click.ClickException(
+            f"`scoffy {' '.join(argv)}` exited with status {exc.returncode}:\n"
+            + strip_importtime(exc.stderr)
+        ) from exc
+    click.echo(report.format(top))
+    problems = []
+    if forbidden := report.forbidden():
+        problems.append(f"framework modules imported: {', '.join(forbidden)}")
+    if budget_ms is not None and report.import_ms > budget_ms:
+        problems.append(
+            f"import time {report.import_ms:.1f} ms exceeds budget {budget_ms:.1f} ms"
+        )
+    if problems:
+        raise click.ClickException("; ".join(problems))
+
+
+@cli.command()
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Save the results as JSON to this file.",
+)
+@click.option(
+    "--compare",
+    "baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Results JSON of an earlier run to compare against.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help="Fail when a median is this fraction slower than the baseline.",
+)
+@click.option("--repeat", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option("--batch-size", type=click.IntRange(min=1), default=20, show_default=True)
+def bench(
+    output: Path | None,
+    baseline: Path | None,
+    threshold: float,
+    repeat: int,
+    batch_size: int,
+) -> None:
+    """Benchmark template compilation, rendering and project generation."""
+    from src.core.bench import (
+        BenchReport,
+        compare,
+        environment_info,
+        format_comparisons,
+        iter_benchmarks,
+    )
+
+    previous = None
+    if baseline is not None:
+        # Before the run, so a bad baseline does not waste it.
+        try:
+            previous = BenchReport.from_bytes(baseline.read_bytes())
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="--compare") from exc
+    report = BenchReport(environment=environment_info())
+    for result in iter_benchmarks(repeat=repeat, batch_size=batch_size):
+        report.results[result.name] = result
+        click.echo(
+            f"{result.median * 1000:9.3f} ms  (min {result.best * 1000:9.3f} ms)"
+            f"  {result.name}"
+        )
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_bytes(report.to_bytes())
+        click.echo(f"saved {output}")
+    if previous is None:
+        return
+
+    comparisons = compare(previous, report, threshold)
+    click.echo(format_comparisons(comparisons))
+    if regressed := [item.name for item in comparisons if item.regressed]:
+        raise click.ClickException(
+            f"{len(regressed)} benchmark(s) regressed by more than "
+            f"{threshold:.0%}: {', '.join(regressed)}"
+        )
+
+
+@cli.group()
+def generate() -> None:
+    """Add code to an existing project."""
+
+
+# What is left to do by hand once a resource is generated, per ORM.
+RESOURCE_STEPS = {
+    "sqlalchemy": "create the {table} table, e.g. with an alembic migration",
+    "beanie": "await database.init_models([{name}]) in the lifespan",
+    "tortoise": "add app.models.{module} to the models of your Tortoise config",
+}
+
+
+@generate.command()
+@click.argument(
+    "definition", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.argument(
+    "destination",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=".",
+)
+@click.option(
+    "--orm",
+    type=click.Choice(["sqlalchemy", "beanie", "tortoise"]),
+    default=None,
+    help=(
+        "ORM to generate for (default: the definition's, else the project's). "
+        "tortoise also writes the test fixtures to tests/conftest.py, unless "
+        "the project already has one."
+    ),
+)
+@click.option("--force", is_flag=True, help="Replace files the resource had.")
+@_instrumented
+def resource(definition: Path, destination: Path, orm: str | None, force: bool) -> None:
+    """Generate a model, schemas, repository and router from a YAML DEFINITION."""
+    from src.core.resource import generate_resource, load_resource
+
+    try:
+        spec = load_resource(definition)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="DEFINITION") from exc
+    try:
+        result = generate_resource(spec, destination, orm=orm, force=force)
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    except FileExistsError as exc:
+        raise click.ClickException(str(exc)) from exc
+    for path in result.written:
+        click.echo(f"created {path}")
+    for kept in result.kept:
+        click.echo(f"kept    {kept}")
+    click.echo("next, in app/main.py:")
+    click.echo(
+        f"  from app.routers.{spec.module} import router as {spec.module}_router"
+    )
+    click.echo(f"  app.include_router({spec.module}_router)")
+    click.echo(
+        "  "
+        + RESOURCE_STEPS[result.orm].format(
+            name=spec.name, module=spec.module, table=spec.table
+        )
+    )
@@ -0,0 +1,10 @@
+from src.core.engine import (
+    TEMPLATE_GROUPS,
+    TEMPLATES_DIR,
+    ContentHashBytecodeCache,
+    TemplateEngine,
+    get_engine,
+    precompile_templates,
+)
+from src.core.project import RenderedProject, generate, iter_project, stream
+from src.core.sinks import DirectorySink, Sink, TarSink, ZipSink
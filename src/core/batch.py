@@ -0,0 +1,131 @@
+import json
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.core.engine import TemplateEngine, get_engine
+from src.core.scaffold import build_context, scaffold
+from src.core.timing import span
+
+
+@dataclass(frozen=True)
+class BatchEntry:
+    """Outcome of generating one project of a batch."""
+
+    name: str
+    destination: Path | None
+    seconds: float
+    files: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def iter_specs(path: Path) -> Iterator[Any]:
+    """Stream project specs from a JSONL or YAML manifest.
+
+    JSONL is read line by line; a malformed line is yielded as its
+    exception so that only that project fails. YAML manifests may hold one
+    document per project (``---`` separated), which is streamed too, or a
+    single list of projects, which has to be loaded as a whole. A YAML
+    syntax error is yielded the same way, but ends the stream: the parser
+    cannot resume after it.
+    """
+    with path.open() as handle:
+        if path.suffix in {".jsonl", ".ndjson"}:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    yield exc
+            return
+
+        import yaml
+
+        try:
+            for document in yaml.safe_load_all(handle):
+                if isinstance(document, list):
+                    yield from document
+                elif document is not None:
+                    yield document
+        except yaml.YAMLError as exc:
+            yield exc
+
+
+def _destination(output_dir: Path, path: str) -> Path:
+    root = output_dir.resolve()
+    destination = (root / path).resolve()
+    if destination == root or not destination.is_relative_to(root):
+        raise ValueError(f"project path {path!r} is not inside {output_dir}")
+    return destination
+
+
+def _generate(
+    spec: Any,
+    index: int,
+    output_dir: Path,
+    engine: TemplateEngine,
+    workers: int | None,
+) -> BatchEntry:
+    started = time.perf_counter()
+    name = spec.get("name") if isinstance(spec, Mapping) else None
+    label = str(name) if name else f"#{index}"
+    destination: Path | None = None
+    try:
+        if isinstance(spec, Exception):
+            raise spec
+        if not isinstance(spec, Mapping):
+            raise ValueError(
+                f"project spec must be a mapping, got {type(spec).__name__}"
+            )
+        if not name:
+            raise ValueError("project spec has no 'name'")
+        options = {key: value for key, value in spec.items() if key != "path"}
+        destination = _destination(output_dir, str(spec.get("path", name)))
+        written = scaffold(
+            build_context({"project_name": name, **options}),
+            destination,
+            engine=engine,
+            workers=workers,
+        )
+    except Exception as exc:
+        return BatchEntry(
+            name=label,
+            destination=destination,
+            seconds=time.perf_counter() - started,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return BatchEntry(
+        name=label,
+        destination=destination,
+        seconds=time.perf_counter() - started,
+        files=len(written),
+    )
+
+
+def run_batch(
+    specs: Iterable[Any],
+    output_dir: Path,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+) -> Iterator[BatchEntry]:
+    """Generate every project in ``specs`` below ``output_dir``.
+
+    Specs are consumed lazily and results yielded as each project finishes,
+    so memory stays flat however long the manifest is. All projects share
+    one engine and therefore compile each template only once. A failing
+    project is reported and the batch carries on.
+    """
+    engine = engine or get_engine()
+    with span("warm engine", "load"):
+        engine.warm()
+    for index, spec in enumerate(specs, start=1):
+        with span(f"project #{index}", "batch"):
+            entry = _generate(spec, index, output_dir, engine, workers)
+        yield entry
@@ -0,0 +1,277 @@
+import json
+import platform
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from src.core.batch import run_batch
+from src.core.engine import TEMPLATES_DIR, TemplateEngine
+from src.core.resource import parse_resource, resource_context
+from src.core.scaffold import build_context, scaffold
+
+BENCH_VERSION = 1
+BENCH_DATABASE_TYPES: tuple[str | None, ...] = (
+    None,
+    "postgresql",
+    "mysql",
+    "sqlite",
+    "mongodb",
+)
+# Every optional section switched on, so per-template timings cover the
+# largest output each template can produce.
+FULL_CONTEXT: dict[str, Any] = {
+    "database_type": "postgresql",
+    "use_redis": True,
+    "use_nginx": True,
+    "use_gunicorn": True,
+    "build_mode": "multistage",
+    "optimize_startup": True,
+    "db_profile": "balanced",
+}
+# A resource definition for the resource templates, with every field option.
+BENCH_RESOURCE: dict[str, Any] = {
+    "name": "Product",
+    "fields": {
+        "name": {"type": "str", "filterable": True, "sortable": True},
+        "sku": {"type": "str", "unique": True, "filterable": True},
+        "price": {"type": "decimal", "sortable": True},
+        "in_stock": {"type": "bool", "default": True, "filterable": True},
+        "created_at": {"type": "datetime", "default": "now", "sortable": True},
+        "attributes": {"type": "json", "required": False},
+    },
+}
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Wall-clock samples of one benchmark, in seconds."""
+
+    name: str
+    samples: tuple[float, ...]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def best(self) -> float:
+        return min(self.samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "samples": list(self.samples),
+            "median": self.median,
+            "min": self.best,
+        }
+
+
+@dataclass
+class BenchReport:
+    """A benchmark run, as saved to and loaded from JSON."""
+
+    results: dict[str, BenchResult] = field(default_factory=dict)
+    environment: dict[str, str] = field(default_factory=dict)
+    version: int = BENCH_VERSION
+
+    def to_bytes(self) -> bytes:
+        data = {
+            "version": self.version,
+            "environment": self.environment,
+            "results": {
+                name: result.to_dict() for name, result in sorted(self.results.items())
+            },
+        }
+        return (json.dumps(data, indent=2, sort_keys=True) + "\n").encode()
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "BenchReport":
+        """Load a saved report.
+
+        Raises:
+            ValueError: If ``raw`` is not a benchmark report of this version.
+        """
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("benchmark results must be a JSON object")
+        if data.get("version") != BENCH_VERSION:
+            raise ValueError(
+                f"unsupported benchmark version {data.get('version')!r}, "
+                f"expected {BENCH_VERSION}"
+            )
+        results = data.get("results", {})
+        environment = data.get("environment", {})
+        if not isinstance(results, dict) or not isinstance(environment, dict):
+            raise ValueError("benchmark results and environment must be objects")
+        return cls(
+            results={
+                name: BenchResult(name, _samples(name, result))
+                for name, result in results.items()
+            },
+            environment=environment,
+        )
+
+
+def _samples(name: str, result: Any) -> tuple[float, ...]:
+    samples = result.get("samples") if isinstance(result, dict) else None
+    if (
+        not isinstance(samples, list)
+        or not samples
+        or not all(
+            isinstance(sample, int | float) and not isinstance(sample, bool)
+            for sample in samples
+        )
+    ):
+        raise ValueError(f"benchmark {name!r} needs a non-empty list of samples")
+    return tuple(float(sample) for sample in samples)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Median of one benchmark against a baseline."""
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1 + self.threshold
+
+
+def environment_info() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def measure(name: str, func: Callable[[], object], repeat: int) -> BenchResult:
+    """Time ``repeat`` calls of ``func`` after one untimed warm-up call."""
+    func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return BenchResult(name, tuple(samples))
+
+
+def _cold_engine(templates_dir: Path) -> TemplateEngine:
+    return TemplateEngine(templates_dir, precompiled_dir=None, use_bytecode_cache=False)
+
+
+def iter_benchmarks(
+    repeat: int = 5,
+    batch_size: int = 20,
+    templates_dir: Path = TEMPLATES_DIR,
+) -> Iterator[BenchResult]:
+    """Run the benchmark suite, yielding each result as it completes.
+
+    Covers cold environment creation and compilation, rendering each
+    template with a warm engine, generating a full project per database
+    type, and a batch of ``batch_size`` projects. Projects are written to
+    a temporary directory, so the timings include the filesystem.
+    """
+    yield measure("environment", lambda: _cold_engine(templates_dir), repeat)
+
+    def compile_all() -> None:
+        engine = _cold_engine(templates_dir)
+        for name in engine.list_templates():
+            engine.get_template(name)
+
+    yield measure("compile", compile_all, repeat)
+
+    engine = _cold_engine(templates_dir)
+    engine.warm()
+    context = build_context(FULL_CONTEXT)
+    resource = resource_context(parse_resource(BENCH_RESOURCE), "sqlalchemy", context)
+    for name in engine.list_templates():
+        yield measure(
+            f"render/{name}",
+            partial(
+                engine.render,
+                name,
+                resource if name.startswith("resource/") else context,
+            ),
+            repeat,
+        )
+
+    with tempfile.TemporaryDirectory(prefix="scoffy-bench-") as tmp:
+        output = Path(tmp)
+        for database_type in BENCH_DATABASE_TYPES:
+            label = database_type or "none"
+            project = build_context({"database_type": database_type})
+            yield measure(
+                f"scaffold/{label}",
+                partial(scaffold, project, output / label, engine=engine),
+                repeat,
+            )
+
+        specs = [
+            {"name": f"project-{index}", "database_type": "postgresql"}
+            for index in range(batch_size)
+        ]
+
+        def generate_batch() -> None:
+            for entry in run_batch(specs, output / "batch", engine=engine):
+                if not entry.ok:
+                    raise RuntimeError(f"{entry.name}: {entry.error}")
+
+        yield measure(f"batch/{batch_size}", generate_batch, repeat)
+
+
+def run_benchmarks(
+    repeat: int = 5,
+    batch_size: int = 20,
+    templates_dir: Path = TEMPLATES_DIR,
+) -> BenchReport:
+    return BenchReport(
+        results={
+            result.name: result
+            for result in iter_benchmarks(repeat, batch_size, templates_dir)
+        },
+        environment=environment_info(),
+    )
+
+
+def compare(
+    baseline: BenchReport, current: BenchReport, threshold: float = 0.1
+) -> list[Comparison]:
+    """Compare medians of the benchmarks present in both reports.
+
+    A benchmark regressed when its median is more than ``threshold``
+    (a fraction, 0.1 = 10%) slower than the baseline's.
+    """
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline.results[name].median,
+            current=result.median,
+            threshold=threshold,
+        )
+        for name, result in sorted(current.results.items())
+        if name in baseline.results
+    ]
+
+
+def format_comparisons(comparisons: Sequence[Comparison]) -> str:
+    lines = []
+    for item in comparisons:
+        flag = "REGRESSED" if item.regressed else "ok"
+        lines.append(
+            f"{flag:<9}  {item.baseline * 1000:9.3f} ms -> "
+            f"{item.current * 1000:9.3f} ms  {item.ratio:6.2f}x  {item.name}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,299 @@
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+    meta,
+)
+from jinja2.bccache import Bucket
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+TEMPLATE_GROUPS = ("docker", "git", "vscode", "code_quality", "app", "resource")
+TEMPLATE_SUFFIX = ".j2"
+PRECOMPILED_DIR = TEMPLATES_DIR / "_compiled"
+META_PATTERN = "scoffy-meta-%s.json"
+
+# The context keys a template reads, and the templates it names directly.
+TemplateMeta = tuple[frozenset[str], tuple[str, ...]]
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used for the persistent bytecode cache."""
+    if override := os.environ.get("SCOFFY_CACHE_DIR"):
+        return Path(override)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "scoffy" / "jinja"
+
+
+def default_precompiled_dir() -> Path | None:
+    """Return the precompiled templates to load, if enabled.
+
+    Precompiled modules are not checked against the template sources, so a
+    template edited after precompiling would be shadowed by its stale module.
+    They are therefore only used when ``SCOFFY_PRECOMPILED=1`` is set, i.e.
+    by installs whose templates cannot change.
+    """
+    if os.environ.get("SCOFFY_PRECOMPILED") == "1":
+        return PRECOMPILED_DIR
+    return None
+
+
+class ContentHashBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache whose buckets are keyed by the template source hash.
+
+    Jinja2's default cache keys buckets by template name and only uses the
+    source checksum to invalidate them, so every edit overwrites the same
+    file. Keying by content lets several scoffy versions (or branches) share
+    one cache directory without evicting each other.
+    """
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha256(f"{name}\0{checksum}".encode()).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+
+class TemplateEngine:
+    """Single Jinja2 environment over every scoffy template group.
+
+    Templates are addressed by their path relative to ``src/templates``,
+    e.g. ``"docker/Dockerfile.j2"``. Compiled templates are kept in memory
+    for the lifetime of the engine, persisted to an on-disk bytecode cache
+    between runs and, when ``precompiled_dir`` is given, loaded from modules
+    precompiled at build time with :func:`precompile_templates`.
+    """
+
+    def __init__(
+        self,
+        templates_dir: Path = TEMPLATES_DIR,
+        cache_dir: Path | None = None,
+        precompiled_dir: Path | None = None,
+        use_bytecode_cache: bool = True,
+    ) -> None:
+        self.templates_dir = templates_dir
+        self.precompiled_dir = (
+            precompiled_dir
+            if precompiled_dir is not None and precompiled_dir.is_dir()
+            else None
+        )
+        self.bytecode_cache = (
+            _open_bytecode_cache(cache_dir or default_cache_dir())
+            if use_bytecode_cache
+            else None
+        )
+        self.environment = Environment(
+            loader=self._build_loader(),
+            bytecode_cache=self.bytecode_cache,
+            auto_reload=False,
+            cache_size=-1,
+        )
+        self._sources: dict[str, str] = {}
+        self._meta: dict[str, TemplateMeta] = {}
+        self._references: dict[str, tuple[str, ...]] = {}
+
+    def _build_loader(self) -> BaseLoader:
+        source_loader = FileSystemLoader(self.templates_dir)
+        if self.precompiled_dir is None:
+            return source_loader
+        return ChoiceLoader([ModuleLoader(self.precompiled_dir), source_loader])
+
+    def get_template(self, name: str) -> Template:
+        """Return the compiled template ``name`` (e.g. ``"git/.gitignore.j2"``)."""
+        return self.environment.get_template(name)
+
+    def render(self, name: str, context: Mapping[str, Any] | None = None) -> str:
+        """Render template ``name`` with ``context``."""
+        return self.get_template(name).render(**(context or {}))
+
+    def get_source(self, name: str) -> str:
+        """Return the source text of template ``name``."""
+        if name not in self._sources:
+            source, _, _ = FileSystemLoader(self.templates_dir).get_source(
+                self.environment, name
+            )
+            self._sources[name] = source
+        return self._sources[name]
+
+    def _template_meta(self, name: str) -> TemplateMeta:
+        """Return the variables and direct references of template ``name``.
+
+        Both come from a single parse. Like the bytecode, they are persisted
+        in the cache directory keyed by the template's content, so a warm
+        cache answers manifest lookups without parsing anything.
+        """
+        if name not in self._meta:
+            source = self.get_source(name)
+            key = hashlib.sha256(
+                f"{jinja2.__version__}\0{name}\0{source}".encode()
+            ).hexdigest()
+            found = self._load_meta(key)
+            if found is None:
+                ast = self.environment.parse(source)
+                found = (
+                    frozenset(meta.find_undeclared_variables(ast)),
+                    tuple(
+                        sorted(
+                            reference
+                            for reference in meta.find_referenced_templates(ast)
+                            if reference is not None
+                        )
+                    ),
+                )
+                self._store_meta(key, found)
+            self._meta[name] = found
+        return self._meta[name]
+
+    def _meta_path(self, key: str) -> Path | None:
+        if self.bytecode_cache is None:
+            return None
+        return Path(self.bytecode_cache.directory) / (META_PATTERN % key)
+
+    def _load_meta(self, key: str) -> TemplateMeta | None:
+        path = self._meta_path(key)
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_bytes())
+            return frozenset(data["variables"]), tuple(data["references"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_meta(self, key: str, found: TemplateMeta) -> None:
+        path = self._meta_path(key)
+        if path is None:
+            return
+        variables, references = found
+        data = {"variables": sorted(variables), "references": list(references)}
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            temp.write_text(json.dumps(data))
+            os.replace(temp, path)
+        except OSError:
+            # Same as an unwritable bytecode cache: keep the in-memory result.
+            pass
+
+    def referenced_templates(self, name: str) -> tuple[str, ...]:
+        """Return the templates ``name`` imports, includes or extends, recursively.
+
+        Only references with a constant name can be found; the result is
+        sorted and does not contain ``name`` itself.
+        """
+        if name not in self._references:
+            found: set[str] = set()
+            pending = [name]
+            while pending:
+                _, references = self._template_meta(pending.pop())
+                for reference in references:
+                    if reference not in found:
+                        found.add(reference)
+                        pending.append(reference)
+            found.discard(name)
+            self._references[name] = tuple(sorted(found))
+        return self._references[name]
+
+    def template_hash(self, name: str) -> str:
+        """Return a SHA-256 digest of the source of template ``name``.
+
+        The sources of the templates it references are part of the digest,
+        so editing a shared macro file changes the hash of its users.
+        """
+        digest = hashlib.sha256(self.get_source(name).encode())
+        for reference in self.referenced_templates(name):
+            digest.update(f"\0{reference}\0{self.get_source(reference)}".encode())
+        return digest.hexdigest()
+
+    def referenced_variables(self, name: str) -> frozenset[str]:
+        """Return the context keys template ``name`` reads.
+
+        Derived from the template AST, so only variables the template could
+        ever look up are reported; loop variables and ``set`` targets are not.
+        Variables read by the templates it references are included, since
+        included templates see the same context.
+        """
+        variables, _ = self._template_meta(name)
+        for reference in self.referenced_templates(name):
+            variables |= self._template_meta(reference)[0]
+        return variables
+
+    def list_templates(self, group: str | None = None) -> list[str]:
+        """Return the names of all ``.j2`` templates, optionally for one group."""
+        names = FileSystemLoader(self.templates_dir).list_templates()
+        prefix = f"{group}/" if group else ""
+        return [
+            name
+            for name in names
+            if name.endswith(TEMPLATE_SUFFIX) and name.startswith(prefix)
+        ]
+
+    def warm(self) -> None:
+        """Compile every template up front so later renders only execute code."""
+        for name in self.list_templates():
+            self.get_template(name)
+
+
+def _open_bytecode_cache(directory: Path) -> ContentHashBytecodeCache | None:
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # Read-only home directories (CI sandboxes, distroless images) still
+        # get the in-memory template cache, just not the persistent one.
+        return None
+    return ContentHashBytecodeCache(str(directory), pattern="scoffy-%s.cache")
+
+
+def precompile_templates(
+    target: Path = PRECOMPILED_DIR,
+    templates_dir: Path = TEMPLATES_DIR,
+) -> list[str]:
+    """Compile every template into an importable Python module under ``target``.
+
+    Intended to run at package build time; a :class:`TemplateEngine` pointed
+    at ``target`` then skips lexing, parsing and code generation entirely.
+    The modules are not invalidated when a template changes, so the default
+    engine only loads them with ``SCOFFY_PRECOMPILED=1``.
+
+    Returns:
+        The names of the templates that were compiled.
+    """
+    engine = TemplateEngine(
+        templates_dir=templates_dir,
+        precompiled_dir=None,
+        use_bytecode_cache=False,
+    )
+    names = engine.list_templates()
+    target.mkdir(parents=True, exist_ok=True)
+    engine.environment.compile_templates(
+        str(target),
+        filter_func=lambda name: name.endswith(TEMPLATE_SUFFIX),
+        zip=None,
+        ignore_errors=False,
+        log_function=None,
+    )
+    return names
+
+
+@cache
+def get_engine() -> TemplateEngine:
+    """Return the process-wide template engine."""
+    return TemplateEngine(precompiled_dir=default_precompiled_dir())
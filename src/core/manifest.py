@@ -0,0 +1,103 @@
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.engine import TemplateEngine
+
+MANIFEST_PATH = ".scoffy/manifest.json"
+MANIFEST_VERSION = 1
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _canonical_json(value: Any) -> bytes:
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+
+
+def context_hash(
+    engine: TemplateEngine, template: str, context: Mapping[str, Any]
+) -> str:
+    """Hash only the part of ``context`` that ``template`` can observe.
+
+    Keys read by the templates it includes or imports count as observed;
+    keys the template never references are left out, and absent keys are
+    omitted rather than hashed as ``None`` because Jinja2 treats them
+    differently (``default`` filters fire only on undefined values).
+    """
+    variables = engine.referenced_variables(template)
+    subset = {key: context[key] for key in sorted(variables) if key in context}
+    return sha256(_canonical_json(subset))
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """What produced one generated file, and what it looked like."""
+
+    template: str
+    template_hash: str
+    context_hash: str
+    output_hash: str
+
+
+@dataclass
+class Manifest:
+    """Record of a generated project, stored inside the project itself."""
+
+    context: dict[str, Any] = field(default_factory=dict)
+    files: dict[str, ManifestEntry] = field(default_factory=dict)
+    version: int = MANIFEST_VERSION
+
+    def to_bytes(self) -> bytes:
+        data = {
+            "version": self.version,
+            "context": self.context,
+            "files": {
+                path: asdict(entry) for path, entry in sorted(self.files.items())
+            },
+        }
+        return (json.dumps(data, indent=2, sort_keys=True, default=str) + "\n").encode()
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "Manifest":
+        data = json.loads(raw)
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"unsupported manifest version {data.get('version')!r}, "
+                f"expected {MANIFEST_VERSION}"
+            )
+        return cls(
+            context=data.get("context", {}),
+            files={
+                path: ManifestEntry(**entry)
+                for path, entry in data.get("files", {}).items()
+            },
+        )
+
+    @classmethod
+    def load(cls, project_dir: Path) -> "Manifest | None":
+        """Return the manifest of ``project_dir``, or ``None`` if it has none."""
+        path = project_dir / MANIFEST_PATH
+        if not path.is_file():
+            return None
+        return cls.from_bytes(path.read_bytes())
+
+
+def manifest_entry(
+    engine: TemplateEngine,
+    template: str,
+    context: Mapping[str, Any],
+    content: bytes,
+) -> ManifestEntry:
+    return ManifestEntry(
+        template=template,
+        template_hash=engine.template_hash(template),
+        context_hash=context_hash(engine, template, context),
+        output_hash=sha256(content),
+    )
@@ -0,0 +1,275 @@
+import configparser
+import functools
+import itertools
+import json
+import os
+import tomllib
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.engine import TEMPLATES_DIR, TemplateEngine, default_cache_dir
+from src.core.scaffold import (
+    DATABASE_TYPES,
+    PROJECT_TEMPLATES,
+    build_context,
+    render_project,
+)
+
+# Values each option is rendered with; ``None`` leaves the option unset so
+# that the templates' ``default`` filters are exercised too.
+OPTION_SPACE: dict[str, tuple[Any, ...]] = {
+    "database_type": (None, *DATABASE_TYPES),
+    "use_redis": (False, True),
+    "use_nginx": (False, True),
+    "use_gunicorn": (False, True),
+    "use_mypy": (False, True),
+    "use_celery": (False, True),
+    "use_alembic": (False, True),
+    "use_uploads": (False, True),
+    "use_uvloop": (False, True),
+    "use_pydantic": (False, True),
+    "use_docker": (False, True),
+    "use_frontend": (False, True),
+    "parallel": (None, False, True),
+    "enable_coverage": (None, False, True),
+    "strict_typing": (None, True),
+    "build_mode": (None, "multistage"),
+    "optimize_startup": (False, True),
+    "nginx_micro_cache": (False, True),
+    "affected_tests": (False, True),
+    "test_sharding": (False, True),
+    "use_profiling": (False, True),
+    "use_metrics": (False, True),
+    "use_structured_logging": (False, True),
+    "db_profile": (None, "dev-fast", "balanced", "memory:4g"),
+    "redis_password": (None, "secret"),
+    "mongo_driver": (None, "motor"),
+    "environment": (None, "testing"),
+}
+
+Combination = dict[str, Any]
+# Two (option index, value index) positions, in ascending order.
+Pair = tuple[tuple[int, int], tuple[int, int]]
+
+
+def _load_yaml(text: str) -> list[Any]:
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return list(yaml.load_all(text, Loader=loader))
+
+
+def _parse_yaml(text: str) -> None:
+    _load_yaml(text)
+
+
+def _parse_compose(text: str) -> None:
+    """Parse a compose file and reject keys left empty by template logic.
+
+    ``depends_on:`` or ``volumes:`` with every entry switched off is still
+    valid YAML, but Docker Compose refuses the resulting nulls.
+    """
+    (document,) = _load_yaml(text)
+    sections = {
+        "": document,
+        **{
+            f"services.{name}.": service
+            for name, service in (document.get("services") or {}).items()
+        },
+    }
+    for prefix, section in sections.items():
+        for key, value in section.items():
+            if value is None:
+                raise ValueError(f"{prefix}{key} is empty")
+
+
+def _parse_ini(text: str) -> None:
+    configparser.ConfigParser(interpolation=None).read_string(text)
+
+
+def _parse_python(text: str) -> None:
+    compile(text, "<generated>", "exec")
+
+
+# Validators are looked up by file name first, then by suffix.
+VALIDATORS: dict[str, Callable[[str], object]] = {
+    "docker-compose.yml": _parse_compose,
+    ".json": json.loads,
+    ".yml": _parse_yaml,
+    ".yaml": _parse_yaml,
+    ".ini": _parse_ini,
+    ".toml": tomllib.loads,
+    ".py": _parse_python,
+}
+
+
+@dataclass(frozen=True)
+class MatrixFailure:
+    """An output file that did not parse for one combination of options."""
+
+    options: Combination
+    path: str
+    error: str
+
+    def format(self) -> str:
+        options = " ".join(f"{key}={value}" for key, value in self.options.items())
+        return f"{self.path}: {self.error}\n    {options}"
+
+
+@dataclass
+class MatrixReport:
+    combinations: int = 0
+    files: int = 0
+    failures: list[MatrixFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+def full_combinations(
+    space: Mapping[str, Sequence[Any]] = OPTION_SPACE,
+) -> Iterator[Combination]:
+    """Yield every combination of the option values in ``space``."""
+    keys = list(space)
+    for values in itertools.product(*(space[key] for key in keys)):
+        yield dict(zip(keys, values, strict=True))
+
+
+def _pair(first: tuple[int, int], second: tuple[int, int]) -> Pair:
+    return (first, second) if first < second else (second, first)
+
+
+def _new_pairs(uncovered: set[Pair], row: dict[int, int], key: int, value: int) -> int:
+    return sum(
+        _pair((key, value), (other, chosen)) in uncovered
+        for other, chosen in row.items()
+    )
+
+
+def pairwise_combinations(
+    space: Mapping[str, Sequence[Any]] = OPTION_SPACE,
+) -> list[Combination]:
+    """Return combinations covering every pair of values of any two options.
+
+    Built greedily: each row starts from a pair not covered yet and fills
+    the remaining options with the value covering the most uncovered
+    pairs. Far smaller than the full product, yet every interaction
+    between two options is rendered at least once.
+    """
+    keys = list(space)
+    uncovered: set[Pair] = {
+        ((a, i), (b, j))
+        for a, b in itertools.combinations(range(len(keys)), 2)
+        for i in range(len(space[keys[a]]))
+        for j in range(len(space[keys[b]]))
+    }
+    rows: list[dict[int, int]] = []
+    while uncovered:
+        (a, i), (b, j) = min(uncovered)
+        row = {a: i, b: j}
+        for key in range(len(keys)):
+            if key in row:
+                continue
+            row[key] = max(
+                range(len(space[keys[key]])),
+                key=functools.partial(_new_pairs, uncovered, row, key),
+            )
+        uncovered -= {
+            _pair(first, second)
+            for first, second in itertools.combinations(row.items(), 2)
+        }
+        rows.append(row)
+    return [
+        {keys[key]: space[keys[key]][value] for key, value in sorted(row.items())}
+        for row in rows
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _check(name: str, content: bytes) -> str | None:
+    """Return why ``content`` does not parse, or ``None`` if it does.
+
+    Most combinations leave most files unchanged, so results are cached by
+    content and each distinct output is parsed once per process.
+    """
+    validator = VALIDATORS.get(name, VALIDATORS.get(Path(name).suffix))
+    if validator is None:
+        return None
+    try:
+        validator(content.decode())
+    except Exception as exc:
+        message = " ".join(str(exc).split())
+        return f"{type(exc).__name__}: {message}"
+    return None
+
+
+def validate_project(
+    options: Combination, engine: TemplateEngine
+) -> tuple[int, list[MatrixFailure]]:
+    """Render one combination and parse every file with a known format."""
+    context = build_context(
+        {key: value for key, value in options.items() if value is not None}
+    )
+    failures = []
+    files = render_project(context, PROJECT_TEMPLATES, engine=engine, workers=1)
+    for rendered in files:
+        error = _check(Path(rendered.path).name, rendered.content)
+        if error is not None:
+            failures.append(MatrixFailure(options, rendered.path, error))
+    return len(files), failures
+
+
+_worker_engine: TemplateEngine | None = None
+
+
+def _init_worker(templates_dir: Path, cache_dir: Path) -> None:
+    global _worker_engine
+    _worker_engine = TemplateEngine(templates_dir, cache_dir=cache_dir)
+
+
+def _validate_in_worker(options: Combination) -> tuple[int, list[MatrixFailure]]:
+    assert _worker_engine is not None
+    return validate_project(options, _worker_engine)
+
+
+def run_matrix(
+    combinations: Sequence[Combination],
+    workers: int | None = None,
+    templates_dir: Path = TEMPLATES_DIR,
+    cache_dir: Path | None = None,
+) -> MatrixReport:
+    """Render and validate every combination, across ``workers`` processes.
+
+    The templates are compiled once in this process; worker processes load
+    the compiled code from the shared bytecode cache instead of compiling
+    again.
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    engine = TemplateEngine(templates_dir, cache_dir=cache_dir)
+    engine.warm()
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    report = MatrixReport(combinations=len(combinations))
+    if workers <= 1:
+        results = (validate_project(options, engine) for options in combinations)
+        for files, failures in results:
+            report.files += files
+            report.failures.extend(failures)
+        return report
+
+    chunksize = max(1, len(combinations) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(templates_dir, cache_dir),
+    ) as executor:
+        for files, failures in executor.map(
+            _validate_in_worker, combinations, chunksize=chunksize
+        ):
+            report.files += files
+            report.failures.extend(failures)
+    return report
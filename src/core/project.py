@@ -0,0 +1,125 @@
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.engine import TemplateEngine, get_engine
+from src.core.manifest import Manifest, manifest_entry
+from src.core.scaffold import (
+    PROJECT_TEMPLATES,
+    Context,
+    RenderedFile,
+    TemplateSpec,
+    build_context,
+    iter_rendered,
+    manifest_file,
+)
+from src.core.sinks import Sink
+from src.core.timing import span
+
+
+@dataclass(frozen=True)
+class RenderedProject(Mapping[str, bytes]):
+    """A generated project held in memory, as a mapping of path to bytes."""
+
+    context: dict[str, Any]
+    files: tuple[RenderedFile, ...]
+
+    def __getitem__(self, path: str) -> bytes:
+        for rendered in self.files:
+            if rendered.path == path:
+                return rendered.content
+        raise KeyError(path)
+
+    def __iter__(self) -> Iterator[str]:
+        return (rendered.path for rendered in self.files)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def text(self, path: str) -> str:
+        return self[path].decode()
+
+    def write(self, sink: Sink) -> None:
+        sink.write(self.files)
+
+
+def iter_project(
+    spec: Context | None = None,
+    templates: Sequence[TemplateSpec] = PROJECT_TEMPLATES,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+    manifest: bool = True,
+) -> Iterator[RenderedFile]:
+    """Yield the files of a project from ``spec`` as each is rendered.
+
+    Only hashes are kept for the manifest, which comes last, so the
+    rendered files need not be held in memory all at once.
+    """
+    with span("resolve context", "context"):
+        context = build_context(spec)
+    return _iter_files(context, templates, engine, workers, manifest)
+
+
+def _iter_files(
+    context: dict[str, Any],
+    templates: Sequence[TemplateSpec],
+    engine: TemplateEngine | None,
+    workers: int | None,
+    manifest: bool,
+) -> Iterator[RenderedFile]:
+    engine = engine or get_engine()
+    record = Manifest(context=dict(context))
+    for rendered in iter_rendered(context, templates, engine=engine, workers=workers):
+        if manifest:
+            record.files[rendered.path] = manifest_entry(
+                engine, rendered.template, context, rendered.content
+            )
+        yield rendered
+    if manifest:
+        yield manifest_file(record)
+
+
+def generate(
+    spec: Context | None = None,
+    sink: Sink | None = None,
+    templates: Sequence[TemplateSpec] = PROJECT_TEMPLATES,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+    manifest: bool = True,
+) -> RenderedProject:
+    """Render a project from ``spec`` options without touching the disk.
+
+    Args:
+        spec: Template options, merged over the defaults as for ``scoffy new``.
+        sink: Where to also send the files, e.g. a :class:`DirectorySink`,
+            :class:`TarSink` or :class:`ZipSink`.
+        templates: The templates making up the project.
+        engine: Engine to render with; the process-wide one by default.
+        workers: Threads used for rendering.
+        manifest: Whether to include ``.scoffy/manifest.json`` so the output
+            can later be updated with ``scoffy update``.
+    """
+    with span("resolve context", "context"):
+        context = build_context(spec)
+    files = tuple(_iter_files(context, templates, engine, workers, manifest))
+    project = RenderedProject(context=context, files=files)
+    if sink is not None:
+        project.write(sink)
+    return project
+
+
+def stream(
+    sink: Sink,
+    spec: Context | None = None,
+    templates: Sequence[TemplateSpec] = PROJECT_TEMPLATES,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+    manifest: bool = True,
+) -> None:
+    """Send a project from ``spec`` to ``sink`` file by file.
+
+    Unlike :func:`generate`, a file is dropped as soon as the sink has
+    taken it, and a :class:`TarSink` or :class:`ZipSink` on a pipe or
+    socket starts producing output while later templates still render.
+    """
+    sink.write(iter_project(spec, templates, engine, workers, manifest))
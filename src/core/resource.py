@@ -0,0 +1,553 @@
+import keyword
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.engine import TemplateEngine, get_engine
+from src.core.manifest import MANIFEST_PATH, Manifest
+from src.core.scaffold import (
+    DOCUMENT_DATABASE_TYPES,
+    RELATIONAL_DATABASE_TYPES,
+    Context,
+    RenderedFile,
+    write_project,
+)
+from src.core.timing import span
+
+ORMS = ("sqlalchemy", "beanie", "tortoise")
+# Query parameters of the list endpoint, besides the filterable fields.
+RESERVED_NAMES = frozenset({"id", "sort", "order", "limit", "cursor"})
+IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+# Of the generated code, as configured in the project's ruff.toml.
+LINE_LENGTH = 88
+
+
+@dataclass(frozen=True)
+class FieldType:
+    """How one YAML field type maps onto Python and each ORM."""
+
+    python: str
+    sqlalchemy: str
+    tortoise: str
+    imports: tuple[str, ...] = ()
+    # json fields cannot be compared, so they cannot be filtered or sorted.
+    comparable: bool = True
+    # The type in Beanie documents, where it differs from ``python``.
+    document: str | None = None
+
+
+FIELD_TYPES: dict[str, FieldType] = {
+    "str": FieldType("str", "String({max_length})", "CharField"),
+    "text": FieldType("str", "Text", "TextField"),
+    "int": FieldType("int", "Integer", "IntField"),
+    "bigint": FieldType("int", "BigInteger", "BigIntField"),
+    "float": FieldType("float", "Float", "FloatField"),
+    "bool": FieldType("bool", "Boolean", "BooleanField"),
+    "decimal": FieldType(
+        "Decimal",
+        "Numeric({max_digits}, {decimal_places})",
+        "DecimalField",
+        ("decimal.Decimal",),
+        document="DecimalAnnotation",
+    ),
+    "datetime": FieldType(
+        "datetime", "DateTime(timezone=True)", "DatetimeField", ("datetime.datetime",)
+    ),
+    "date": FieldType("date", "Date", "DateField", ("datetime.date",)),
+    "uuid": FieldType("UUID", "Uuid", "UUIDField", ("uuid.UUID",)),
+    "json": FieldType(
+        "dict[str, Any]", "JSON", "JSONField", ("typing.Any",), comparable=False
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ResourceField:
+    """One field of a resource, as declared in its YAML definition."""
+
+    name: str
+    type: str
+    required: bool = True
+    unique: bool = False
+    filterable: bool = False
+    sortable: bool = False
+    max_length: int = 255
+    max_digits: int = 12
+    decimal_places: int = 2
+    default: Any = None
+
+    @property
+    def spec(self) -> FieldType:
+        return FIELD_TYPES[self.type]
+
+    @property
+    def indexed(self) -> bool:
+        """Filterable fields get an index of their own.
+
+        Unless a unique index exists already, or the field is sortable: the
+        ``(field, id)`` index of a sortable field serves equality filters too.
+        """
+        return self.filterable and not (self.unique or self.sortable)
+
+
+@dataclass(frozen=True)
+class Resource:
+    """An entity to generate CRUD code for."""
+
+    name: str
+    module: str
+    plural: str
+    table: str
+    fields: tuple[ResourceField, ...]
+    orm: str | None = None
+    max_page_size: int = 200
+    default_page_size: int = 50
+
+    @property
+    def sortable(self) -> list[ResourceField]:
+        return [item for item in self.fields if item.sortable]
+
+    @property
+    def filterable(self) -> list[ResourceField]:
+        return [item for item in self.fields if item.filterable]
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).replace("-", "_").lower()
+
+
+def pascal_case(name: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[_\-\s]+", name))
+
+
+def pluralize(word: str) -> str:
+    if word.endswith("y") and word[-2:-1] not in "aeiou":
+        return word[:-1] + "ies"
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        return word + "es"
+    return word + "s"
+
+
+def _parse_field(name: Any, raw: Any) -> ResourceField:
+    if not isinstance(name, str):
+        # YAML reads bare on/off/yes/no keys as booleans.
+        raise ValueError(f"field name {name!r} must be a string; quote it")
+    if isinstance(raw, str):
+        raw = {"type": raw}
+    if not isinstance(raw, Mapping):
+        raise ValueError(f"field {name!r} must be a type name or a mapping")
+    if not IDENTIFIER.match(name) or keyword.iskeyword(name):
+        raise ValueError(f"field name {name!r} is not a lowercase Python identifier")
+    if name in RESERVED_NAMES:
+        raise ValueError(
+            f"field name {name!r} is reserved; "
+            f"avoid {', '.join(sorted(RESERVED_NAMES))}"
+        )
+    options = dict(raw)
+    type_name = options.pop("type", "str")
+    if type_name not in FIELD_TYPES:
+        raise ValueError(
+            f"field {name!r} has unknown type {type_name!r}; "
+            f"choose from {', '.join(FIELD_TYPES)}"
+        )
+    known = set(ResourceField.__dataclass_fields__) - {"name", "type"}
+    if unknown := sorted(set(options) - known):
+        raise ValueError(f"field {name!r} has unknown option(s) {', '.join(unknown)}")
+    resource_field = ResourceField(name=name, type=type_name, **options)
+    spec = resource_field.spec
+    if not spec.comparable and (resource_field.filterable or resource_field.sortable):
+        raise ValueError(f"{type_name} field {name!r} cannot be filterable or sortable")
+    if resource_field.sortable and not resource_field.required:
+        # A NULL in the sort key would make rows vanish between pages.
+        raise ValueError(f"sortable field {name!r} must be required")
+    if resource_field.default == "now" and type_name not in ("datetime", "date"):
+        raise ValueError(f"default 'now' needs a datetime or date field, not {name!r}")
+    return resource_field
+
+
+def _check_identifier(kind: str, value: Any) -> str:
+    if not isinstance(value, str) or not IDENTIFIER.match(value):
+        raise ValueError(f"resource {kind} {value!r} is not a lowercase identifier")
+    if keyword.iskeyword(value):
+        raise ValueError(f"resource {kind} {value!r} is a Python keyword")
+    return value
+
+
+def _page_size(data: Mapping[str, Any], key: str, default: int) -> int:
+    value = data.get(key, default)
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be an integer, got {value!r}") from None
+    if size < 1:
+        raise ValueError(f"{key} must be at least 1, got {size}")
+    return size
+
+
+def parse_resource(data: Any) -> Resource:
+    """Build a :class:`Resource` from a parsed YAML entity definition."""
+    if not isinstance(data, Mapping):
+        raise ValueError("a resource definition must be a mapping")
+    name = data.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("a resource definition needs a 'name'")
+    raw_fields = data.get("fields")
+    if not isinstance(raw_fields, Mapping) or not raw_fields:
+        raise ValueError("a resource definition needs a mapping of 'fields'")
+    orm = data.get("orm")
+    if orm is not None and orm not in ORMS:
+        raise ValueError(f"unknown orm {orm!r}; choose from {', '.join(ORMS)}")
+
+    module = _check_identifier("module", snake_case(name.strip()))
+    plural = _check_identifier("plural", data.get("plural") or pluralize(module))
+    table = _check_identifier("table", data.get("table") or plural)
+    max_page_size = _page_size(data, "max_page_size", 200)
+    default_page_size = _page_size(data, "default_page_size", 50)
+    if default_page_size > max_page_size:
+        raise ValueError(
+            f"default_page_size {default_page_size} exceeds "
+            f"max_page_size {max_page_size}"
+        )
+    return Resource(
+        name=pascal_case(name.strip()),
+        module=module,
+        plural=plural,
+        table=table,
+        fields=tuple(_parse_field(key, value) for key, value in raw_fields.items()),
+        orm=orm,
+        max_page_size=max_page_size,
+        default_page_size=default_page_size,
+    )
+
+
+def load_resource(path: Path) -> Resource:
+    """Load a resource definition from a YAML (or JSON) file."""
+    import yaml
+
+    try:
+        data = yaml.safe_load(path.read_text())
+    except yaml.YAMLError as exc:
+        raise ValueError(f"{path} is not valid YAML: {exc}") from exc
+    return parse_resource(data)
+
+
+def default_orm(context: Context) -> str:
+    """Pick the ORM matching a project's database options."""
+    database_type = context.get("database_type")
+    if database_type in RELATIONAL_DATABASE_TYPES:
+        return "sqlalchemy"
+    if database_type in DOCUMENT_DATABASE_TYPES and context.get("mongo_driver") != (
+        "motor"
+    ):
+        return "beanie"
+    raise ValueError(
+        f"no ORM matches database_type={database_type!r}; pass --orm "
+        f"({', '.join(ORMS)})"
+    )
+
+
+def _import_order(name: str) -> tuple[int, str]:
+    # isort's order: constants, then classes, then everything else.
+    return (0 if name.isupper() else 1 if name[:1].isupper() else 2, name)
+
+
+def _import_lines(paths: set[str]) -> list[str]:
+    """Turn ``module.name`` paths into sorted ``from module import ...`` lines."""
+    modules: dict[str, set[str]] = {}
+    for path in paths:
+        module, _, name = path.rpartition(".")
+        modules.setdefault(module, set()).add(name)
+    lines = []
+    for module, names in sorted(modules.items()):
+        ordered = sorted(names, key=_import_order)
+        line = f"from {module} import {', '.join(ordered)}"
+        if len(line) > LINE_LENGTH:
+            line = "\n".join(
+                [f"from {module} import (", *(f"    {name}," for name in ordered), ")"]
+            )
+        lines.append(line)
+    return lines
+
+
+def _schema_values(resource_field: ResourceField) -> tuple[str | None, str]:
+    """The right-hand sides of a field in the create and update schemas."""
+    if resource_field.type == "str":
+        constraints = [f"max_length={resource_field.max_length}"]
+    elif resource_field.type == "decimal":
+        constraints = [
+            f"max_digits={resource_field.max_digits}",
+            f"decimal_places={resource_field.decimal_places}",
+        ]
+    else:
+        constraints = []
+
+    if resource_field.default == "now":
+        factory = (
+            "lambda: datetime.now(UTC)"
+            if resource_field.type == "datetime"
+            else "date.today"
+        )
+        default = f"default_factory={factory}"
+    elif resource_field.default is not None:
+        default = (
+            f'Decimal("{resource_field.default}")'
+            if resource_field.type == "decimal"
+            else repr(resource_field.default)
+        )
+    elif not resource_field.required:
+        default = "None"
+    else:
+        default = ""
+
+    def value(default: str) -> str | None:
+        if not constraints:
+            if default.startswith("default_factory="):
+                return f"Field({default})"
+            return default or None
+        return (
+            f"Field({', '.join([default, *constraints] if default else constraints)})"
+        )
+
+    return value(default), value("None") or "None"
+
+
+def _field_context(resource_field: ResourceField) -> dict[str, Any]:
+    spec = resource_field.spec
+    annotation = spec.python
+    if not resource_field.required:
+        annotation = f"{annotation} | None"
+    create_value, update_value = _schema_values(resource_field)
+    tortoise_options = []
+    if resource_field.type == "str":
+        tortoise_options.append(f"max_length={resource_field.max_length}")
+    if resource_field.type == "decimal":
+        tortoise_options += [
+            f"max_digits={resource_field.max_digits}",
+            f"decimal_places={resource_field.decimal_places}",
+        ]
+    if resource_field.unique:
+        tortoise_options.append("unique=True")
+    if resource_field.indexed:
+        tortoise_options.append("db_index=True")
+    if not resource_field.required:
+        tortoise_options.append("null=True")
+    return {
+        "name": resource_field.name,
+        "type": resource_field.type,
+        "python_type": spec.python,
+        "annotation": annotation,
+        "document_annotation": annotation.replace(
+            spec.python, spec.document or spec.python, 1
+        ),
+        "create_value": create_value,
+        "update_value": update_value,
+        "required": resource_field.required,
+        "unique": resource_field.unique,
+        "indexed": resource_field.indexed,
+        "filterable": resource_field.filterable,
+        "sortable": resource_field.sortable,
+        "sqlalchemy_type": spec.sqlalchemy.format(
+            max_length=resource_field.max_length,
+            max_digits=resource_field.max_digits,
+            decimal_places=resource_field.decimal_places,
+        ),
+        "tortoise_field": spec.tortoise,
+        "tortoise_options": tortoise_options,
+    }
+
+
+def resource_context(
+    resource: Resource, orm: str, project: Context | None = None
+) -> dict[str, Any]:
+    """The template context for one resource, generated for ``orm``."""
+    types = {path for item in resource.fields for path in item.spec.imports}
+    if any(
+        item.default == "now" and item.type == "datetime" for item in resource.fields
+    ):
+        types.add("datetime.UTC")
+    types.add("typing.Literal")
+    # Cursors are decoded into the types of the sortable fields.
+    repository_types = {"collections.abc.Sequence", "typing.Any"}
+    repository_types.update(
+        path for item in resource.sortable for path in item.spec.imports
+    )
+    if orm == "sqlalchemy":
+        repository_types.add("typing.Annotated")
+    sqlalchemy_types = {
+        "sqlalchemy." + item.spec.sqlalchemy.partition("(")[0]
+        for item in resource.fields
+    }
+    if resource.sortable:
+        sqlalchemy_types.add("sqlalchemy.Index")
+    return {
+        **(project or {}),
+        "orm": orm,
+        "resource": {
+            "name": resource.name,
+            "module": resource.module,
+            "plural": resource.plural,
+            "table": resource.table,
+            "path": "/" + resource.plural.replace("_", "-"),
+            "fields": [_field_context(item) for item in resource.fields],
+            "sortable": [item.name for item in resource.sortable],
+            "sort_types": {item.name: item.spec.python for item in resource.sortable},
+            "repository_imports": _import_lines(repository_types),
+            "filterable": [_field_context(item) for item in resource.filterable],
+            "type_imports": _import_lines(
+                {path for item in resource.fields for path in item.spec.imports}
+            ),
+            "document_imports": _import_lines(
+                {
+                    path
+                    for item in resource.fields
+                    if item.spec.document is None
+                    for path in item.spec.imports
+                }
+            ),
+            "schema_imports": _import_lines(types),
+            "sqlalchemy_imports": _import_lines(sqlalchemy_types),
+            "max_page_size": resource.max_page_size,
+            "default_page_size": resource.default_page_size,
+        },
+    }
+
+
+@dataclass(frozen=True)
+class ResourceTemplate:
+    """A resource template and its output path, formatted with the module name."""
+
+    template: str
+    output: str
+    orms: tuple[str, ...] = ORMS
+    # Shared by every resource: written once, left alone afterwards.
+    shared: bool = False
+
+
+RESOURCE_TEMPLATES: tuple[ResourceTemplate, ...] = (
+    ResourceTemplate("resource/pagination.py.j2", "app/pagination.py", shared=True),
+    ResourceTemplate(
+        "resource/sqlalchemy/model.py.j2", "app/models/{module}.py", ("sqlalchemy",)
+    ),
+    ResourceTemplate(
+        "resource/beanie/model.py.j2", "app/models/{module}.py", ("beanie",)
+    ),
+    ResourceTemplate(
+        "resource/tortoise/model.py.j2", "app/models/{module}.py", ("tortoise",)
+    ),
+    ResourceTemplate("resource/schemas.py.j2", "app/schemas/{module}.py"),
+    ResourceTemplate(
+        "resource/sqlalchemy/repository.py.j2",
+        "app/repositories/{module}.py",
+        ("sqlalchemy",),
+    ),
+    ResourceTemplate(
+        "resource/beanie/repository.py.j2", "app/repositories/{module}.py", ("beanie",)
+    ),
+    ResourceTemplate(
+        "resource/tortoise/repository.py.j2",
+        "app/repositories/{module}.py",
+        ("tortoise",),
+    ),
+    ResourceTemplate("resource/router.py.j2", "app/routers/{module}.py"),
+    # Scaffolded projects only get fixtures for SQLAlchemy and MongoDB.
+    ResourceTemplate(
+        "resource/tortoise/conftest.py.j2",
+        "tests/conftest.py",
+        ("tortoise",),
+        shared=True,
+    ),
+)
+PACKAGES = ("app/models", "app/schemas", "app/repositories", "app/routers")
+
+
+@dataclass
+class ResourceResult:
+    """Files written for a resource, and those left as they were."""
+
+    orm: str
+    written: list[Path] = field(default_factory=list)
+    kept: list[str] = field(default_factory=list)
+
+
+def render_resource(
+    resource: Resource,
+    orm: str,
+    project: Context | None = None,
+    engine: TemplateEngine | None = None,
+) -> list[RenderedFile]:
+    """Render the model, schemas, repository and router of ``resource``."""
+    if orm not in ORMS:
+        raise ValueError(f"unknown orm {orm!r}; choose from {', '.join(ORMS)}")
+    engine = engine or get_engine()
+    context = resource_context(resource, orm, project)
+    files = []
+    for spec in RESOURCE_TEMPLATES:
+        if orm not in spec.orms:
+            continue
+        with span(spec.template, "render"):
+            content = engine.render(spec.template, context)
+        files.append(
+            RenderedFile(
+                path=spec.output.format(module=resource.module),
+                content=(content.rstrip("\n") + "\n").encode(),
+                template=spec.template,
+            )
+        )
+    return files
+
+
+def generate_resource(
+    resource: Resource,
+    destination: Path,
+    orm: str | None = None,
+    force: bool = False,
+    engine: TemplateEngine | None = None,
+) -> ResourceResult:
+    """Write a resource's files into the project at ``destination``.
+
+    The ORM is, in order: ``orm``, the definition's ``orm`` key, or the one
+    matching the project's recorded ``database_type``. Existing files of the
+    resource are only replaced with ``force``; shared modules such as
+    ``app/pagination.py`` and package ``__init__.py`` files are never
+    overwritten.
+
+    Raises:
+        ValueError: If no ORM is given and the project has no manifest or
+            no database with a supported ORM.
+        FileExistsError: If a file of the resource exists and ``force`` is
+            not set.
+    """
+    manifest = Manifest.load(destination)
+    context = manifest.context if manifest is not None else {}
+    orm = orm or resource.orm
+    if orm is None:
+        if manifest is None:
+            raise ValueError(
+                f"{destination} has no {MANIFEST_PATH} to pick the ORM from; "
+                f"pass --orm ({', '.join(ORMS)})"
+            )
+        orm = default_orm(context)
+    files = render_resource(resource, orm, context, engine=engine)
+    shared = {spec.output for spec in RESOURCE_TEMPLATES if spec.shared}
+    files += [
+        RenderedFile(path=f"{package}/__init__.py", content=b"", template="")
+        for package in PACKAGES
+    ]
+
+    result = ResourceResult(orm)
+    pending = []
+    for rendered in files:
+        if not (destination / rendered.path).exists():
+            pending.append(rendered)
+        elif rendered.path in shared or not rendered.template:
+            result.kept.append(rendered.path)
+        elif force:
+            pending.append(rendered)
+        else:
+            raise FileExistsError(
+                f"{rendered.path} already exists; pass --force to replace it"
+            )
+    result.written = write_project(pending, destination)
+    return result
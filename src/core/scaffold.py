@@ -0,0 +1,232 @@
+import os
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.core.engine import TemplateEngine, get_engine
+from src.core.manifest import MANIFEST_PATH, Manifest, manifest_entry
+from src.core.timing import span
+from src.helpers.context import validate_context
+from src.helpers.filesystem import write_files_atomically
+
+Context = Mapping[str, Any]
+
+DEFAULT_CONTEXT: dict[str, Any] = {
+    "project_name": "FastAPI Project",
+    "python_version": "3.12",
+    "app_module": "app.main",
+    "expose_port": 8000,
+    "app_port": 8000,
+}
+
+RELATIONAL_DATABASE_TYPES = ("postgresql", "relational", "mysql", "sqlite")
+DOCUMENT_DATABASE_TYPES = ("mongodb", "document")
+DATABASE_TYPES = RELATIONAL_DATABASE_TYPES + DOCUMENT_DATABASE_TYPES
+
+
+@dataclass(frozen=True)
+class TemplateSpec:
+    """A template and the project-relative path it renders to."""
+
+    template: str
+    output: str
+    when: Callable[[Context], bool] | None = None
+
+    def enabled(self, context: Context) -> bool:
+        return self.when is None or bool(self.when(context))
+
+
+@dataclass(frozen=True)
+class OptionEnabled:
+    """Template condition: true when context option ``key`` is truthy."""
+
+    key: str
+
+    def __call__(self, context: Context) -> bool:
+        return bool(context.get(self.key))
+
+
+@dataclass(frozen=True)
+class HasDatabase:
+    """Template condition: true when a supported ``database_type`` is chosen."""
+
+    def __call__(self, context: Context) -> bool:
+        return context.get("database_type") in DATABASE_TYPES
+
+
+@dataclass(frozen=True)
+class RenderedFile:
+    """The rendered bytes for one output path of a project."""
+
+    path: str
+    content: bytes
+    template: str
+
+
+PROJECT_TEMPLATES: tuple[TemplateSpec, ...] = (
+    TemplateSpec("docker/Dockerfile.j2", "Dockerfile"),
+    TemplateSpec("docker/docker-compose.yml.j2", "docker-compose.yml"),
+    TemplateSpec("docker/.dockerignore.j2", ".dockerignore"),
+    TemplateSpec(
+        "docker/bench_startup.py.j2",
+        "scripts/bench_startup.py",
+        when=OptionEnabled("optimize_startup"),
+    ),
+    TemplateSpec(
+        "docker/gunicorn.conf.py.j2",
+        "gunicorn.conf.py",
+        when=OptionEnabled("use_gunicorn"),
+    ),
+    TemplateSpec("docker/nginx.conf.j2", "nginx.conf", when=OptionEnabled("use_nginx")),
+    TemplateSpec("git/.gitignore.j2", ".gitignore"),
+    TemplateSpec("git/.pre-commit-config.yaml.j2", ".pre-commit-config.yaml"),
+    TemplateSpec(
+        "git/affected_tests.py.j2",
+        "scripts/affected_tests.py",
+        when=OptionEnabled("affected_tests"),
+    ),
+    TemplateSpec("vscode/settings.json.j2", ".vscode/settings.json"),
+    TemplateSpec("vscode/extensions.json.j2", ".vscode/extensions.json"),
+    TemplateSpec("vscode/launch.json.j2", ".vscode/launch.json"),
+    TemplateSpec("code_quality/mypy.ini.j2", "mypy.ini"),
+    TemplateSpec("code_quality/pytest.ini.j2", "pytest.ini"),
+    TemplateSpec(
+        "code_quality/pytest_sharding.py.j2",
+        "tests/pytest_sharding.py",
+        when=OptionEnabled("test_sharding"),
+    ),
+    TemplateSpec("code_quality/ruff.toml.j2", "ruff.toml"),
+    TemplateSpec("app/__init__.py.j2", "app/__init__.py"),
+    TemplateSpec("app/config.py.j2", "app/config.py"),
+    TemplateSpec("app/database.py.j2", "app/database.py", when=HasDatabase()),
+    TemplateSpec("app/cache.py.j2", "app/cache.py", when=OptionEnabled("use_redis")),
+    TemplateSpec(
+        "app/profiling.py.j2",
+        "app/profiling.py",
+        when=OptionEnabled("use_profiling"),
+    ),
+    TemplateSpec(
+        "app/metrics.py.j2",
+        "app/metrics.py",
+        when=OptionEnabled("use_metrics"),
+    ),
+    TemplateSpec(
+        "app/logs.py.j2",
+        "app/logs.py",
+        when=OptionEnabled("use_structured_logging"),
+    ),
+    TemplateSpec("app/responses.py.j2", "app/responses.py"),
+    TemplateSpec("app/bench_responses.py.j2", "scripts/bench_responses.py"),
+    TemplateSpec("app/main.py.j2", "app/main.py"),
+    TemplateSpec("app/conftest.py.j2", "tests/conftest.py", when=HasDatabase()),
+)
+
+
+def default_workers() -> int:
+    """Return the default worker count for rendering and writing."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def build_context(overrides: Context | None = None) -> dict[str, Any]:
+    """Merge user supplied options over :data:`DEFAULT_CONTEXT`.
+
+    Raises:
+        ValueError: If an option has a value the templates do not understand.
+    """
+    context = {**DEFAULT_CONTEXT, **(overrides or {})}
+    validate_context(context)
+    return context
+
+
+def iter_rendered(
+    context: Context,
+    templates: Sequence[TemplateSpec] = PROJECT_TEMPLATES,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+) -> Iterator[RenderedFile]:
+    """Render every enabled template of a project, yielding files as they finish.
+
+    Templates are independent of each other, so they are rendered on a
+    thread pool. Files are yielded in the order of ``templates``, each as
+    soon as it and every file before it are rendered, so a consumer can
+    write or stream them while later templates are still rendering.
+    """
+    engine = engine or get_engine()
+    selected = [spec for spec in templates if spec.enabled(context)]
+    workers = default_workers() if workers is None else workers
+
+    def render(spec: TemplateSpec) -> RenderedFile:
+        with span(spec.template, "load"):
+            template = engine.get_template(spec.template)
+        with span(spec.template, "render"):
+            content = template.render(**context).encode()
+        return RenderedFile(path=spec.output, content=content, template=spec.template)
+
+    if workers <= 1 or len(selected) <= 1:
+        yield from map(render, selected)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(render, selected)
+
+
+def render_project(
+    context: Context,
+    templates: Sequence[TemplateSpec] = PROJECT_TEMPLATES,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+) -> list[RenderedFile]:
+    """Render every enabled template of a project, in the order of ``templates``."""
+    with span("render project", "scaffold"):
+        return list(iter_rendered(context, templates, engine=engine, workers=workers))
+
+
+def build_manifest(
+    engine: TemplateEngine, context: Context, files: Sequence[RenderedFile]
+) -> Manifest:
+    """Describe ``files`` so a later ``scoffy update`` can skip unchanged work."""
+    with span("build manifest", "manifest"):
+        return Manifest(
+            context=dict(context),
+            files={
+                rendered.path: manifest_entry(
+                    engine, rendered.template, context, rendered.content
+                )
+                for rendered in files
+            },
+        )
+
+
+def manifest_file(manifest: Manifest) -> RenderedFile:
+    return RenderedFile(path=MANIFEST_PATH, content=manifest.to_bytes(), template="")
+
+
+def write_project(
+    files: Sequence[RenderedFile],
+    destination: Path,
+    workers: int | None = None,
+) -> list[Path]:
+    """Atomically write rendered files below ``destination``."""
+    workers = default_workers() if workers is None else workers
+    with span("write files", "write", files=len(files)):
+        return write_files_atomically(
+            [(destination / rendered.path, rendered.content) for rendered in files],
+            workers=workers,
+        )
+
+
+def scaffold(
+    context: Context,
+    destination: Path,
+    templates: Sequence[TemplateSpec] = PROJECT_TEMPLATES,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+) -> list[Path]:
+    """Render a full project, plus its manifest, and write it to ``destination``."""
+    engine = engine or get_engine()
+    files = render_project(context, templates, engine=engine, workers=workers)
+    manifest = build_manifest(engine, context, files)
+    return write_project(
+        [*files, manifest_file(manifest)], destination, workers=workers
+    )
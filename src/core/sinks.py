@@ -0,0 +1,89 @@
+import io
+import tarfile
+import time
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import BinaryIO, Literal, Protocol
+
+from src.core.scaffold import RenderedFile, write_project
+
+
+class Sink(Protocol):
+    """Destination for the files of a generated project."""
+
+    def write(self, files: Iterable[RenderedFile]) -> None: ...
+
+
+class DirectorySink:
+    """Write files atomically below ``destination``."""
+
+    def __init__(self, destination: Path, workers: int | None = None) -> None:
+        self.destination = destination
+        self.workers = workers
+        self.written: list[Path] = []
+
+    def write(self, files: Iterable[RenderedFile]) -> None:
+        self.written = write_project(list(files), self.destination, self.workers)
+
+
+def _archive_name(prefix: str, path: str) -> str:
+    return f"{prefix.strip('/')}/{path}" if prefix else path
+
+
+class TarSink:
+    """Stream files into a tar archive on ``fileobj``.
+
+    The archive is written in stream mode, so ``fileobj`` only needs a
+    ``write`` method (a pipe, stdout or an HTTP response body all work).
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        compression: Literal["gz", "bz2", "xz", ""] = "gz",
+        prefix: str = "",
+        mtime: float | None = None,
+    ) -> None:
+        self.fileobj = fileobj
+        self.compression = compression
+        self.prefix = prefix
+        self.mtime = time.time() if mtime is None else mtime
+
+    def write(self, files: Iterable[RenderedFile]) -> None:
+        mode = f"w|{self.compression}"
+        with tarfile.open(fileobj=self.fileobj, mode=mode) as archive:  # type: ignore[call-overload]
+            for rendered in files:
+                info = tarfile.TarInfo(_archive_name(self.prefix, rendered.path))
+                info.size = len(rendered.content)
+                info.mtime = int(self.mtime)
+                info.mode = 0o644
+                archive.addfile(info, io.BytesIO(rendered.content))
+
+
+class ZipSink:
+    """Stream files into a deflated zip archive on ``fileobj``.
+
+    ``fileobj`` need not be seekable; entries then carry data descriptors.
+    """
+
+    def __init__(
+        self, fileobj: BinaryIO, prefix: str = "", mtime: float | None = None
+    ) -> None:
+        self.fileobj = fileobj
+        self.prefix = prefix
+        self.mtime = time.time() if mtime is None else mtime
+
+    def write(self, files: Iterable[RenderedFile]) -> None:
+        # Zip timestamps cannot predate 1980.
+        date_time = time.localtime(max(self.mtime, 315619200))[:6]
+        with zipfile.ZipFile(
+            self.fileobj, mode="w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for rendered in files:
+                info = zipfile.ZipInfo(
+                    _archive_name(self.prefix, rendered.path), date_time=date_time
+                )
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                archive.writestr(info, rendered.content)
@@ -0,0 +1,122 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+_DISABLED: AbstractContextManager[None] = nullcontext()
+_tracer: "Tracer | None" = None
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed region, in nanoseconds since the tracer started."""
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Collects spans from every thread while it is active."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            recorded = Span(
+                name=name,
+                category=category,
+                start_ns=start - self._origin_ns,
+                duration_ns=end - start,
+                thread_id=threading.get_ident(),
+                args=args,
+            )
+            with self._lock:
+                self.spans.append(recorded)
+
+    @property
+    def wall_ns(self) -> int:
+        if not self.spans:
+            return 0
+        start = min(span.start_ns for span in self.spans)
+        return max(span.start_ns + span.duration_ns for span in self.spans) - start
+
+    def totals(self) -> list[tuple[str, str, int, int]]:
+        """Return ``(category, name, calls, total_ns)``, in first-seen order."""
+        totals: dict[tuple[str, str], list[int]] = {}
+        for span in sorted(self.spans, key=lambda span: span.start_ns):
+            entry = totals.setdefault((span.category, span.name), [0, 0])
+            entry[0] += 1
+            entry[1] += span.duration_ns
+        return [
+            (category, name, calls, total)
+            for (category, name), (calls, total) in totals.items()
+        ]
+
+    def format_table(self) -> str:
+        lines = [f"{'total ms':>10}  {'calls':>5}  {'category':<10}  name"]
+        for category, name, calls, total in self.totals():
+            lines.append(f"{total / 1e6:10.2f}  {calls:5d}  {category:<10}  {name}")
+        lines.append(f"{self.wall_ns / 1e6:10.2f}  {'':5}  {'wall':<10}")
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> bytes:
+        """Serialise the spans as Chrome trace-event JSON.
+
+        The file opens in chrome://tracing, Perfetto or speedscope; threads
+        of the render and write pools appear as separate tracks.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.args,
+            }
+            for span in sorted(self.spans, key=lambda span: span.start_ns)
+        ]
+        data = {"traceEvents": events, "displayTimeUnit": "ms"}
+        return (json.dumps(data, default=str) + "\n").encode()
+
+
+def span(name: str, category: str, **args: Any) -> AbstractContextManager[None]:
+    """Time the enclosed block if a tracer is active.
+
+    When tracing is off this returns a shared no-op context manager, so
+    instrumented code pays for a global lookup and nothing else.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _DISABLED
+    return tracer.span(name, category, **args)
+
+
+@contextmanager
+def tracing(tracer: Tracer) -> Iterator[Tracer]:
+    """Activate ``tracer`` for the duration of the block, in all threads."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    try:
+        yield tracer
+    finally:
+        _tracer = previous
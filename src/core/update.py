@@ -0,0 +1,124 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.core.engine import TemplateEngine, get_engine
+from src.core.manifest import (
+    MANIFEST_PATH,
+    Manifest,
+    context_hash,
+    manifest_entry,
+    sha256,
+)
+from src.core.scaffold import (
+    PROJECT_TEMPLATES,
+    Context,
+    RenderedFile,
+    TemplateSpec,
+    build_context,
+    manifest_file,
+    render_project,
+    write_project,
+)
+from src.core.timing import span
+
+
+@dataclass
+class UpdateResult:
+    """Which project files an update touched, by output path."""
+
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+def _is_current(
+    engine: TemplateEngine,
+    spec: TemplateSpec,
+    context: Context,
+    previous: Manifest,
+    destination: Path,
+) -> bool:
+    entry = previous.files.get(spec.output)
+    return (
+        entry is not None
+        and entry.template == spec.template
+        and entry.template_hash == engine.template_hash(spec.template)
+        and entry.context_hash == context_hash(engine, spec.template, context)
+        and (destination / spec.output).is_file()
+    )
+
+
+def _matches(target: Path, output_hash: str) -> bool:
+    return target.is_file() and sha256(target.read_bytes()) == output_hash
+
+
+def update_project(
+    destination: Path,
+    overrides: Context | None = None,
+    templates: Sequence[TemplateSpec] = PROJECT_TEMPLATES,
+    engine: TemplateEngine | None = None,
+    workers: int | None = None,
+) -> UpdateResult:
+    """Regenerate a project, touching only files whose inputs changed.
+
+    The options recorded in the project's manifest are merged with
+    ``overrides``. A template is re-rendered only when its source or the
+    context keys it references changed; a re-rendered file is written only
+    when its bytes differ from what is on disk. Files of templates that are
+    no longer enabled are removed if they were not edited by hand.
+
+    Raises:
+        FileNotFoundError: If ``destination`` has no manifest, i.e. it was
+            not generated by scoffy.
+    """
+    engine = engine or get_engine()
+    with span("resolve context", "context"):
+        previous = Manifest.load(destination)
+        if previous is None:
+            raise FileNotFoundError(
+                f"{destination} has no {MANIFEST_PATH}; "
+                "only projects generated by scoffy can be updated"
+            )
+        context = build_context({**previous.context, **(overrides or {})})
+    manifest = Manifest(context=dict(context))
+    result = UpdateResult()
+
+    stale: list[TemplateSpec] = []
+    with span("find stale templates", "manifest"):
+        for spec in templates:
+            if not spec.enabled(context):
+                continue
+            if _is_current(engine, spec, context, previous, destination):
+                manifest.files[spec.output] = previous.files[spec.output]
+                result.skipped.append(spec.output)
+            else:
+                stale.append(spec)
+
+    changed: list[RenderedFile] = []
+    for rendered in render_project(context, stale, engine=engine, workers=workers):
+        entry = manifest_entry(engine, rendered.template, context, rendered.content)
+        manifest.files[rendered.path] = entry
+        old = previous.files.get(rendered.path)
+        target = destination / rendered.path
+        if target.is_file() and (
+            (old is not None and old.output_hash == entry.output_hash)
+            or sha256(target.read_bytes()) == entry.output_hash
+        ):
+            result.unchanged.append(rendered.path)
+        else:
+            changed.append(rendered)
+            result.written.append(rendered.path)
+
+    for path, entry in previous.files.items():
+        if path not in manifest.files and _matches(
+            destination / path, entry.output_hash
+        ):
+            (destination / path).unlink()
+            result.removed.append(path)
+
+    if changed or result.removed or manifest.to_bytes() != previous.to_bytes():
+        changed.append(manifest_file(manifest))
+    write_project(changed, destination, workers=workers)
+    return result
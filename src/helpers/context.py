@@ -0,0 +1,95 @@
+import json
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+# Memory budget in MiB of each named db_profile.
+DB_PROFILES = {"dev-fast": 1024, "balanced": 2048}
+# The sizes docker-compose.yml.j2 understands after ``memory:``.
+_MEMORY_SIZE = re.compile(r"(?:(\d+(?:\.\d+)?)g|(\d+)m?)i?b?")
+
+
+def parse_value(raw: str) -> Any:
+    """Interpret a command line option value as JSON, falling back to a string.
+
+    ``true``/``false``, numbers, lists and objects become their Python
+    equivalents; anything else (``postgresql``, ``3.12-slim``) stays a string.
+    """
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return raw
+
+
+def parse_assignments(assignments: tuple[str, ...] | list[str]) -> dict[str, Any]:
+    """Turn ``key=value`` strings into a context mapping."""
+    context: dict[str, Any] = {}
+    for assignment in assignments:
+        key, separator, raw = assignment.partition("=")
+        if not separator or not key.strip():
+            raise ValueError(f"expected KEY=VALUE, got {assignment!r}")
+        context[key.strip()] = parse_value(raw)
+    return context
+
+
+def load_context_file(path: Path) -> dict[str, Any]:
+    """Load a project context from a JSON or YAML file.
+
+    Raises:
+        ValueError: If the file does not parse or is not a mapping.
+    """
+    text = path.read_text()
+    if path.suffix == ".json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path} is not valid JSON: {exc}") from exc
+    else:
+        import yaml
+
+        try:
+            data = yaml.safe_load(text) or {}
+        except yaml.YAMLError as exc:
+            raise ValueError(f"{path} is not valid YAML: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} must contain a mapping of template options")
+    return data
+
+
+def db_profile_memory_mb(profile: Any) -> int:
+    """Return the memory budget in MiB that ``db_profile`` gives a database.
+
+    Accepts what docker-compose.yml.j2 understands: ``dev-fast``,
+    ``balanced`` or ``memory:<size>``, where the size takes a ``g`` or ``m``
+    suffix (``4g``, ``512mb``, ``1.5GiB``) and a bare number is MiB. No
+    profile gives 0.
+
+    Raises:
+        ValueError: For any other value, which the template would ignore.
+    """
+    text = str(profile or "").strip().lower()
+    if not text:
+        return 0
+    if text in DB_PROFILES:
+        return DB_PROFILES[text]
+    size = text.removeprefix("memory:").strip() if text.startswith("memory:") else ""
+    match = _MEMORY_SIZE.fullmatch(size)
+    if match is not None:
+        gigabytes, megabytes = match.groups()
+        memory_mb = int(float(gigabytes) * 1024) if gigabytes else int(megabytes)
+        if memory_mb > 0:
+            return memory_mb
+    raise ValueError(
+        f"db_profile must be {', '.join(DB_PROFILES)} or memory:<size> "
+        f"such as memory:4g or memory:512m, got {profile!r}"
+    )
+
+
+def validate_context(context: Mapping[str, Any]) -> None:
+    """Reject template options the templates would silently ignore.
+
+    Raises:
+        ValueError: If an option has a value no template understands.
+    """
+    db_profile_memory_mb(context.get("db_profile"))
@@ -0,0 +1,118 @@
+import contextlib
+import os
+import tempfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _read_umask() -> int:
+    # The umask can only be read by setting it, so restore it straight away.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import: changing the umask, even briefly, would affect files
+# created meanwhile by other threads, such as the write pool's.
+_UMASK = _read_umask()
+
+
+def _default_mode() -> int:
+    return 0o666 & ~_UMASK
+
+
+def _write_temp(target: Path, content: bytes, mode: int) -> Path:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+    )
+    try:
+        # mkstemp creates the file 0600; give it the mode of the file it
+        # replaces, or the one a plain open() would have used.
+        with contextlib.suppress(FileNotFoundError):
+            mode = target.stat().st_mode & 0o7777
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return Path(temp_name)
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Some filesystems (and directories on Windows) refuse fsync; the
+        # rename is still atomic, just not guaranteed durable.
+        pass
+    finally:
+        os.close(fd)
+
+
+def _run_all(
+    func: Callable[[T], R], items: Sequence[T], workers: int
+) -> list[R | BaseException]:
+    def call(item: T) -> R | BaseException:
+        try:
+            return func(item)
+        except Exception as exc:
+            return exc
+
+    if workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, items))
+
+
+def write_files_atomically(
+    files: Sequence[tuple[Path, bytes]],
+    workers: int = 1,
+    durable: bool = True,
+) -> list[Path]:
+    """Write a batch of files so each one appears complete or not at all.
+
+    Every file is first written to a temporary sibling, then all temporaries
+    are flushed in a single fsync pass, renamed into place and finally each
+    affected directory is fsynced once. Batching the syncs instead of paying
+    a write/fsync/rename round trip per file is what keeps this fast on
+    network filesystems.
+
+    Args:
+        files: ``(target, content)`` pairs.
+        workers: Number of threads used for the write and fsync passes.
+        durable: Whether to fsync files and directories at all.
+
+    Returns:
+        The target paths, in the order given.
+    """
+    targets = [target for target, _ in files]
+    mode = _default_mode()
+    results = _run_all(lambda item: _write_temp(*item, mode), files, workers)
+    temporaries = [result for result in results if isinstance(result, Path)]
+    renamed = 0
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        if durable:
+            for error in _run_all(_fsync_path, temporaries, workers):
+                if isinstance(error, BaseException):
+                    raise error
+        for temporary, target in zip(temporaries, targets, strict=True):
+            temporary.replace(target)
+            renamed += 1
+        if durable:
+            for directory in dict.fromkeys(target.parent for target in targets):
+                _fsync_path(directory)
+    finally:
+        for temporary in temporaries[renamed:]:
+            temporary.unlink(missing_ok=True)
+    return targets
@@ -0,0 +1,130 @@
+import os
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Modules the CLI must never import just to start up. They are runtime
+# dependencies of the *generated* projects, or of a few subcommands at most.
+FRAMEWORK_MODULES = (
+    "fastapi",
+    "starlette",
+    "pydantic",
+    "pydantic_settings",
+    "sqlalchemy",
+    "beanie",
+    "motor",
+    "pymongo",
+    "tortoise",
+    "uvicorn",
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``python -X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupReport:
+    """Import timings and wall-clock time of one CLI invocation."""
+
+    argv: list[str]
+    wall_ms: float
+    records: list[ImportRecord] = field(default_factory=list)
+
+    @property
+    def import_ms(self) -> float:
+        return sum(record.self_us for record in self.records) / 1000
+
+    @property
+    def modules(self) -> set[str]:
+        return {record.module for record in self.records}
+
+    def slowest(self, count: int = 10) -> list[ImportRecord]:
+        """Return the modules whose own import took longest."""
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:count]
+
+    def forbidden(self, packages: Iterable[str] = FRAMEWORK_MODULES) -> list[str]:
+        """Return imported modules belonging to any of ``packages``."""
+        roots = set(packages)
+        return sorted(
+            module for module in self.modules if module.split(".")[0] in roots
+        )
+
+    def format(self, count: int = 10) -> str:
+        lines = [
+            f"scoffy {' '.join(self.argv)}",
+            f"  wall time    {self.wall_ms:8.1f} ms",
+            f"  import time  {self.import_ms:8.1f} ms ({len(self.records)} modules)",
+            "  slowest modules (self time):",
+        ]
+        lines.extend(
+            f"    {record.self_us / 1000:8.1f} ms  {record.module}"
+            for record in self.slowest(count)
+        )
+        return "\n".join(lines)
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the ``-X importtime`` lines of ``output``, ignoring anything else."""
+    records = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(indent) - 1) // 2,
+            )
+        )
+    return records
+
+
+def strip_importtime(output: str) -> str:
+    """Return ``output`` without its ``-X importtime`` lines."""
+    return "\n".join(
+        line for line in output.splitlines() if not line.startswith("import time:")
+    )
+
+
+def measure_startup(
+    argv: Sequence[str] = ("--help",), cwd: Path | None = None
+) -> StartupReport:
+    """Run ``scoffy <argv>`` in a fresh interpreter and report where startup went.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails.
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "src.commands", *argv]
+    env = {**os.environ}
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    started = time.perf_counter()
+    completed = subprocess.run(
+        command,
+        cwd=cwd or PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    return StartupReport(
+        argv=list(argv), wall_ms=wall_ms, records=parse_importtime(completed.stderr)
+    )
@@ -0,0 +1,18 @@
+import logging
+import os
+
+from src.helpers.importtime import measure_startup
+
+logger = logging.getLogger(__name__)
+
+STARTUP_BUDGET_MS = float(os.environ.get("SCOFFY_STARTUP_BUDGET_MS", "300"))
+
+
+def test_help_stays_within_startup_budget() -> None:
+    """Test that `scoffy --help` imports no frameworks and stays within budget."""
+    report = measure_startup(["--help"])
+    logger.info("\n%s", report.format())
+
+    assert report.forbidden() == []
+    assert "jinja2" not in report.modules
+    assert report.import_ms <= STARTUP_BUDGET_MS, report.format()
@@ -0,0 +1,48 @@
+import importlib
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+from src.core.scaffold import PROJECT_TEMPLATES, build_context
+
+
+@pytest.fixture
+def app_template_dir() -> Path:
+    current_file = Path(__file__)
+    project_root = current_file.parent.parent.parent.parent.parent
+    return project_root / "src" / "templates" / "app"
+
+
+@pytest.fixture
+def env(app_template_dir: Path) -> Environment:
+    return Environment(loader=FileSystemLoader(app_template_dir))
+
+
+@pytest.fixture
+def generated_app(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Callable[..., ModuleType]]:
+    """Render the app package with a context and import one of its modules."""
+    root = Path(__file__).parent.parent.parent.parent.parent / "src" / "templates"
+    environment = Environment(loader=FileSystemLoader(root))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    def load(module: str, **options: Any) -> ModuleType:
+        context = build_context(options)
+        for spec in PROJECT_TEMPLATES:
+            if spec.template.startswith("app/") and spec.enabled(context):
+                target = tmp_path / spec.output
+                target.parent.mkdir(parents=True, exist_ok=True)
+                rendered = environment.get_template(spec.template).render(**context)
+                target.write_text(rendered)
+        return importlib.import_module(module)
+
+    yield load
+    for name in [name for name in sys.modules if name.split(".")[0] == "app"]:
+        del sys.modules[name]
@@ -0,0 +1,226 @@
+import asyncio
+import importlib
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def cache_template(env: Environment) -> Template:
+    return env.get_template("cache.py.j2")
+
+
+@pytest.fixture
+def cache_module(
+    generated_app: Callable[..., ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> ModuleType:
+    pytest.importorskip("fastapi")
+    pytest.importorskip("pydantic_settings")
+    monkeypatch.setenv("REDIS_URL", "memory://")
+    return generated_app("app.cache", use_redis=True)
+
+
+def test_cache_template_exists(app_template_dir: Path) -> None:
+    """Test that the cache.py template exists."""
+    assert (app_template_dir / "cache.py.j2").exists()
+
+
+def test_cache_renders_valid_python(cache_template: Template) -> None:
+    """Test that the cache module is valid Python."""
+    rendered = cache_template.render(use_redis=True)
+
+    compile(rendered, "cache.py", "exec")
+    assert "class ResponseCache:" in rendered
+
+
+def test_config_and_main_wire_the_cache(env: Environment) -> None:
+    """Test that use_redis adds cache settings and connects it in the lifespan."""
+    config = env.get_template("config.py.j2").render(use_redis=True)
+    main = env.get_template("main.py.j2").render(use_redis=True)
+
+    assert "redis_url: str" in config
+    assert "cache_default_ttl: int = 60" in config
+    assert "cache.connect(get_settings())" in main
+    assert "await cache.disconnect()" in main
+    assert "cache" not in env.get_template("main.py.j2").render()
+
+
+def test_cache_reads_through_local_tier(cache_module: ModuleType) -> None:
+    """Test that values set in Redis are served from the local tier afterwards."""
+    fake = cache_module.FakeRedis()
+    cache = cache_module.ResponseCache(fake)
+
+    async def scenario() -> tuple[bytes | None, bytes | None]:
+        await cache.set("key", b"value", ttl=30)
+        fake.data.clear()
+        local = await cache.get("key")
+        cache.local.delete("cache:key")
+        return local, await cache.get("key")
+
+    assert asyncio.run(scenario()) == (b"value", None)
+
+
+def test_cache_collapses_concurrent_misses(cache_module: ModuleType) -> None:
+    """Test that concurrent misses for one key call the producer only once."""
+    cache = cache_module.ResponseCache(cache_module.FakeRedis())
+    calls = 0
+
+    async def produce() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"slow"
+
+    async def scenario() -> list[tuple[bytes, bool]]:
+        results: list[tuple[bytes, bool]] = await asyncio.gather(
+            *(cache.get_or_set("key", produce) for _ in range(10))
+        )
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert calls == 1
+    assert {value for value, _ in results} == {b"slow"}
+    assert [hit for _, hit in results].count(False) == 1
+
+
+def test_cache_waits_for_another_process_holding_the_lock(
+    cache_module: ModuleType,
+) -> None:
+    """Test that a miss waits for the value while another process computes it."""
+    fake = cache_module.FakeRedis()
+    cache = cache_module.ResponseCache(fake, lock_timeout=1.0)
+
+    async def produce() -> bytes:
+        raise AssertionError("the producer must not run while the lock is held")
+
+    async def scenario() -> tuple[bytes, bool]:
+        await fake.set("cache:lock:key", b"1", px=1000, nx=True)
+
+        async def other_process() -> None:
+            await asyncio.sleep(0.1)
+            await fake.set("cache:key", b"theirs", ex=30)
+
+        task = asyncio.create_task(other_process())
+        result: tuple[bytes, bool] = await cache.get_or_set("key", produce)
+        await task
+        return result
+
+    assert asyncio.run(scenario()) == (b"theirs", False)
+
+
+def test_cache_invalidation(cache_module: ModuleType) -> None:
+    """Test that exact and prefix invalidation clear both tiers."""
+    fake = cache_module.FakeRedis()
+    cache = cache_module.ResponseCache(fake)
+
+    keys = ("/items?#a", "/items?page=2#a", "/items/1?#a", "/users?#a")
+
+    async def scenario() -> list[bytes | None]:
+        for key in (*keys, "/items-archive?#a"):
+            await cache.set(key, b"x")
+        await cache.invalidate("/users?#a")
+        await cache.invalidate_prefix("/items")
+        return [await cache.get(key) for key in keys]
+
+    assert asyncio.run(scenario()) == [None, None, None, None]
+    assert list(fake.data) == ["cache:/items-archive?#a"]
+
+
+def test_cache_key_escapes_query_values(cache_module: ModuleType) -> None:
+    """Test that an escaped & or = in a value does not collide with a real one."""
+    from starlette.requests import Request
+
+    def key(query: bytes) -> str:
+        scope = {"type": "http", "path": "/items", "query_string": query}
+        result: str = cache_module.request_cache_key(Request({**scope, "headers": []}))
+        return result
+
+    assert key(b"x=1%26y%3D2") != key(b"x=1&y=2")
+    assert key(b"y=2&x=1") == key(b"x=1&y=2")
+
+
+def test_cached_route_keys_on_query_and_auth(
+    generated_app: Callable[..., ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the decorator caches per query string and per caller."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("pydantic_settings")
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("REDIS_URL", "memory://")
+    main = generated_app("app.main", use_redis=True)
+    cached = importlib.import_module("app.cache").cached
+    calls: list[str | None] = []
+
+    @main.app.get("/items")
+    @cached(ttl=30)
+    async def items(q: str | None = None) -> dict[str, str | None]:
+        calls.append(q)
+        return {"q": q}
+
+    with TestClient(main.app) as client:
+        first = client.get("/items?q=a&x=1")
+        second = client.get("/items?x=1&q=a")
+        other_user = client.get("/items?q=a&x=1", headers={"Authorization": "t"})
+        other_query = client.get("/items?q=b")
+
+    assert first.json() == {"q": "a"}
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert other_user.headers["X-Cache"] == "MISS"
+    assert other_query.json() == {"q": "b"}
+    assert calls == ["a", "a", "b"]
+    assert main.cache.redis is None
+
+
+def test_cached_route_keeps_status_and_headers_and_skips_errors(
+    generated_app: Callable[..., ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that cached responses replay their status and headers, errors aren't."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("pydantic_settings")
+    from fastapi import Response
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setenv("REDIS_URL", "memory://")
+    main = generated_app("app.main", use_redis=True)
+    cached = importlib.import_module("app.cache").cached
+    calls: list[str] = []
+
+    @main.app.get("/report")
+    @cached(ttl=30)
+    async def report() -> Response:
+        calls.append("report")
+        return Response(
+            "a,b\n", status_code=203, media_type="text/csv", headers={"X-Rows": "1"}
+        )
+
+    @main.app.get("/missing")
+    @cached(ttl=30)
+    async def missing() -> Response:
+        calls.append("missing")
+        return JSONResponse({"detail": "gone"}, status_code=404)
+
+    with TestClient(main.app) as client:
+        reports = [client.get("/report") for _ in range(2)]
+        errors = [client.get("/missing") for _ in range(2)]
+
+    assert [response.headers["X-Cache"] for response in reports] == ["MISS", "HIT"]
+    for response in reports:
+        assert response.status_code == 203
+        assert response.text == "a,b\n"
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.headers["X-Rows"] == "1"
+    assert [response.status_code for response in errors] == [404, 404]
+    assert "X-Cache" not in errors[1].headers
+    assert calls == ["report", "missing", "missing"]
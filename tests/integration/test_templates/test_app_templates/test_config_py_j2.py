@@ -0,0 +1,52 @@
+import logging
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def config_template(env: Environment) -> Template:
+    return env.get_template("config.py.j2")
+
+
+def test_config_template_exists(app_template_dir: Path) -> None:
+    """Test that the config.py template exists."""
+    assert (app_template_dir / "config.py.j2").exists()
+
+
+@pytest.mark.parametrize(
+    "database_type", [None, "postgresql", "mysql", "sqlite", "mongodb"]
+)
+def test_config_renders_valid_python(
+    config_template: Template, database_type: str | None
+) -> None:
+    """Test that the settings module is valid Python for every database type."""
+    rendered = config_template.render(database_type=database_type)
+
+    compile(rendered, "config.py", "exec")
+    assert "class Settings(BaseSettings):" in rendered
+
+
+def test_config_exposes_relational_pool_settings(config_template: Template) -> None:
+    """Test that relational backends expose pool and statement cache settings."""
+    rendered = config_template.render(database_type="postgresql", db_pool_size=20)
+
+    assert 'database_url: str = "postgresql+asyncpg://' in rendered
+    assert "db_pool_size: int = 20" in rendered
+    assert "db_max_overflow: int = 10" in rendered
+    assert "db_pool_pre_ping: bool = True" in rendered
+    assert "db_pool_recycle: int = 1800" in rendered
+    assert "db_statement_cache_size: int = 100" in rendered
+    assert "mongodb_url" not in rendered
+
+
+def test_config_exposes_mongo_pool_settings(config_template: Template) -> None:
+    """Test that MongoDB exposes the client pool bounds."""
+    rendered = config_template.render(database_type="document")
+
+    assert "mongo_max_pool_size: int = 100" in rendered
+    assert "mongo_min_pool_size: int = 10" in rendered
+    assert "database_url" not in rendered
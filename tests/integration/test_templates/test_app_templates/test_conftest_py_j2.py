@@ -0,0 +1,150 @@
+import logging
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+MODELS = """
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+"""
+# Run in file order: the second test sees nothing the first one committed.
+ITEM_TESTS = """
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Item
+
+pytestmark = pytest.mark.anyio
+
+
+async def count(session):
+    return await session.scalar(select(func.count()).select_from(Item))
+
+
+async def test_commit_inside_test(session):
+    session.add(Item(name="first"))
+    await session.commit()
+    session.add(Item(name="second"))
+    await session.commit()
+    assert await count(session) == 2
+
+
+async def test_rows_are_rolled_back(session):
+    assert await count(session) == 0
+
+
+async def test_client_shares_session(client, session):
+    session.add(Item(name="visible"))
+    await session.flush()
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert await count(session) == 1
+"""
+
+
+@pytest.fixture
+def conftest_template(env: Environment) -> Template:
+    return env.get_template("conftest.py.j2")
+
+
+def run_pytest(root: Path, **env: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "-v", "tests"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=False,
+        env={**os.environ, **env},
+    )
+
+
+def test_conftest_template_exists(app_template_dir: Path) -> None:
+    """Test that the conftest.py template exists."""
+    assert (app_template_dir / "conftest.py.j2").exists()
+
+
+@pytest.mark.parametrize(
+    ("database_type", "mongo_driver"),
+    [("postgresql", None), ("sqlite", None), ("mongodb", None), ("mongodb", "motor")],
+)
+def test_conftest_renders_valid_python(
+    conftest_template: Template, database_type: str, mongo_driver: str | None
+) -> None:
+    """Test that the conftest is valid Python for every backend."""
+    rendered = conftest_template.render(
+        database_type=database_type, mongo_driver=mongo_driver
+    )
+
+    compile(rendered, "conftest.py", "exec")
+    assert "async def client(" in rendered
+
+
+def test_conftest_relational_rolls_back_savepoints(
+    conftest_template: Template,
+) -> None:
+    """Test that relational tests share one engine and roll back per test."""
+    rendered = conftest_template.render(database_type="postgresql")
+
+    assert '@pytest.fixture(scope="session")\nasync def engine(' in rendered
+    assert "Base.metadata.create_all" in rendered
+    assert 'join_transaction_mode="create_savepoint"' in rendered
+    assert "await transaction.rollback()" in rendered
+    assert '"sqlite+aiosqlite://"' in rendered
+
+
+def test_conftest_mongo_empties_collections(conftest_template: Template) -> None:
+    """Test that MongoDB tests keep one database and indexes per session."""
+    beanie = conftest_template.render(database_type="mongodb")
+    motor = conftest_template.render(database_type="mongodb", mongo_driver="motor")
+
+    assert "await init_beanie(database=database" in beanie
+    assert "delete_many({})" in beanie
+    assert "drop_database(name)" in beanie
+    assert "beanie" not in motor
+    assert "    client.close()" in motor
+
+
+def test_conftest_isolates_sqlite_tests(
+    generated_app: Callable[..., ModuleType], tmp_path: Path
+) -> None:
+    """Test that generated fixtures roll back committed rows between tests."""
+    generated_app("app.database", database_type="sqlite")
+    (tmp_path / "app" / "models.py").write_text(MODELS)
+    (tmp_path / "tests" / "test_items.py").write_text(ITEM_TESTS)
+
+    result = run_pytest(tmp_path)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "3 passed" in result.stdout
+
+
+def test_conftest_skips_without_mongo_server(
+    generated_app: Callable[..., ModuleType], tmp_path: Path
+) -> None:
+    """Test that MongoDB tests are skipped when no server answers."""
+    generated_app("app.database", database_type="mongodb", mongo_driver="motor")
+    (tmp_path / "tests" / "test_documents.py").write_text(
+        "import pytest\n\n\n@pytest.mark.anyio\nasync def test_db(db):\n"
+        "    await db.items.insert_one({})\n"
+    )
+
+    result = run_pytest(tmp_path, TEST_MONGODB_URL="mongodb://127.0.0.1:9/")
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "MongoDB is not reachable" in result.stdout
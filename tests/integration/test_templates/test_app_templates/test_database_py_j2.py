@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def database_template(env: Environment) -> Template:
+    return env.get_template("database.py.j2")
+
+
+def test_database_template_exists(app_template_dir: Path) -> None:
+    """Test that the database.py template exists."""
+    assert (app_template_dir / "database.py.j2").exists()
+
+
+@pytest.mark.parametrize(
+    ("database_type", "mongo_driver"),
+    [("postgresql", None), ("mysql", None), ("mongodb", None), ("mongodb", "motor")],
+)
+def test_database_renders_valid_python(
+    database_template: Template, database_type: str, mongo_driver: str | None
+) -> None:
+    """Test that the database module is valid Python for every backend."""
+    rendered = database_template.render(
+        database_type=database_type, mongo_driver=mongo_driver
+    )
+
+    compile(rendered, "database.py", "exec")
+    assert "database = Database()" in rendered
+
+
+def test_database_relational_uses_one_pooled_engine(
+    database_template: Template,
+) -> None:
+    """Test that relational backends configure the pool on a shared engine."""
+    rendered = database_template.render(database_type="postgresql")
+
+    assert "create_async_engine" in rendered
+    for option in ("pool_size", "max_overflow", "pool_recycle", "pool_pre_ping"):
+        assert f"{option}=settings.db_{option}" in rendered
+    assert "prepared_statement_cache_size" in rendered
+    assert "async def get_session()" in rendered
+
+
+def test_database_mongo_uses_one_pooled_client(database_template: Template) -> None:
+    """Test that MongoDB uses one client with explicit pool bounds."""
+    rendered = database_template.render(database_type="mongodb", mongo_driver="motor")
+
+    assert "AsyncIOMotorClient as MongoClient" in rendered
+    assert "maxPoolSize=settings.mongo_max_pool_size" in rendered
+    assert "minPoolSize=settings.mongo_min_pool_size" in rendered
+
+
+def test_database_async_url_maps_sync_drivers(
+    generated_app: Callable[..., ModuleType],
+) -> None:
+    """Test that compose-style sync URLs are mapped to async drivers."""
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("greenlet")
+    pytest.importorskip("pydantic_settings")
+    database = generated_app("app.database", database_type="postgresql")
+
+    assert database.async_database_url("postgresql://u:p@db/x") == (
+        "postgresql+asyncpg://u:p@db/x"
+    )
+    assert database.async_database_url("mysql+pymysql://u:p@db/x") == (
+        "mysql+aiomysql://u:p@db/x"
+    )
+
+
+def test_database_engine_is_created_once_and_disposed(
+    generated_app: Callable[..., ModuleType], tmp_path: Path
+) -> None:
+    """Test that connect() reuses its engine and sessions share its pool."""
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    pytest.importorskip("pydantic_settings")
+    database = generated_app("app.database", database_type="sqlite")
+    settings = database.Settings(database_url=f"sqlite:///{tmp_path}/test.db")
+
+    async def scenario() -> int:
+        database.database.connect(settings)
+        engine = database.database.engine
+        database.database.connect(settings)
+        assert database.database.engine is engine
+        sessions = database.get_session()
+        session = await anext(sessions)
+        from sqlalchemy import text
+
+        value: int = (await session.execute(text("select 1"))).scalar_one()
+        await sessions.aclose()
+        await database.database.disconnect()
+        return value
+
+    assert asyncio.run(scenario()) == 1
+    assert database.database.engine is None
+
+
+def test_database_mongo_client_carries_pool_bounds(
+    generated_app: Callable[..., ModuleType],
+) -> None:
+    """Test that the shared MongoDB client is created with the pool settings."""
+    pytest.importorskip("pymongo")
+    pytest.importorskip("pydantic_settings")
+    database = generated_app("app.database", database_type="mongodb")
+    settings = database.Settings(mongo_max_pool_size=42, mongo_min_pool_size=3)
+
+    async def scenario() -> tuple[int, int, str]:
+        database.database.connect(settings)
+        client = database.database.client
+        options = (
+            client.options.pool_options.max_pool_size,
+            client.options.pool_options.min_pool_size,
+            database.get_database().name,
+        )
+        await database.database.disconnect()
+        return options
+
+    assert asyncio.run(scenario()) == (42, 3, "fastapi_db")
@@ -0,0 +1,121 @@
+import json
+import logging
+import queue
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def logs_template(env: Environment) -> Template:
+    return env.get_template("logs.py.j2")
+
+
+@pytest.fixture
+def logs_module(generated_app: Callable[..., ModuleType]) -> Iterator[ModuleType]:
+    """Import app.logs and restore the root logger afterwards."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    module = generated_app("app.logs", use_structured_logging=True)
+    yield module
+    module.log_pipeline.stop()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def settings(**overrides: Any) -> Any:
+    return sys.modules["app.config"].Settings(**overrides)
+
+
+def test_logs_template_exists(app_template_dir: Path) -> None:
+    """Test that the logs.py template exists."""
+    assert (app_template_dir / "logs.py.j2").exists()
+
+
+def test_logs_renders_valid_python(logs_template: Template) -> None:
+    """Test that the logging module is valid Python."""
+    rendered = logs_template.render()
+
+    compile(rendered, "logs.py", "exec")
+    assert "class NonBlockingQueueHandler(QueueHandler)" in rendered
+    assert "log_pipeline = LogPipeline()" in rendered
+
+
+def test_logs_are_wired_into_the_lifespan(env: Environment) -> None:
+    """Test that use_structured_logging starts and stops the pipeline."""
+    main = env.get_template("main.py.j2").render(use_structured_logging=True)
+    config = env.get_template("config.py.j2").render(use_structured_logging=True)
+
+    assert main.index("log_pipeline.start(") < main.index("yield")
+    assert main.index("log_pipeline.stop()") > main.index("yield")
+    assert "log_json: bool = True" in config
+    assert "log_queue_size: int = 10000" in config
+    assert "log_pipeline" not in env.get_template("main.py.j2").render()
+
+
+def test_logs_written_as_json_lines(
+    logs_module: ModuleType, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that records, extras and tracebacks come out as JSON lines."""
+    logs_module.log_pipeline.start(settings())
+    log = logging.getLogger("app.orders")
+
+    log.info("order %s placed", 42, extra={"order_id": 42})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        log.exception("failed")
+    logs_module.log_pipeline.stop()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines[0]["message"] == "order 42 placed"
+    assert lines[0]["level"] == "INFO"
+    assert lines[0]["logger"] == "app.orders"
+    assert lines[0]["order_id"] == 42
+    assert "ValueError: boom" in lines[1]["exception"]
+
+
+def test_logs_route_uvicorn_through_the_queue(logs_module: ModuleType) -> None:
+    """Test that uvicorn's loggers propagate to the queue handler."""
+    logging.getLogger("uvicorn.access").addHandler(logging.NullHandler())
+
+    logs_module.log_pipeline.start(settings())
+
+    access = logging.getLogger("uvicorn.access")
+    assert access.handlers == []
+    assert access.propagate
+    assert logging.getLogger().handlers == [logs_module.log_pipeline.handler]
+
+
+def test_logs_sample_debug_records(logs_module: ModuleType) -> None:
+    """Test that DEBUG records are sampled while INFO ones are all kept."""
+    sampler = logs_module.DebugSampler(0.0)
+
+    def record(level: int) -> logging.LogRecord:
+        return logging.LogRecord("app", level, __file__, 1, "message", (), None)
+
+    assert not sampler.filter(record(logging.DEBUG))
+    assert sampler.filter(record(logging.INFO))
+
+
+def test_logs_drop_records_when_the_queue_is_full(logs_module: ModuleType) -> None:
+    """Test that a full queue drops records instead of blocking the caller."""
+    handler = logs_module.NonBlockingQueueHandler(queue.Queue(1))
+    log = logging.getLogger("app.flood")
+    log.propagate = False
+    log.addHandler(handler)
+
+    for number in range(3):
+        log.warning("record %d", number)
+
+    assert handler.dropped == 2
+    assert handler.queue.get_nowait().msg == "record 0"
+    log.removeHandler(handler)
+    log.propagate = True
@@ -0,0 +1,51 @@
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def main_template(env: Environment) -> Template:
+    return env.get_template("main.py.j2")
+
+
+def test_main_template_exists(app_template_dir: Path) -> None:
+    """Test that the main.py template exists."""
+    assert (app_template_dir / "main.py.j2").exists()
+
+
+@pytest.mark.parametrize("database_type", [None, "postgresql", "mongodb"])
+def test_main_renders_valid_python(
+    main_template: Template, database_type: str | None
+) -> None:
+    """Test that the application entry point is valid Python."""
+    rendered = main_template.render(database_type=database_type)
+
+    compile(rendered, "main.py", "exec")
+    assert "app = FastAPI(" in rendered
+    assert ("database.connect(" in rendered) is (database_type is not None)
+
+
+def test_main_opens_database_once_in_lifespan(
+    generated_app: Callable[..., ModuleType], tmp_path: Path
+) -> None:
+    """Test that the lifespan connects and disposes the shared engine."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    from fastapi.testclient import TestClient
+
+    main = generated_app("app.main", database_type="sqlite")
+    database = main.database
+
+    with TestClient(main.app) as client:
+        assert database.engine is not None
+        assert client.get("/health").json() == {"status": "ok"}
+
+    assert database.engine is None
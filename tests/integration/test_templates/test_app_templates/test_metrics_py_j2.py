@@ -0,0 +1,184 @@
+import importlib
+import json
+import logging
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from types import ModuleType
+from typing import Annotated, Any
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def metrics_template(env: Environment) -> Template:
+    return env.get_template("metrics.py.j2")
+
+
+@pytest.fixture
+def metrics_app(
+    generated_app: Callable[..., ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Callable[..., Any]]:
+    """Return a started TestClient for an app generated with use_metrics."""
+    pytest.importorskip("httpx")
+    from fastapi import Depends
+    from fastapi.testclient import TestClient
+
+    clients = []
+
+    def build(**environment: str) -> Any:
+        for key, value in environment.items():
+            monkeypatch.setenv(key, value)
+        main = generated_app("app.main", use_metrics=True, database_type="sqlite")
+        get_session = importlib.import_module("app.database").get_session
+
+        @main.app.get("/items/{item_id}")
+        async def read_item(
+            item_id: int, _session: Annotated[Any, Depends(get_session)]
+        ) -> dict[str, int]:
+            return {"id": item_id}
+
+        client = TestClient(main.app)
+        client.__enter__()
+        clients.append(client)
+        return client
+
+    yield build
+    for client in clients:
+        client.__exit__(None, None, None)
+
+
+def samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+def test_metrics_template_exists(app_template_dir: Path) -> None:
+    """Test that the metrics.py template exists."""
+    assert (app_template_dir / "metrics.py.j2").exists()
+
+
+@pytest.mark.parametrize(
+    ("database_type", "mongo_driver", "use_redis"),
+    [
+        (None, None, False),
+        ("postgresql", None, True),
+        ("mongodb", None, False),
+        ("mongodb", "motor", True),
+    ],
+)
+def test_metrics_renders_valid_python(
+    metrics_template: Template,
+    database_type: str | None,
+    mongo_driver: str | None,
+    use_redis: bool,
+) -> None:
+    """Test that the metrics module is valid Python for every backend."""
+    rendered = metrics_template.render(
+        database_type=database_type, mongo_driver=mongo_driver, use_redis=use_redis
+    )
+
+    compile(rendered, "metrics.py", "exec")
+    assert ("db_pool_checkout_seconds" in rendered) == (database_type is not None)
+    assert ("class PoolListener" in rendered) == (database_type == "mongodb")
+    assert ("cache_requests_total" in rendered) == use_redis
+
+
+def test_metrics_is_wired_into_the_app(env: Environment) -> None:
+    """Test that use_metrics adds the middleware, router and pool hooks."""
+    main = env.get_template("main.py.j2").render(use_metrics=True)
+    config = env.get_template("config.py.j2").render(use_metrics=True)
+    relational = env.get_template("database.py.j2").render(
+        database_type="postgresql", use_metrics=True
+    )
+    document = env.get_template("database.py.j2").render(
+        database_type="mongodb", use_metrics=True
+    )
+
+    assert "app.add_middleware(MetricsMiddleware)" in main
+    assert "registry.start(get_settings())" in main
+    assert "await registry.stop()" in main
+    assert 'metrics_dir: str = ""' in config
+    assert "DB_CHECKOUT.observe(" in relational
+    assert "event_listeners=[PoolListener()]" in document
+    assert "metrics" not in env.get_template("main.py.j2").render()
+
+
+def test_metrics_exposes_route_templates(metrics_app: Callable[..., Any]) -> None:
+    """Test that requests are counted and timed by route, not by raw path."""
+    client = metrics_app()
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/nowhere")
+
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    values = samples(response.text)
+    route = 'method="GET",route="/items/{item_id}"'
+    assert values[f'http_requests_total{{{route},status="200"}}'] == 2
+    assert values[f"http_request_duration_seconds_count{{{route}}}"] == 2
+    assert values[f'http_request_duration_seconds_bucket{{{route},le="+Inf"}}'] == 2
+    unmatched = 'method="GET",route="<unmatched>",status="404"'
+    assert values[f"http_requests_total{{{unmatched}}}"] == 1
+    assert values['http_requests_in_progress{method="GET"}'] == 0
+    assert values["db_pool_checkout_seconds_count"] == 2
+    assert 'route="/metrics"' not in response.text
+
+
+def test_metrics_histogram_buckets_are_cumulative(
+    metrics_app: Callable[..., Any],
+) -> None:
+    """Test that bucket counts never decrease and end at the total count."""
+    client = metrics_app()
+    for _ in range(3):
+        client.get("/health")
+
+    lines = [
+        line
+        for line in client.get("/metrics").text.splitlines()
+        if line.startswith("http_request_duration_seconds_bucket")
+        and 'route="/health"' in line
+    ]
+
+    counts = [float(line.rsplit(" ", 1)[1]) for line in lines]
+    assert counts == sorted(counts)
+    assert counts[-1] == 3
+    assert lines[-1].endswith('le="+Inf"} 3')
+
+
+def test_metrics_archive_exited_workers(
+    metrics_app: Callable[..., Any], tmp_path: Path
+) -> None:
+    """Test that exited workers' counters are archived and their files removed."""
+    directory = tmp_path / "metrics"
+    directory.mkdir()
+    route = ["GET", "/health", "200"]
+    for pid, count in [(4321, 5.0), (4322, 2.0)]:
+        exited_worker = {
+            "pid": pid,
+            "metrics": {
+                "http_requests_total": [[route, count]],
+                "http_requests_in_progress": [[["GET"], 4.0]],
+            },
+        }
+        (directory / f"{pid}-exited.json").write_text(json.dumps(exited_worker))
+    client = metrics_app(METRICS_DIR=str(directory))
+    metrics = importlib.import_module("app.metrics")
+
+    metrics.mark_process_dead(4321, directory)
+    metrics.mark_process_dead(4322, directory)
+    client.get("/health")
+    values = samples(client.get("/metrics").text)
+
+    health = 'method="GET",route="/health",status="200"'
+    assert values[f"http_requests_total{{{health}}}"] == 8
+    assert values['http_requests_in_progress{method="GET"}'] == 0
+    files = sorted(path.name for path in directory.glob("*.json"))
+    assert len(files) == 2
+    assert metrics.ARCHIVE_FILE in files
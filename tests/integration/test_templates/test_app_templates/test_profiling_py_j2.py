@@ -0,0 +1,144 @@
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+TOKEN = "s3cret"
+
+
+@pytest.fixture
+def profiling_template(env: Environment) -> Template:
+    return env.get_template("profiling.py.j2")
+
+
+@pytest.fixture
+def profiled_app(
+    generated_app: Callable[..., ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., Any]:
+    """Return a TestClient factory for an app generated with use_profiling."""
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    def build(**environment: str) -> Any:
+        for key, value in environment.items():
+            monkeypatch.setenv(key, value)
+        main = generated_app("app.main", use_profiling=True)
+
+        @main.app.get("/busy")
+        async def busy() -> dict[str, int]:
+            deadline = time.perf_counter() + 0.05
+            total = 0
+            while time.perf_counter() < deadline:
+                total += 1
+            return {"total": total}
+
+        return TestClient(main.app)
+
+    return build
+
+
+def test_profiling_template_exists(app_template_dir: Path) -> None:
+    """Test that the profiling.py template exists."""
+    assert (app_template_dir / "profiling.py.j2").exists()
+
+
+def test_profiling_renders_valid_python(profiling_template: Template) -> None:
+    """Test that the profiling module is valid Python."""
+    rendered = profiling_template.render()
+
+    compile(rendered, "profiling.py", "exec")
+    assert "class ProfilingMiddleware" in rendered
+    assert 'prefix="/debug/profiles"' in rendered
+
+
+def test_profiling_is_wired_into_main(env: Environment) -> None:
+    """Test that use_profiling adds the middleware, router and settings."""
+    main = env.get_template("main.py.j2").render(use_profiling=True)
+    config = env.get_template("config.py.j2").render(use_profiling=True)
+
+    assert "app.add_middleware(ProfilingMiddleware" in main
+    assert "app.include_router(profiling_router)" in main
+    assert 'profile_token: str = ""' in config
+    assert "profile_sample_rate: float = 0.0" in config
+    assert "profiling" not in env.get_template("main.py.j2").render()
+
+
+def test_profiling_requires_token(
+    profiled_app: Callable[..., Any], tmp_path: Path
+) -> None:
+    """Test that nothing is profiled or served without the configured token."""
+    client = profiled_app(PROFILE_TOKEN=TOKEN)
+
+    response = client.get("/health", headers={"X-Profile-Token": "wrong"})
+
+    assert "x-profile-id" not in response.headers
+    assert client.get("/debug/profiles").status_code == 404
+    assert not (tmp_path / ".profiles").exists()
+
+
+def test_profiling_cprofile_on_request(profiled_app: Callable[..., Any]) -> None:
+    """Test that a request with the token is profiled and can be fetched."""
+    client = profiled_app(PROFILE_TOKEN=TOKEN)
+    auth = {"X-Profile-Token": TOKEN}
+
+    profile_id = client.get("/busy", headers=auth).headers["x-profile-id"]
+
+    listed = client.get("/debug/profiles", headers=auth).json()
+    assert [profile["id"] for profile in listed] == [profile_id]
+    assert listed[0]["path"] == "/busy"
+    assert listed[0]["mode"] == "cprofile"
+    download = client.get(f"/debug/profiles/{profile_id}", headers=auth)
+    assert download.status_code == 200
+    summary = client.get(f"/debug/profiles/{profile_id}/summary", headers=auth)
+    assert "function calls" in summary.text
+    assert "busy" in summary.text
+
+
+def test_profiling_summary_of_a_deleted_file_is_not_found(
+    profiled_app: Callable[..., Any],
+) -> None:
+    """Test that a profile whose file is gone answers 404, not 500."""
+    client = profiled_app(PROFILE_TOKEN=TOKEN)
+    auth = {"X-Profile-Token": TOKEN}
+    client.get("/busy", headers=auth)
+    (profile,) = client.get("/debug/profiles", headers=auth).json()
+
+    Path(profile["file"]).unlink()
+    summary = client.get(f"/debug/profiles/{profile['id']}/summary", headers=auth)
+
+    assert summary.status_code == 404
+
+
+def test_profiling_sampling_writes_collapsed_stacks(
+    profiled_app: Callable[..., Any], tmp_path: Path
+) -> None:
+    """Test that X-Profile: sample writes collapsed stacks of the request."""
+    client = profiled_app(PROFILE_TOKEN=TOKEN)
+    headers = {"X-Profile-Token": TOKEN, "X-Profile": "sample"}
+
+    profile_id = client.get("/busy", headers=headers).headers["x-profile-id"]
+
+    folded = (tmp_path / ".profiles" / f"{profile_id}.folded").read_text()
+    lines = folded.splitlines()
+    assert lines
+    assert any(";busy (" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_profiling_samples_traffic_and_keeps_recent(
+    profiled_app: Callable[..., Any], tmp_path: Path
+) -> None:
+    """Test that sampled requests are profiled and old profiles are deleted."""
+    client = profiled_app(PROFILE_SAMPLE_RATE="1.0", PROFILE_KEEP="2")
+
+    ids = [client.get("/health").headers["x-profile-id"] for _ in range(3)]
+
+    files = sorted(path.stem for path in (tmp_path / ".profiles").iterdir())
+    assert files == sorted(ids[1:])
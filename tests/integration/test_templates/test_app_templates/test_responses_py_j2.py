@@ -0,0 +1,147 @@
+import json
+import logging
+import subprocess
+import sys
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta, timezone
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from jinja2 import Environment, Template
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class Tag(BaseModel):
+    name: str
+
+
+class Item(BaseModel):
+    id: int
+    price: float
+    created: date
+    tags: list[Tag]
+
+
+ITEMS = [
+    Item(id=number, price=number / 3, created=date(2024, 1, number), tags=[])
+    for number in range(1, 4)
+]
+ITEMS[0].tags.append(Tag(name="new"))
+
+
+@pytest.fixture
+def responses_template(env: Environment) -> Template:
+    return env.get_template("responses.py.j2")
+
+
+@pytest.fixture
+def responses(generated_app: Callable[..., ModuleType]) -> ModuleType:
+    return generated_app("app.responses")
+
+
+def test_responses_template_exists(app_template_dir: Path) -> None:
+    """Test that the responses.py template exists."""
+    assert (app_template_dir / "responses.py.j2").exists()
+
+
+def test_responses_renders_valid_python(responses_template: Template) -> None:
+    """Test that the responses module is valid Python."""
+    rendered = responses_template.render()
+
+    compile(rendered, "responses.py", "exec")
+    assert "class FastJSONResponse(JSONResponse)" in rendered
+
+
+def test_responses_match_jsonable_encoder(responses: ModuleType) -> None:
+    """Test that the fast path produces the same JSON as the default one."""
+    content = {"items": ITEMS, "total": len(ITEMS)}
+    expected = JSONResponse(jsonable_encoder(content)).body
+
+    inferred = responses.FastJSONResponse(content, status_code=201)
+    typed = responses.FastJSONResponse(ITEMS, adapter=responses.adapter_for(list[Item]))
+
+    assert inferred.status_code == 201
+    assert inferred.media_type == "application/json"
+    assert json.loads(inferred.body) == json.loads(bytes(expected))
+    assert typed.body == responses.adapter_for(list[Item]).dump_json(ITEMS)
+    assert responses.adapter_for(list[Item]) is responses.adapter_for(list[Item])
+
+
+def test_responses_accept_non_str_keys(responses: ModuleType) -> None:
+    """Test that dict keys are converted like jsonable_encoder converts them."""
+    content = {1: "one", 2.5: "half", date(2024, 1, 1): "new year"}
+    expected = JSONResponse(jsonable_encoder(content)).body
+
+    body = responses.dumps(content)
+
+    assert json.loads(body) == json.loads(bytes(expected))
+
+
+@pytest.mark.parametrize("backend", ["orjson", "pydantic-core"])
+def test_responses_write_utc_datetimes_with_z(
+    responses: ModuleType, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    """Test that both serializers end UTC datetimes in Z and keep other offsets."""
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+        assert responses.orjson is not None
+    else:
+        monkeypatch.setattr(responses, "orjson", None)
+    content = {
+        "utc": datetime(2024, 1, 1, 12, tzinfo=UTC),
+        "cet": datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=1))),
+    }
+
+    assert json.loads(responses.dumps(content)) == {
+        "utc": "2024-01-01T12:00:00Z",
+        "cet": "2024-01-01T12:00:00+01:00",
+    }
+
+
+def test_responses_serve_a_route(responses: ModuleType) -> None:
+    """Test that an endpoint can return a FastJSONResponse."""
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+
+    @app.get("/items", response_class=responses.FastJSONResponse)
+    async def list_items() -> JSONResponse:
+        response: JSONResponse = responses.FastJSONResponse(ITEMS)
+        return response
+
+    response = TestClient(app).get("/items")
+
+    assert response.json() == jsonable_encoder(ITEMS)
+
+
+def test_responses_benchmark_runs(
+    generated_app: Callable[..., ModuleType], tmp_path: Path
+) -> None:
+    """Test that the generated micro-benchmark checks and times every path."""
+    generated_app("app.config")
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "scripts/bench_responses.py",
+            "--items",
+            "50",
+            "--repeat",
+            "2",
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "jsonable_encoder:" in result.stdout
+    assert "FastJSONResponse + adapter:" in result.stdout
@@ -0,0 +1,160 @@
+import importlib.util
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_TESTS = """
+def test_slow():
+    pass
+
+def test_a():
+    pass
+
+def test_b():
+    pass
+
+def test_c():
+    pass
+"""
+DURATIONS = {
+    "tests/test_sample.py::test_slow": 10.0,
+    "tests/test_sample.py::test_a": 1.0,
+    "tests/test_sample.py::test_b": 1.0,
+}
+
+
+@pytest.fixture
+def sharding_template(env: Environment) -> Template:
+    return env.get_template("pytest_sharding.py.j2")
+
+
+@pytest.fixture
+def sharding(tmp_path: Path, sharding_template: Template) -> ModuleType:
+    path = tmp_path / "pytest_sharding.py"
+    path.write_text(sharding_template.render())
+    spec = importlib.util.spec_from_file_location("pytest_sharding", path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def project(tmp_path: Path, env: Environment, sharding_template: Template) -> Path:
+    context = {"test_sharding": True, "configure_logging": False, "durations": False}
+    (tmp_path / "pytest.ini").write_text(
+        env.get_template("pytest.ini.j2").render(**context)
+    )
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "pytest_sharding.py").write_text(sharding_template.render())
+    (tests / "test_sample.py").write_text(SAMPLE_TESTS)
+    (tmp_path / ".test_durations.json").write_text(json.dumps(DURATIONS))
+    return tmp_path
+
+
+def run_pytest(project: Path, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", *args],
+        cwd=project,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_sharding_template_exists(code_quality_template_dir: Path) -> None:
+    """Test that the sharding plugin template exists."""
+    assert (code_quality_template_dir / "pytest_sharding.py.j2").exists()
+
+
+def test_sharding_renders_valid_python(sharding_template: Template) -> None:
+    """Test that the plugin is valid Python with the configured durations file."""
+    rendered = sharding_template.render(durations_file="ci/durations.json")
+
+    compile(rendered, "pytest_sharding.py", "exec")
+    assert 'DURATIONS_PATH = "ci/durations.json"' in rendered
+
+
+def test_split_balances_total_duration(sharding: ModuleType) -> None:
+    """Test that shards are balanced by duration rather than by test count."""
+    durations = {"slow": 9.0, "a": 3.0, "b": 3.0, "c": 3.0, "d": 1.0}
+
+    shards = sharding.split(["a", "b", "c", "d", "slow"], durations, 2)
+
+    assert shards == [["slow", "d"], ["a", "b", "c"]]
+
+
+def test_split_estimates_unrecorded_tests_as_the_mean(sharding: ModuleType) -> None:
+    """Test that tests without a timing count as the mean of known timings."""
+    estimated = sharding.estimate(["a", "b", "new"], {"a": 1.0, "b": 3.0})
+
+    assert estimated == {"a": 1.0, "b": 3.0, "new": 2.0}
+    assert sharding.estimate(["new"], {}) == {"new": 1.0}
+
+
+def test_split_covers_every_test_once(sharding: ModuleType) -> None:
+    """Test that every test lands in exactly one shard."""
+    nodeids = [f"test_{index}" for index in range(50)]
+    durations = {nodeid: float(index % 7) for index, nodeid in enumerate(nodeids)}
+
+    shards = sharding.split(nodeids, durations, 4)
+
+    assert sorted(nodeid for shard in shards for nodeid in shard) == sorted(nodeids)
+
+
+def test_pytest_ini_loads_sharding_plugin(env: Environment) -> None:
+    """Test that test_sharding loads the plugin from pytest.ini."""
+    rendered = env.get_template("pytest.ini.j2").render(test_sharding=True)
+
+    assert "pythonpath = ." in rendered
+    assert "addopts = -xvs  -p tests.pytest_sharding" in rendered
+
+
+def test_sharding_plugin_selects_shard(project: Path) -> None:
+    """Test that --shard-id/--num-shards run only the tests of one shard."""
+    first = run_pytest(project, "--num-shards", "2", "--shard-id", "0")
+    second = run_pytest(project, "--num-shards", "2", "--shard-id", "1")
+
+    assert first.returncode == 0, first.stdout
+    assert "test_slow PASSED" in first.stdout
+    assert "1 passed, 3 deselected" in first.stdout
+    assert "test_slow" not in second.stdout
+    assert "3 passed, 1 deselected" in second.stdout
+
+
+def test_sharding_plugin_runs_longest_first(project: Path) -> None:
+    """Test that --longest-first orders the slowest recorded tests first."""
+    result = run_pytest(project, "--longest-first")
+    order = [line.split()[0] for line in result.stdout.splitlines() if "::" in line]
+
+    assert order[0] == "tests/test_sample.py::test_slow"
+    # test_c has no timing and runs as if it took the mean, 4s.
+    assert order[1] == "tests/test_sample.py::test_c"
+
+
+def test_sharding_plugin_stores_durations(project: Path) -> None:
+    """Test that --store-durations merges new timings into the file."""
+    result = run_pytest(project, "--store-durations", "-k", "test_c")
+
+    assert result.returncode == 0, result.stdout
+    durations = json.loads((project / ".test_durations.json").read_text())
+    assert set(durations) == {*DURATIONS, "tests/test_sample.py::test_c"}
+    assert durations["tests/test_sample.py::test_slow"] == 10.0
+
+
+def test_sharding_plugin_rejects_invalid_shard(project: Path) -> None:
+    """Test that a shard id outside the shard count is a usage error."""
+    result = run_pytest(project, "--num-shards", "2", "--shard-id", "2")
+
+    assert result.returncode == 4
+    assert "--shard-id must be between 0 and 1" in result.stderr
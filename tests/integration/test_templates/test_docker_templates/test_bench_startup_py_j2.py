@@ -0,0 +1,36 @@
+import logging
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def bench_startup_template(env: Environment) -> Template:
+    return env.get_template("bench_startup.py.j2")
+
+
+def test_bench_startup_template_exists(docker_template_dir: Path) -> None:
+    """Test that the startup benchmark template exists."""
+    assert (docker_template_dir / "bench_startup.py.j2").exists()
+
+
+def test_bench_startup_renders_valid_python(bench_startup_template: Template) -> None:
+    """Test that the startup benchmark script is valid Python."""
+    rendered = bench_startup_template.render(app_name="orders", expose_port=9000)
+
+    compile(rendered, "bench_startup.py", "exec")
+    assert 'IMAGE = "orders:bench"' in rendered
+    assert "CONTAINER_PORT = 9000" in rendered
+    assert "/health" in rendered
+
+
+def test_bench_startup_prefers_explicit_image_name(
+    bench_startup_template: Template,
+) -> None:
+    """Test that image_name overrides the image derived from app_name."""
+    rendered = bench_startup_template.render(app_name="orders", image_name="reg/x")
+
+    assert 'IMAGE = "reg/x:bench"' in rendered
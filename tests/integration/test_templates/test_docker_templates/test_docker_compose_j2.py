@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 
 import pytest
+import yaml
 from jinja2 import Environment, Template
 
 logger = logging.getLogger(__name__)
@@ -101,3 +102,105 @@ def test_docker_compose_renders_with_nginx(docker_compose_template: Template) ->
     assert "nginx:" in rendered
     assert '"8080:80"' in rendered
     assert '"8443:443"' in rendered
+
+
+def test_docker_compose_runs_gunicorn_with_generated_config(
+    docker_compose_template: Template,
+) -> None:
+    """Test that use_gunicorn runs gunicorn with the mounted gunicorn.conf.py."""
+    rendered = docker_compose_template.render(use_gunicorn=True, app_module="api.main")
+
+    assert (
+        'command: ["gunicorn", "api.main:app", "--config", "gunicorn.conf.py"]'
+        in rendered
+    )
+    assert "./gunicorn.conf.py:/app/gunicorn.conf.py:ro" in rendered
+    assert "gunicorn" not in docker_compose_template.render()
+
+
+def test_docker_compose_mounts_app_package(docker_compose_template: Template) -> None:
+    """Test that the generated app package is mounted where it is imported from."""
+    rendered = docker_compose_template.render()
+
+    assert "- ./app:/app/app" in rendered
+
+
+def test_docker_compose_without_profile_uses_image_defaults(
+    docker_compose_template: Template,
+) -> None:
+    """Test that database services are untuned unless db_profile is set."""
+    rendered = docker_compose_template.render(database_type="postgresql")
+
+    assert "shared_buffers" not in rendered
+    assert "mem_limit" not in rendered
+    assert "tmpfs" not in rendered
+
+
+def test_docker_compose_dev_fast_profile_trades_durability_for_speed(
+    docker_compose_template: Template,
+) -> None:
+    """Test that dev-fast turns fsync off and keeps postgres data on tmpfs."""
+    rendered = docker_compose_template.render(
+        database_type="postgresql", use_redis=True, db_profile="dev-fast"
+    )
+    services = yaml.safe_load(rendered)["services"]
+    postgres = services["postgres"]
+
+    assert "-c shared_buffers=256MB" in postgres["command"]
+    assert "-c fsync=off" in postgres["command"]
+    assert postgres["tmpfs"] == ["/var/lib/postgresql/data"]
+    assert "postgres_data:/var/lib/postgresql/data" not in postgres["volumes"]
+    assert postgres["mem_limit"] == "1024m"
+    assert '--save ""' in services["redis"]["command"]
+
+
+@pytest.mark.parametrize(
+    ("database_type", "service", "setting"),
+    [
+        ("postgresql", "postgres", "-c effective_cache_size=3072MB"),
+        ("mysql", "mysql", "--innodb-buffer-pool-size=2457M"),
+        ("mongodb", "mongodb", "--wiredTigerCacheSizeGB 1.5"),
+    ],
+)
+def test_docker_compose_memory_profile_sizes_database_caches(
+    docker_compose_template: Template, database_type: str, service: str, setting: str
+) -> None:
+    """Test that memory:<size> sizes each database's cache from the budget."""
+    rendered = docker_compose_template.render(
+        database_type=database_type, db_profile="memory:4g"
+    )
+    database = yaml.safe_load(rendered)["services"][service]
+
+    assert setting in database["command"]
+    assert database["mem_limit"] == "4096m"
+    assert "fsync=off" not in database["command"]
+    assert "tmpfs" not in database
+
+
+def test_docker_compose_profile_configures_redis_as_cache(
+    docker_compose_template: Template,
+) -> None:
+    """Test that a profile bounds Redis memory and keeps the password."""
+    rendered = docker_compose_template.render(
+        use_redis=True,
+        redis_password="secret",
+        db_profile="balanced",
+        redis_eviction_policy="volatile-lru",
+        redis_persistence=True,
+    )
+    command = yaml.safe_load(rendered)["services"]["redis"]["command"]
+
+    assert command.startswith("redis-server --maxmemory 1536mb")
+    assert "--maxmemory-policy volatile-lru" in command
+    assert "--requirepass secret" in command
+    assert "--appendonly no" not in command
+
+
+def test_docker_compose_without_dependencies_omits_empty_sections(
+    docker_compose_template: Template,
+) -> None:
+    """Test that no database and no Redis leave no null depends_on or volumes."""
+    document = yaml.safe_load(docker_compose_template.render(database_type="sqlite"))
+
+    assert "depends_on" not in document["services"]["fastapi-app"]
+    assert "volumes" not in document
@@ -49,3 +49,116 @@ def test_dockerfile_renders_with_custom_values(dockerfile_template: Template) ->
         'CMD ["uvicorn", "api.main:app", "--host", "0.0.0.0", "--port", "9000"]'
         in rendered
     )
+
+
+def test_dockerfile_multistage_separates_dependency_layer(
+    dockerfile_template: Template,
+) -> None:
+    """Test that the multistage build installs dependencies before copying code."""
+    context: dict[str, Any] = {
+        "python_version": "3.12",
+        "expose_port": 8000,
+        "app_module": "main",
+        "build_mode": "multistage",
+    }
+    rendered: str = dockerfile_template.render(**context)
+
+    assert rendered.startswith("# syntax=docker/dockerfile:1")
+    assert "FROM python:3.12 AS builder" in rendered
+    assert "FROM python:3.12-slim AS runtime" in rendered
+    assert "--mount=type=cache,target=/root/.cache/uv" in rendered
+    assert "uv sync --frozen --no-dev --no-install-project" in rendered
+    assert "COPY --from=builder /opt/venv /opt/venv" in rendered
+    assert rendered.index("COPY pyproject.toml uv.lock ./") < rendered.index("uv sync")
+    assert rendered.index("uv sync") < rendered.index("COPY . .")
+    assert "build-essential" not in rendered
+    assert "uv export" not in rendered
+
+
+def test_dockerfile_multistage_keeps_explicit_image_variant(
+    dockerfile_template: Template,
+) -> None:
+    """Test that a python_version with a variant is used as-is for the runtime."""
+    rendered: str = dockerfile_template.render(
+        python_version="3.12-bookworm",
+        expose_port=8000,
+        app_module="main",
+        build_mode="multistage",
+    )
+
+    assert "FROM python:3.12-bookworm AS runtime" in rendered
+
+
+def test_dockerfile_default_build_is_single_stage(
+    dockerfile_template: Template,
+) -> None:
+    """Test that the default build mode keeps the single-stage Dockerfile."""
+    rendered: str = dockerfile_template.render(
+        python_version="3.12", expose_port=8000, app_module="main"
+    )
+
+    assert rendered.startswith("FROM python:3.12\n")
+    assert " AS builder" not in rendered
+
+
+@pytest.mark.parametrize("build_mode", ["", "multistage"])
+def test_dockerfile_optimize_startup_precompiles_bytecode(
+    dockerfile_template: Template, build_mode: str
+) -> None:
+    """Test that optimize_startup byte-compiles with unchecked-hash pycs."""
+    rendered: str = dockerfile_template.render(
+        python_version="3.12",
+        expose_port=8000,
+        app_module="main",
+        build_mode=build_mode,
+        optimize_startup=True,
+    )
+
+    assert "--invalidation-mode unchecked-hash" in rendered
+    assert rendered.index("COPY . .") < rendered.rindex("compileall")
+    assert "compileall -q -j 0" in rendered
+
+
+def test_dockerfile_uvloop_adds_fast_loop_arguments(
+    dockerfile_template: Template,
+) -> None:
+    """Test that use_uvloop switches uvicorn to uvloop and httptools."""
+    rendered: str = dockerfile_template.render(
+        python_version="3.12", expose_port=8000, app_module="main", use_uvloop=True
+    )
+
+    assert (
+        'CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000", '
+        '"--loop", "uvloop", "--http", "httptools"]'
+    ) in rendered
+    assert "compileall" not in rendered
+
+
+@pytest.mark.parametrize("build_mode", ["", "multistage"])
+def test_dockerfile_gunicorn_uses_generated_config(
+    dockerfile_template: Template, build_mode: str
+) -> None:
+    """Test that use_gunicorn runs gunicorn with gunicorn.conf.py."""
+    rendered: str = dockerfile_template.render(
+        python_version="3.12",
+        expose_port=8000,
+        app_module="main",
+        build_mode=build_mode,
+        use_gunicorn=True,
+    )
+
+    assert rendered.rstrip().endswith(
+        'CMD ["gunicorn", "main:app", "--config", "gunicorn.conf.py"]'
+    )
+    assert 'CMD ["uvicorn"' not in rendered
+
+
+def test_dockerfile_behind_nginx_outlives_upstream_keepalive(
+    dockerfile_template: Template,
+) -> None:
+    """Test that uvicorn keeps idle connections longer than nginx reuses them."""
+    rendered: str = dockerfile_template.render(
+        python_version="3.12", expose_port=8000, app_module="main", use_nginx=True
+    )
+
+    assert '"--timeout-keep-alive", "75"]' in rendered
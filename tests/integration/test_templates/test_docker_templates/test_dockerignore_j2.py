@@ -44,3 +44,12 @@ def test_dockerignore_renders(dockerignore_template: Template) -> None:
     assert "Dockerfile" in rendered
     assert "docker-compose.yml" in rendered
     assert ".dockerignore" in rendered
+
+
+def test_dockerignore_excludes_local_virtualenv(
+    dockerignore_template: Template,
+) -> None:
+    """Test that the local .venv never ends up in the build context."""
+    rendered = dockerignore_template.render()
+
+    assert ".venv/" in rendered.splitlines()
@@ -0,0 +1,108 @@
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def gunicorn_conf_template(env: Environment) -> Template:
+    return env.get_template("gunicorn.conf.py.j2")
+
+
+def _load(rendered: str) -> dict[str, Any]:
+    namespace: dict[str, Any] = {}
+    exec(compile(rendered, "gunicorn.conf.py", "exec"), namespace)
+    return namespace
+
+
+def test_gunicorn_conf_template_exists(docker_template_dir: Path) -> None:
+    """Test that the gunicorn.conf.py template exists."""
+    assert (docker_template_dir / "gunicorn.conf.py.j2").exists()
+
+
+def test_gunicorn_conf_renders_with_default_values(
+    gunicorn_conf_template: Template,
+) -> None:
+    """Test that the gunicorn config defines the tuned production settings."""
+    config = _load(gunicorn_conf_template.render())
+
+    assert config["bind"] == "0.0.0.0:8000"
+    assert config["worker_class"] == "uvicorn.workers.UvicornWorker"
+    assert config["preload_app"] is True
+    assert config["max_requests"] == 1000
+    assert config["max_requests_jitter"] == 100
+    assert config["worker_tmp_dir"] == "/dev/shm"
+    assert config["keepalive"] == 5
+    assert config["workers"] >= 1
+
+
+def test_gunicorn_conf_behind_nginx_outlives_upstream_keepalive(
+    gunicorn_conf_template: Template,
+) -> None:
+    """Test that keep-alive exceeds nginx's idle upstream timeout behind nginx."""
+    config = _load(gunicorn_conf_template.render(use_nginx=True, app_port=9000))
+
+    assert config["keepalive"] > 60
+    assert config["forwarded_allow_ips"] == "*"
+    assert config["bind"] == "0.0.0.0:9000"
+
+
+def test_gunicorn_conf_honours_web_concurrency(
+    gunicorn_conf_template: Template, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that WEB_CONCURRENCY overrides the derived worker count."""
+    monkeypatch.setenv("WEB_CONCURRENCY", "7")
+
+    assert _load(gunicorn_conf_template.render())["workers"] == 7
+
+
+def test_gunicorn_conf_caps_workers_by_cpu_and_memory(
+    gunicorn_conf_template: Template, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that workers follow the CPU quota and are capped by memory."""
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    config = _load(gunicorn_conf_template.render(workers_per_core=2))
+    monkeypatch.setitem(
+        config["default_workers"].__globals__, "available_cpus", lambda: 1.5
+    )
+    monkeypatch.setitem(
+        config["default_workers"].__globals__, "available_memory_mb", lambda: None
+    )
+    assert config["default_workers"]() == 3
+
+    monkeypatch.setitem(
+        config["default_workers"].__globals__, "available_memory_mb", lambda: 512
+    )
+    assert config["default_workers"]() == 2
+
+
+def test_gunicorn_conf_available_cpus_is_positive(
+    gunicorn_conf_template: Template,
+) -> None:
+    """Test that CPU detection works on the current machine."""
+    config = _load(gunicorn_conf_template.render())
+
+    assert 1 <= config["available_cpus"]() <= (os.cpu_count() or 1)
+
+
+def test_gunicorn_conf_shares_metrics_directory(
+    gunicorn_conf_template: Template, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that use_metrics points workers at one directory cleared on start."""
+    monkeypatch.delenv("METRICS_DIR", raising=False)
+    assert "on_starting" not in _load(gunicorn_conf_template.render())
+    _load(gunicorn_conf_template.render(use_metrics=True))
+    assert os.environ["METRICS_DIR"] == "/dev/shm/app-metrics"
+
+    directory = tmp_path / "metrics"
+    (directory / "stale").mkdir(parents=True)
+    monkeypatch.setenv("METRICS_DIR", str(directory))
+    config = _load(gunicorn_conf_template.render(use_metrics=True))
+    config["on_starting"](None)
+
+    assert not directory.exists()
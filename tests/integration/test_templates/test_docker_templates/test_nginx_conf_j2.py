@@ -0,0 +1,69 @@
+import logging
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def nginx_conf_template(env: Environment) -> Template:
+    return env.get_template("nginx.conf.j2")
+
+
+def test_nginx_conf_template_exists(docker_template_dir: Path) -> None:
+    """Test that the nginx.conf template exists."""
+    assert (docker_template_dir / "nginx.conf.j2").exists()
+
+
+def test_nginx_conf_renders_with_default_values(nginx_conf_template: Template) -> None:
+    """Test that nginx proxies to a keep-alive upstream with gzip enabled."""
+    rendered = nginx_conf_template.render()
+
+    assert "upstream fastapi_app {" in rendered
+    assert "server fastapi-app:8000;" in rendered
+    assert "keepalive 32;" in rendered
+    assert "proxy_http_version 1.1;" in rendered
+    assert 'proxy_set_header Connection "";' in rendered
+    assert "gzip_types application/json" in rendered
+    assert "proxy_buffering on;" in rendered
+    assert "expires 30d;" in rendered
+    assert "location / {" in rendered
+    assert "proxy_cache " not in rendered
+
+
+def test_nginx_conf_braces_are_balanced(nginx_conf_template: Template) -> None:
+    """Test that every rendered variant has balanced blocks."""
+    for context in (
+        {},
+        {"nginx_micro_cache": True},
+        {"nginx_micro_cache": True, "micro_cache_paths": ["/api/catalog"]},
+    ):
+        rendered = nginx_conf_template.render(**context)
+        assert rendered.count("{") == rendered.count("}")
+
+
+def test_nginx_conf_micro_cache(nginx_conf_template: Template) -> None:
+    """Test that the micro-cache only caches GET/HEAD and skips authenticated calls."""
+    rendered = nginx_conf_template.render(
+        nginx_micro_cache=True, micro_cache_ttl="2s", app_port=9000
+    )
+
+    assert "keys_zone=microcache:10m" in rendered
+    assert "proxy_cache_methods GET HEAD;" in rendered
+    assert "proxy_cache_valid 200 2s;" in rendered
+    assert "proxy_no_cache $http_authorization" in rendered
+    assert "server fastapi-app:9000;" in rendered
+    assert rendered.count("location / {") == 1
+
+
+def test_nginx_conf_micro_cache_limited_to_paths(nginx_conf_template: Template) -> None:
+    """Test that micro-caching can be restricted to selected paths."""
+    rendered = nginx_conf_template.render(
+        nginx_micro_cache=True, micro_cache_paths=["/api/catalog/"]
+    )
+
+    assert "location /api/catalog/ {" in rendered
+    assert "location / {" in rendered
+    assert rendered.count("proxy_cache microcache;") == 1
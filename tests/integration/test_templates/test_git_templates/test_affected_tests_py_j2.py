@@ -0,0 +1,150 @@
+import importlib.util
+import logging
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from jinja2 import Environment, Template
+
+logger = logging.getLogger(__name__)
+
+PROJECT_FILES = {
+    "app/__init__.py": "",
+    "app/models.py": "class Item: ...\n",
+    "app/service.py": "from .models import Item\n",
+    "app/routes.py": "from app import service\n",
+    "app/settings.py": "DEBUG = False\n",
+    "tests/__init__.py": "",
+    "tests/unit/__init__.py": "",
+    "tests/unit/conftest.py": "",
+    "tests/unit/test_routes.py": "from app.routes import service\n",
+    "tests/unit/test_settings.py": "from app.settings import DEBUG\n",
+    "tests/unit/api/conftest.py": "",
+    "tests/unit/api/test_api.py": "import app.models\n",
+}
+
+
+@pytest.fixture
+def affected_tests_template(env: Environment) -> Template:
+    return env.get_template("affected_tests.py.j2")
+
+
+@pytest.fixture
+def project(tmp_path: Path, affected_tests_template: Template) -> Path:
+    for name, content in PROJECT_FILES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    script = tmp_path / "scripts" / "affected_tests.py"
+    script.parent.mkdir()
+    script.write_text(affected_tests_template.render())
+    return tmp_path
+
+
+@pytest.fixture
+def affected(project: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        "affected_tests", project / "scripts" / "affected_tests.py"
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # The first run builds the graph and runs the full suite.
+    assert module.select([], full=False) is None
+    return module
+
+
+def test_affected_tests_template_exists(git_template_dir: Path) -> None:
+    """Test that the affected tests script template exists."""
+    assert (git_template_dir / "affected_tests.py.j2").exists()
+
+
+def test_affected_tests_renders_valid_python(
+    affected_tests_template: Template,
+) -> None:
+    """Test that the script is valid Python using the app package name."""
+    rendered = affected_tests_template.render(app_module="service.main")
+
+    compile(rendered, "affected_tests.py", "exec")
+    assert 'APP_PACKAGE = "service"' in rendered
+    assert 'UNIT_TESTS = "tests/unit"' in rendered
+
+
+def test_affected_tests_follow_transitive_imports(affected: ModuleType) -> None:
+    """Test that tests importing a changed module through others are selected."""
+    assert affected.select(["app/models.py"], full=False) == [
+        "tests/unit/api/test_api.py",
+        "tests/unit/test_routes.py",
+    ]
+    assert affected.select(["app/settings.py"], full=False) == [
+        "tests/unit/test_settings.py"
+    ]
+
+
+def test_affected_tests_include_changed_tests_and_conftests(
+    affected: ModuleType,
+) -> None:
+    """Test that changed test modules and conftests select their tests."""
+    assert affected.select(["tests/unit/test_settings.py"], full=False) == [
+        "tests/unit/test_settings.py"
+    ]
+    assert affected.select(["tests/unit/api/conftest.py"], full=False) == [
+        "tests/unit/api/test_api.py"
+    ]
+    assert len(affected.select(["tests/unit/conftest.py"], full=False)) == 3
+
+
+def test_affected_tests_update_graph_incrementally(
+    affected: ModuleType, project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that only changed files are parsed again and new imports count."""
+    parsed: list[str] = []
+    parse_imports = affected.parse_imports
+
+    def tracking(source: bytes, module: str, is_package: bool) -> object:
+        parsed.append(module)
+        return parse_imports(source, module, is_package)
+
+    monkeypatch.setattr(affected, "parse_imports", tracking)
+    (project / "app" / "settings.py").write_text("from app.models import Item\n")
+
+    selected = affected.select(["app/models.py"], full=False)
+
+    assert parsed == ["app.settings"]
+    assert "tests/unit/test_settings.py" in selected
+
+
+def test_affected_tests_treat_dynamic_imports_as_depending_on_app(
+    affected: ModuleType, project: Path
+) -> None:
+    """Test that a module importing dynamically depends on every app module."""
+    (project / "app" / "settings.py").write_text(
+        "import importlib\nbackend = importlib.import_module('app.models')\n"
+    )
+
+    assert "tests/unit/test_settings.py" in affected.select(
+        ["app/service.py"], full=False
+    )
+
+
+def test_affected_tests_fall_back_to_full_suite(
+    affected: ModuleType, project: Path
+) -> None:
+    """Test that changes outside the graph and syntax errors run everything."""
+    assert affected.select(["pyproject.toml"], full=False) is None
+    assert affected.select(["app/deleted.py"], full=False) is None
+    assert affected.select(["app/models.py"], full=True) is None
+
+    (project / "app" / "models.py").write_text("class Item(\n")
+    assert affected.select(["app/models.py"], full=False) is None
+
+
+def test_affected_tests_rebuild_cache_from_other_versions(
+    affected: ModuleType,
+) -> None:
+    """Test that a cache written by another version is discarded."""
+    affected.CACHE_PATH.write_text('{"version": 0, "files": {}}')
+
+    assert affected.select(["app/models.py"], full=False) is None
+    assert affected.select(["app/models.py"], full=False) is not None
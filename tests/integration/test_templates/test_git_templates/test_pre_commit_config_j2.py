@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+import yaml
 from jinja2 import Environment, Template
 
 logger = logging.getLogger(__name__)
@@ -97,3 +98,15 @@ def test_pre_commit_renders_with_custom_test_settings(
     assert "--maxfail=5" in rendered
     assert "--maxfail=3" in rendered
     assert "fail_fast: true" in rendered
+
+
+def test_pre_commit_runs_affected_unit_tests(pre_commit_template: Template) -> None:
+    """Test that affected_tests runs unit tests through the import graph script."""
+    rendered: str = pre_commit_template.render(affected_tests=True)
+    hooks = yaml.safe_load(rendered)["repos"][-1]["hooks"]
+    unit = next(hook for hook in hooks if hook["id"] == "pytest-unit")
+
+    assert unit["entry"] == "python scripts/affected_tests.py"
+    assert unit["pass_filenames"] is True
+    assert unit["args"] == ["--pytest-args=--maxfail=3 --disable-warnings -v -m unit"]
+    assert "tests/unit/" not in rendered
@@ -0,0 +1,13 @@
+import logging
+from pathlib import Path
+
+from src.core.matrix import pairwise_combinations, run_matrix
+
+logger = logging.getLogger(__name__)
+
+
+def test_every_pairwise_combination_parses(tmp_path: Path) -> None:
+    """Test that all option pairs render to parsable YAML, JSON, INI, TOML and Python."""
+    report = run_matrix(pairwise_combinations(), workers=1, cache_dir=tmp_path)
+
+    assert report.ok, "\n".join(failure.format() for failure in report.failures)
@@ -0,0 +1,53 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.resource import parse_resource, render_resource
+
+
+@pytest.fixture
+def product_definition() -> dict[str, Any]:
+    """A resource definition with a field for every index and default kind."""
+    return {
+        "name": "Product",
+        "fields": {
+            "name": {
+                "type": "str",
+                "max_length": 100,
+                "filterable": True,
+                "sortable": True,
+            },
+            "sku": {
+                "type": "str",
+                "max_length": 32,
+                "unique": True,
+                "filterable": True,
+            },
+            "price": {"type": "decimal", "sortable": True},
+            "in_stock": {"type": "bool", "default": True, "filterable": True},
+            "created_at": {"type": "datetime", "default": "now", "sortable": True},
+            "description": {"type": "text", "required": False},
+        },
+    }
+
+
+@pytest.fixture
+def resource_template_dir() -> Path:
+    current_file = Path(__file__)
+    project_root = current_file.parent.parent.parent.parent.parent
+    return project_root / "src" / "templates" / "resource"
+
+
+@pytest.fixture
+def render_product(
+    product_definition: dict[str, Any],
+) -> Callable[[str], dict[str, str]]:
+    """Render the Product resource for an ORM, keyed by output path."""
+
+    def render(orm: str) -> dict[str, str]:
+        files = render_resource(parse_resource(product_definition), orm)
+        return {item.path: item.content.decode() for item in files}
+
+    return render
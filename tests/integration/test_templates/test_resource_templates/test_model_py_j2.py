@@ -0,0 +1,75 @@
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.core.resource import ORMS
+
+logger = logging.getLogger(__name__)
+
+Render = Callable[[str], dict[str, str]]
+
+
+@pytest.mark.parametrize("orm", ORMS)
+def test_model_templates_exist(resource_template_dir: Path, orm: str) -> None:
+    """Test that every ORM has a model and a repository template."""
+    assert (resource_template_dir / orm / "model.py.j2").exists()
+    assert (resource_template_dir / orm / "repository.py.j2").exists()
+
+
+@pytest.mark.parametrize("orm", ORMS)
+def test_resource_renders_valid_python(render_product: Render, orm: str) -> None:
+    """Test that every generated module of a resource is valid Python."""
+    files = render_product(orm)
+
+    assert set(files) == {
+        "app/pagination.py",
+        "app/models/product.py",
+        "app/schemas/product.py",
+        "app/repositories/product.py",
+        "app/routers/product.py",
+    } | ({"tests/conftest.py"} if orm == "tortoise" else set())
+    for path, content in files.items():
+        compile(content, path, "exec")
+
+
+def test_sqlalchemy_model_indexes_filterable_and_sortable_fields(
+    render_product: Render,
+) -> None:
+    """Test that filters get an index and sort keys a (field, id) index."""
+    model = render_product("sqlalchemy")["app/models/product.py"]
+
+    assert 'Index("ix_products_name_id", "name", "id")' in model
+    assert 'Index("ix_products_created_at_id", "created_at", "id")' in model
+    assert "sku: Mapped[str] = mapped_column(String(32), unique=True)" in model
+    assert "in_stock: Mapped[bool] = mapped_column(Boolean, index=True)" in model
+    # The (name, id) index already serves equality filters on name.
+    assert "name: Mapped[str] = mapped_column(String(100))" in model
+    assert "description: Mapped[str | None] = mapped_column(Text)" in model
+
+
+def test_beanie_model_indexes_filterable_and_sortable_fields(
+    render_product: Render,
+) -> None:
+    """Test that the document declares its indexes in Settings."""
+    model = render_product("beanie")["app/models/product.py"]
+
+    assert "class Product(Document):" in model
+    assert "price: DecimalAnnotation" in model
+    assert 'IndexModel([("sku", ASCENDING)], unique=True)' in model
+    assert 'IndexModel([("in_stock", ASCENDING)])' in model
+    assert 'IndexModel([("price", ASCENDING), ("_id", ASCENDING)])' in model
+    assert 'IndexModel([("name", ASCENDING)])' not in model
+
+
+def test_tortoise_model_indexes_filterable_and_sortable_fields(
+    render_product: Render,
+) -> None:
+    """Test that the model flags indexed fields and lists composite indexes."""
+    model = render_product("tortoise")["app/models/product.py"]
+
+    assert "sku = fields.CharField(max_length=32, unique=True)" in model
+    assert "in_stock = fields.BooleanField(db_index=True)" in model
+    assert 'table = "products"' in model
+    assert '("price", "id"),' in model
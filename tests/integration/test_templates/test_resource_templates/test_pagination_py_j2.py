@@ -0,0 +1,57 @@
+import importlib
+import logging
+import sys
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def pagination(
+    render_product: Callable[[str], dict[str, str]],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[ModuleType]:
+    (tmp_path / "pagination.py").write_text(
+        render_product("sqlalchemy")["app/pagination.py"]
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("pagination")
+    del sys.modules["pagination"]
+
+
+def test_pagination_template_exists(resource_template_dir: Path) -> None:
+    """Test that the pagination.py template exists."""
+    assert (resource_template_dir / "pagination.py.j2").exists()
+
+
+@pytest.mark.parametrize(
+    ("values", "types"),
+    [
+        ((7,), (int,)),
+        (("widget", 3), (str, int)),
+        ((Decimal("12.50"), 4), (Decimal, int)),
+        ((datetime(2024, 5, 1, 12, tzinfo=UTC), 9), (datetime, int)),
+    ],
+)
+def test_cursor_round_trips(
+    pagination: ModuleType, values: tuple[object, ...], types: tuple[type, ...]
+) -> None:
+    """Test that a cursor decodes back to the sort key it was made from."""
+    cursor = pagination.encode_cursor(*values)
+
+    assert "=" not in cursor
+    assert pagination.decode_cursor(cursor, types) == values
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "e30", "WyJ4Il0"])
+def test_invalid_cursor_is_a_value_error(pagination: ModuleType, cursor: str) -> None:
+    """Test that garbage, wrong shapes and wrong types are rejected."""
+    with pytest.raises(ValueError, match="invalid cursor"):
+        pagination.decode_cursor(cursor, (int,))
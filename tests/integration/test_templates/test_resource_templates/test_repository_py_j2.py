@@ -0,0 +1,52 @@
+import logging
+from collections.abc import Callable
+
+import pytest
+
+from src.core.resource import ORMS
+
+logger = logging.getLogger(__name__)
+
+Render = Callable[[str], dict[str, str]]
+
+
+@pytest.mark.parametrize(
+    ("orm", "bulk_create", "bulk_update"),
+    [
+        (
+            "sqlalchemy",
+            "await self.session.execute(insert(Product), rows)",
+            "await self.session.execute(update(Product), rows)",
+        ),
+        (
+            "beanie",
+            "await Product.insert_many(documents)",
+            "writer = BulkWriter(ordered=False, object_class=Product)",
+        ),
+        (
+            "tortoise",
+            "await Product.bulk_create(rows, batch_size=BATCH_SIZE)",
+            "await Product.bulk_update(rows, updated, batch_size=BATCH_SIZE)",
+        ),
+    ],
+)
+def test_repository_writes_in_bulk(
+    render_product: Render, orm: str, bulk_create: str, bulk_update: str
+) -> None:
+    """Test that bulk operations use each ORM's batched API."""
+    repository = render_product(orm)["app/repositories/product.py"]
+
+    assert bulk_create in repository
+    assert bulk_update in repository
+
+
+@pytest.mark.parametrize("orm", ORMS)
+def test_repository_pages_by_keyset(render_product: Render, orm: str) -> None:
+    """Test that pages seek past the cursor instead of skipping rows."""
+    repository = render_product(orm)["app/repositories/product.py"]
+
+    assert "decode_cursor(query.cursor" in repository
+    assert ".limit(query.limit + 1)" in repository
+    assert '"price": Decimal,' in repository
+    assert "offset(" not in repository
+    assert "skip(" not in repository
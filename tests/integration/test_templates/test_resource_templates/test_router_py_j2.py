@@ -0,0 +1,158 @@
+import logging
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.resource import generate_resource, parse_resource
+from src.core.scaffold import build_context, scaffold
+
+logger = logging.getLogger(__name__)
+
+Render = Callable[[str], dict[str, str]]
+
+INCLUDE_ROUTER = """
+from app.routers.product import router as product_router  # noqa: E402
+
+app.include_router(product_router)
+"""
+PRODUCT_TESTS = """
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def product(number):
+    return {
+        "name": f"name {number % 4}",
+        "sku": f"sku-{number}",
+        "price": f"{number}.50",
+        "in_stock": number % 2 == 0,
+    }
+
+
+async def read_all(client, **params):
+    items, cursor = [], None
+    while True:
+        query = {**params, "limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/products", params=query)
+        assert response.status_code == 200, response.text
+        items += response.json()["items"]
+        if not (cursor := response.json()["next_cursor"]):
+            return items
+
+
+@pytest.mark.parametrize("sort", ["id", "name", "price", "created_at"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_pages_cover_every_row_in_order(client, sort, order):
+    response = await client.post("/products/bulk", json=[product(n) for n in range(10)])
+    assert response.json() == {"count": 10}
+
+    items = await read_all(client, sort=sort, order=order)
+
+    keys = [(float(item[sort]) if sort == "price" else item[sort], item["id"]) for item in items]
+    assert len({item["id"] for item in items}) == 10
+    assert keys == sorted(keys, reverse=order == "desc")
+
+
+async def test_filters_and_bad_cursors(client):
+    await client.post("/products/bulk", json=[product(n) for n in range(10)])
+
+    items = await read_all(client, name="name 1", in_stock="false")
+
+    assert sorted(item["sku"] for item in items) == ["sku-1", "sku-5", "sku-9"]
+    assert (await client.get("/products", params={"cursor": "x"})).status_code == 400
+    assert (await client.get("/products", params={"color": "red"})).status_code == 422
+
+
+async def test_single_and_bulk_changes(client):
+    created = (await client.post("/products", json=product(1))).json()
+    other = (await client.post("/products", json=product(2))).json()
+
+    response = await client.patch(
+        "/products/bulk",
+        json=[{"id": created["id"], "price": "9.99"}, {"id": other["id"]}],
+    )
+    assert response.json() == {"count": 1}
+    missing = await client.patch("/products/bulk", json=[{"id": 999, "price": "1"}])
+    assert missing.status_code == 404
+    updated = await client.patch(f"/products/{other['id']}", json={"name": "renamed"})
+    assert updated.json()["name"] == "renamed"
+    assert (await client.get(f"/products/{created['id']}")).json()["price"] == "9.99"
+    assert (await client.delete(f"/products/{created['id']}")).status_code == 204
+    assert (await client.get(f"/products/{created['id']}")).status_code == 404
+"""
+
+
+def test_router_template_exists(resource_template_dir: Path) -> None:
+    """Test that the router.py template exists."""
+    assert (resource_template_dir / "router.py.j2").exists()
+
+
+def test_router_declares_crud_and_bulk_routes(render_product: Render) -> None:
+    """Test that the router exposes list, CRUD and bulk endpoints."""
+    router = render_product("sqlalchemy")["app/routers/product.py"]
+
+    assert 'router = APIRouter(prefix="/products", tags=["products"])' in router
+    assert '@router.post("/bulk", status_code=status.HTTP_201_CREATED)' in router
+    assert '@router.patch("/bulk")' in router
+    assert '@router.get("/{product_id}")' in router
+    assert "query: Annotated[ProductQuery, Query()]" in router
+
+
+def test_router_uses_object_ids_for_beanie(render_product: Render) -> None:
+    """Test that Beanie resources take ObjectIds in their paths."""
+    router = render_product("beanie")["app/routers/product.py"]
+
+    assert "product_id: PydanticObjectId" in router
+
+
+def test_generated_resource_serves_sqlite(
+    product_definition: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test a generated resource end to end with the generated test fixtures."""
+    scaffold(build_context({"database_type": "sqlite"}), tmp_path)
+    generate_resource(parse_resource(product_definition), tmp_path)
+    with (tmp_path / "app" / "main.py").open("a") as main:
+        main.write(INCLUDE_ROUTER)
+    (tmp_path / "tests" / "test_products.py").write_text(PRODUCT_TESTS)
+
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "tests"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "10 passed" in result.stdout
+
+
+def test_generated_tortoise_resource_brings_its_fixtures(
+    product_definition: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test a Tortoise resource end to end with the fixtures it generates."""
+    pytest.importorskip("tortoise")
+    scaffold(build_context({}), tmp_path)
+    generated = generate_resource(
+        parse_resource(product_definition), tmp_path, "tortoise"
+    )
+    assert tmp_path / "tests" / "conftest.py" in generated.written
+    with (tmp_path / "app" / "main.py").open("a") as main:
+        main.write(INCLUDE_ROUTER)
+    (tmp_path / "tests" / "test_products.py").write_text(PRODUCT_TESTS)
+
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "tests"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "10 passed" in result.stdout
@@ -78,3 +78,32 @@ def test_launch_json_is_valid_vscode_configuration(
 
     assert isinstance(json_data["configurations"], list)
     assert len(json_data["configurations"]) > 0
+
+
+def test_launch_json_production_uses_gunicorn_config(
+    launch_json_template: Template,
+) -> None:
+    """Test that the production entry defers worker sizing to gunicorn.conf.py."""
+    json_data = json.loads(launch_json_template.render(use_gunicorn=True))
+    production = next(
+        config
+        for config in json_data["configurations"]
+        if config["name"] == "🚀 FastAPI: Production Mode"
+    )
+
+    assert production["args"] == ["main:app", "--config", "gunicorn.conf.py"]
+
+
+def test_launch_json_profile_entry(launch_json_template: Template) -> None:
+    """Test that use_profiling adds a launch entry profiling every request."""
+    context = {"app_module": "app.main"}
+    default = json.loads(launch_json_template.render(**context))["configurations"]
+    rendered = launch_json_template.render(use_profiling=True, **context)
+    configurations = json.loads(rendered)["configurations"]
+
+    added = [item for item in configurations if item not in default]
+    assert [item["name"] for item in added] == ["⏱️ Profile FastAPI"]
+    assert added[0]["module"] == "uvicorn"
+    assert added[0]["args"][0] == "app.main:app"
+    assert "--reload" not in added[0]["args"]
+    assert added[0]["env"]["PROFILE_SAMPLE_RATE"] == "1.0"
@@ -0,0 +1,280 @@
+import io
+import json
+import logging
+import tarfile
+import zipfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.commands.cli import cli
+from src.core.bench import BenchReport, BenchResult
+
+logger = logging.getLogger(__name__)
+
+
+def test_cli_help_lists_commands() -> None:
+    """Test that the CLI help lists the available commands."""
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    assert "new" in result.output
+
+
+def test_new_generates_project(tmp_path: Path) -> None:
+    """Test that `scoffy new` writes a project with the given options."""
+    destination = tmp_path / "orders"
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "new",
+            str(destination),
+            "--set",
+            "database_type=postgresql",
+            "--set",
+            "use_redis=true",
+            "--workers",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    compose = (destination / "docker-compose.yml").read_text()
+    assert "postgres:" in compose
+    assert "REDIS_URL=redis://redis:6379/0" in compose
+    assert "# MyPy Configuration for orders" in (destination / "mypy.ini").read_text()
+
+
+def test_new_reads_options_from_config_file(tmp_path: Path) -> None:
+    """Test that `scoffy new --config` loads options from a YAML file."""
+    config = tmp_path / "scoffy.yaml"
+    config.write_text("database_type: mysql\npython_version: '3.11'\n")
+
+    result = CliRunner().invoke(
+        cli, ["new", str(tmp_path / "svc"), "--config", str(config)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "FROM python:3.11" in (tmp_path / "svc" / "Dockerfile").read_text()
+    assert "mysql:" in (tmp_path / "svc" / "docker-compose.yml").read_text()
+
+
+def test_new_rejects_malformed_assignment(tmp_path: Path) -> None:
+    """Test that `--set` values without '=' are reported as usage errors."""
+    result = CliRunner().invoke(cli, ["new", str(tmp_path), "--set", "use_redis"])
+
+    assert result.exit_code == 2
+    assert "KEY=VALUE" in result.output
+
+
+def test_new_rejects_unknown_db_profile(tmp_path: Path) -> None:
+    """Test that an unparsable db_profile is a usage error, not a silent no-op."""
+    result = CliRunner().invoke(
+        cli, ["new", str(tmp_path / "svc"), "--set", "db_profile=memory:4x"]
+    )
+
+    assert result.exit_code == 2
+    assert "db_profile must be" in result.output
+    assert not (tmp_path / "svc").exists()
+
+
+def test_new_rejects_malformed_config(tmp_path: Path) -> None:
+    """Test that a --config file that does not parse is a usage error."""
+    config = tmp_path / "options.yaml"
+    config.write_text("use_redis: [true\n")
+
+    result = CliRunner().invoke(
+        cli, ["new", str(tmp_path / "svc"), "--config", str(config)]
+    )
+
+    assert result.exit_code == 2
+    assert "Invalid value for --config" in result.output
+    assert "not valid YAML" in result.output
+
+
+def test_update_reports_changed_files(tmp_path: Path) -> None:
+    """Test that `scoffy update` rewrites only the files affected by an option."""
+    runner = CliRunner()
+    runner.invoke(cli, ["new", str(tmp_path), "--set", "use_redis=true"])
+
+    result = runner.invoke(cli, ["update", str(tmp_path), "--set", "redis_port=6380"])
+
+    assert result.exit_code == 0, result.output
+    assert "updated docker-compose.yml" in result.output
+    assert "mypy.ini" not in result.output
+
+
+def test_update_refuses_directory_without_manifest(tmp_path: Path) -> None:
+    """Test that `scoffy update` reports a missing manifest without a traceback."""
+    result = CliRunner().invoke(cli, ["update", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "only projects generated by scoffy" in result.output
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_batch_reports_each_project(tmp_path: Path) -> None:
+    """Test that `scoffy batch` reports per-project results and fails on errors."""
+    manifest = tmp_path / "projects.jsonl"
+    manifest.write_text('{"name": "a"}\n{"use_redis": true}\n')
+
+    result = CliRunner().invoke(
+        cli, ["batch", str(manifest), "--output-dir", str(tmp_path / "out")]
+    )
+
+    assert result.exit_code == 1
+    assert "ok" in result.output
+    assert "FAIL" in result.output
+    assert "1 generated, 1 failed" in result.output
+    assert (tmp_path / "out" / "a" / "Dockerfile").is_file()
+
+
+def test_bench_saves_results_and_flags_regressions(tmp_path: Path) -> None:
+    """Test that `scoffy bench` saves JSON and fails on a faster baseline."""
+    output = tmp_path / "bench.json"
+    baseline = tmp_path / "baseline.json"
+    baseline.write_bytes(
+        BenchReport(results={"compile": BenchResult("compile", (1e-9,))}).to_bytes()
+    )
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "bench",
+            "--repeat",
+            "1",
+            "--batch-size",
+            "1",
+            "--output",
+            str(output),
+            "--compare",
+            str(baseline),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "1 benchmark(s) regressed by more than 10%: compile" in result.output
+    assert "compile" in BenchReport.from_bytes(output.read_bytes()).results
+
+
+def test_new_reports_timings_and_writes_trace(tmp_path: Path) -> None:
+    """Test that --timings prints a phase table and --trace writes trace events."""
+    trace = tmp_path / "trace.json"
+
+    result = CliRunner().invoke(
+        cli,
+        ["new", str(tmp_path / "svc"), "--timings", "--trace", str(trace)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "resolve context" in result.output
+    assert "write files" in result.output
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert {"command", "context", "load", "render", "write"} <= {
+        event["cat"] for event in events
+    }
+
+
+def test_bench_rejects_malformed_baseline(tmp_path: Path) -> None:
+    """Test that a baseline entry without samples is a usage error."""
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text('{"version": 1, "results": {"compile": {"median": 1}}}')
+
+    result = CliRunner().invoke(cli, ["bench", "--compare", str(baseline)])
+
+    assert result.exit_code == 2
+    assert "Invalid value for --compare" in result.output
+    assert "'compile' needs a non-empty list of samples" in result.output
+
+
+def test_archive_writes_zip_named_after_output(tmp_path: Path) -> None:
+    """Test that `scoffy archive x.zip` writes a zip rooted at the project name."""
+    output = tmp_path / "orders.zip"
+
+    result = CliRunner().invoke(
+        cli, ["archive", str(output), "--set", "database_type=postgresql"]
+    )
+
+    assert result.exit_code == 0, result.output
+    with zipfile.ZipFile(output) as archive:
+        assert "orders/Dockerfile" in archive.namelist()
+        assert "orders" in archive.read("orders/mypy.ini").decode()
+
+
+def test_archive_streams_tarball_to_stdout() -> None:
+    """Test that `scoffy archive` without OUTPUT writes a tar.gz to stdout."""
+    result = CliRunner().invoke(cli, ["archive", "--name", "svc"])
+
+    assert result.exit_code == 0
+    with tarfile.open(fileobj=io.BytesIO(result.stdout_bytes), mode="r:gz") as tar:
+        assert "svc/docker-compose.yml" in tar.getnames()
+
+
+def test_generate_resource_prints_next_steps(tmp_path: Path) -> None:
+    """Test that `scoffy generate resource` writes files and explains wiring."""
+    runner = CliRunner()
+    runner.invoke(cli, ["new", str(tmp_path), "--set", "database_type=sqlite"])
+    definition = tmp_path / "product.yaml"
+    definition.write_text(
+        "name: product\nfields:\n  title: {type: str, sortable: true}\n"
+    )
+
+    result = runner.invoke(
+        cli, ["generate", "resource", str(definition), str(tmp_path)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert str(tmp_path / "app" / "routers" / "product.py") in result.output
+    assert "app.include_router(product_router)" in result.output
+    assert (tmp_path / "app" / "repositories" / "product.py").is_file()
+
+
+def test_generate_resource_reports_timings_and_writes_trace(tmp_path: Path) -> None:
+    """Test that `scoffy generate resource` supports --timings and --trace."""
+    definition = tmp_path / "product.yaml"
+    definition.write_text("name: product\nfields:\n  title: str\n")
+    trace = tmp_path / "trace.json"
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "generate",
+            "resource",
+            str(definition),
+            str(tmp_path),
+            "--orm",
+            "sqlalchemy",
+            "--timings",
+            "--trace",
+            str(trace),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "write files" in result.output
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert {"command", "render", "write"} <= {event["cat"] for event in events}
+
+
+def test_generate_resource_rejects_invalid_definition(tmp_path: Path) -> None:
+    """Test that a bad resource definition is reported as a usage error."""
+    definition = tmp_path / "product.yaml"
+    definition.write_text("name: product\nfields:\n  price: money\n")
+
+    result = CliRunner().invoke(
+        cli, ["generate", "resource", str(definition), "--orm", "sqlalchemy"]
+    )
+
+    assert result.exit_code == 2
+    assert "unknown type" in result.output
+
+
+def test_startup_report_reports_a_failing_command() -> None:
+    """Test that a failing measured command is an error, not a traceback."""
+    result = CliRunner().invoke(cli, ["startup-report", "bogus"])
+
+    assert result.exit_code == 1
+    assert "`scoffy bogus` exited with status 2" in result.output
+    assert "No such command 'bogus'" in result.output
+    assert "import time:" not in result.output
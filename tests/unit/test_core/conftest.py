@@ -0,0 +1,20 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.core.engine import TEMPLATES_DIR, TemplateEngine
+
+
+@pytest.fixture
+def templates_copy(tmp_path: Path) -> Path:
+    """Return a writable copy of the scoffy templates directory."""
+    target = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, target, ignore=shutil.ignore_patterns("_compiled"))
+    return target
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> TemplateEngine:
+    """Return an engine with an isolated bytecode cache."""
+    return TemplateEngine(cache_dir=tmp_path / "cache", precompiled_dir=None)
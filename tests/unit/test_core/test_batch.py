@@ -0,0 +1,98 @@
+import json
+import logging
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.core.batch import iter_specs, run_batch
+from src.core.engine import TemplateEngine
+
+logger = logging.getLogger(__name__)
+
+
+def test_iter_specs_streams_jsonl(tmp_path: Path) -> None:
+    """Test that JSONL manifests yield one spec per non-empty line."""
+    manifest = tmp_path / "projects.jsonl"
+    manifest.write_text('{"name": "a"}\n\n{"name": "b", "use_redis": true}\n')
+
+    assert list(iter_specs(manifest)) == [
+        {"name": "a"},
+        {"name": "b", "use_redis": True},
+    ]
+
+
+def test_iter_specs_reads_yaml_documents_and_lists(tmp_path: Path) -> None:
+    """Test that YAML manifests accept both documents and lists of projects."""
+    manifest = tmp_path / "projects.yaml"
+    manifest.write_text("name: a\n---\n- name: b\n- name: c\n")
+
+    assert [spec["name"] for spec in iter_specs(manifest)] == ["a", "b", "c"]
+
+
+def test_iter_specs_yields_yaml_errors(tmp_path: Path) -> None:
+    """Test that a malformed YAML document is yielded after the valid ones."""
+    manifest = tmp_path / "projects.yaml"
+    manifest.write_text("name: a\n---\nname: [b\n")
+
+    specs = list(iter_specs(manifest))
+
+    assert specs[0] == {"name": "a"}
+    assert isinstance(specs[1], yaml.YAMLError)
+    assert len(specs) == 2
+
+
+def test_run_batch_generates_every_project(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that each spec is generated into its own directory."""
+    specs = [
+        {"name": "orders", "database_type": "postgresql"},
+        {"name": "users", "database_type": "mongodb", "path": "nested/users"},
+    ]
+
+    entries = list(run_batch(specs, tmp_path, engine=engine, workers=1))
+
+    assert [entry.ok for entry in entries] == [True, True]
+    assert "postgres:" in (tmp_path / "orders" / "docker-compose.yml").read_text()
+    assert "mongodb:" in (tmp_path / "nested/users/docker-compose.yml").read_text()
+    assert all(entry.files > 0 and entry.seconds >= 0 for entry in entries)
+
+
+def test_run_batch_reports_failures_without_aborting(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that invalid specs fail individually and the batch continues."""
+    manifest = tmp_path / "projects.jsonl"
+    manifest.write_text(
+        "\n".join(
+            [
+                json.dumps({"database_type": "mysql"}),
+                "{not json",
+                json.dumps({"name": "ok"}),
+            ]
+        )
+    )
+
+    entries = list(run_batch(iter_specs(manifest), tmp_path / "out", engine=engine))
+
+    assert [entry.name for entry in entries] == ["#1", "#2", "ok"]
+    assert entries[0].error == "ValueError: project spec has no 'name'"
+    assert entries[1].error is not None
+    assert entries[1].error.startswith("JSONDecodeError")
+    assert entries[2].ok
+
+
+@pytest.mark.parametrize("path", ["../escaped", "/tmp/escaped", "."])
+def test_run_batch_keeps_projects_inside_output_dir(
+    engine: TemplateEngine, tmp_path: Path, path: str
+) -> None:
+    """Test that a spec path outside the output directory is rejected."""
+    output_dir = tmp_path / "out"
+
+    (entry,) = run_batch([{"name": "x", "path": path}], output_dir, engine=engine)
+
+    assert entry.error is not None
+    assert "is not inside" in entry.error
+    assert not (tmp_path / "escaped").exists()
+    assert not output_dir.exists()
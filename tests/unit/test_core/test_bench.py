@@ -0,0 +1,103 @@
+import logging
+
+import pytest
+
+from src.core.bench import (
+    BENCH_DATABASE_TYPES,
+    BenchReport,
+    BenchResult,
+    compare,
+    format_comparisons,
+    measure,
+    run_benchmarks,
+)
+from src.core.engine import TemplateEngine
+
+logger = logging.getLogger(__name__)
+
+
+def test_measure_warms_up_before_sampling() -> None:
+    """Test that measure calls the function once more than it samples."""
+    calls: list[int] = []
+
+    result = measure("noop", lambda: calls.append(1), repeat=3)
+
+    assert len(calls) == 4
+    assert len(result.samples) == 3
+    assert result.best <= result.median
+
+
+def test_run_benchmarks_covers_suite(engine: TemplateEngine) -> None:
+    """Test that the suite times every template, database type and a batch."""
+    report = run_benchmarks(repeat=1, batch_size=2)
+
+    names = set(report.results)
+    assert {"environment", "compile", "batch/2"} <= names
+    assert {f"render/{name}" for name in engine.list_templates()} <= names
+    assert {
+        f"scaffold/{database_type or 'none'}" for database_type in BENCH_DATABASE_TYPES
+    } <= names
+    assert report.environment["python"]
+
+
+def test_bench_report_round_trips_through_json() -> None:
+    """Test that saved results load back with the same samples."""
+    report = BenchReport(
+        results={"compile": BenchResult("compile", (0.2, 0.1, 0.3))},
+        environment={"python": "3.12.1"},
+    )
+
+    loaded = BenchReport.from_bytes(report.to_bytes())
+
+    assert loaded.results["compile"].samples == (0.2, 0.1, 0.3)
+    assert loaded.results["compile"].median == 0.2
+    assert loaded.environment == {"python": "3.12.1"}
+
+
+def test_bench_report_rejects_unknown_version() -> None:
+    """Test that results from another format version are refused."""
+    with pytest.raises(ValueError, match="unsupported benchmark version"):
+        BenchReport.from_bytes(b'{"version": 99}')
+
+
+@pytest.mark.parametrize(
+    ("raw", "message"),
+    [
+        (b"[1]", "must be a JSON object"),
+        (b'{"version": 1, "results": []}', "must be objects"),
+        (b'{"version": 1, "results": {"compile": {}}}', "'compile' needs"),
+        (b'{"version": 1, "results": {"compile": [0.1]}}', "'compile' needs"),
+        (b'{"version": 1, "results": {"compile": {"samples": []}}}', "needs"),
+        (b'{"version": 1, "results": {"compile": {"samples": ["x"]}}}', "needs"),
+    ],
+)
+def test_bench_report_rejects_malformed_entries(raw: bytes, message: str) -> None:
+    """Test that a baseline with malformed entries raises ValueError."""
+    with pytest.raises(ValueError, match=message):
+        BenchReport.from_bytes(raw)
+
+
+def test_compare_flags_regressions_beyond_threshold() -> None:
+    """Test that only medians slower than the threshold are regressions."""
+    baseline = BenchReport(
+        results={
+            "fast": BenchResult("fast", (1.0,)),
+            "slow": BenchResult("slow", (1.0,)),
+            "gone": BenchResult("gone", (1.0,)),
+        }
+    )
+    current = BenchReport(
+        results={
+            "fast": BenchResult("fast", (1.05,)),
+            "slow": BenchResult("slow", (1.5,)),
+            "new": BenchResult("new", (1.0,)),
+        }
+    )
+
+    comparisons = compare(baseline, current, threshold=0.1)
+
+    assert [(item.name, item.regressed) for item in comparisons] == [
+        ("fast", False),
+        ("slow", True),
+    ]
+    assert "REGRESSED" in format_comparisons(comparisons)
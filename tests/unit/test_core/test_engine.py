@@ -0,0 +1,129 @@
+import logging
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+from src.core.engine import (
+    PRECOMPILED_DIR,
+    TEMPLATE_GROUPS,
+    TEMPLATES_DIR,
+    TemplateEngine,
+    default_precompiled_dir,
+    get_engine,
+    precompile_templates,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_engine_lists_templates_of_every_group(engine: TemplateEngine) -> None:
+    """Test that one engine sees the templates of all groups."""
+    names = engine.list_templates()
+
+    for group in TEMPLATE_GROUPS:
+        assert engine.list_templates(group)
+    assert "docker/Dockerfile.j2" in names
+    assert "code_quality/ruff.toml.j2" in names
+    assert all(name.endswith(".j2") for name in names)
+
+
+def test_engine_renders_like_a_plain_environment(engine: TemplateEngine) -> None:
+    """Test that the shared engine renders identically to a per-group environment."""
+    context = {"python_version": "3.12", "expose_port": 8000, "app_module": "main"}
+    plain = Environment(loader=FileSystemLoader(TEMPLATES_DIR / "docker"))
+
+    expected = plain.get_template("Dockerfile.j2").render(**context)
+
+    assert engine.render("docker/Dockerfile.j2", context) == expected
+
+
+def test_engine_persists_bytecode_between_instances(tmp_path: Path) -> None:
+    """Test that a second engine loads bytecode written by the first one."""
+    cache_dir = tmp_path / "cache"
+    TemplateEngine(cache_dir=cache_dir, precompiled_dir=None).warm()
+    cached = sorted(cache_dir.iterdir())
+
+    TemplateEngine(cache_dir=cache_dir, precompiled_dir=None).warm()
+
+    assert len(cached) == len(TemplateEngine().list_templates())
+    assert sorted(cache_dir.iterdir()) == cached
+
+
+def test_bytecode_cache_is_keyed_by_template_content(
+    templates_copy: Path, tmp_path: Path
+) -> None:
+    """Test that editing a template adds a new cache entry instead of reusing one."""
+    cache_dir = tmp_path / "cache"
+    TemplateEngine(templates_copy, cache_dir=cache_dir).get_template(
+        "docker/Dockerfile.j2"
+    )
+    dockerfile = templates_copy / "docker" / "Dockerfile.j2"
+    dockerfile.write_text(dockerfile.read_text() + "\n# edited\n")
+
+    engine = TemplateEngine(templates_copy, cache_dir=cache_dir)
+
+    assert engine.render("docker/Dockerfile.j2").endswith("# edited")
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_template_meta_is_persisted_between_instances(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a warm cache answers manifest lookups without parsing."""
+    cache_dir = tmp_path / "cache"
+    name = "resource/router.py.j2"
+    first = TemplateEngine(cache_dir=cache_dir, precompiled_dir=None)
+    expected = (first.referenced_variables(name), first.template_hash(name))
+
+    second = TemplateEngine(cache_dir=cache_dir, precompiled_dir=None)
+    monkeypatch.setattr(second.environment, "parse", pytest.fail, raising=False)
+
+    assert (second.referenced_variables(name), second.template_hash(name)) == expected
+
+
+def test_engine_without_writable_cache_dir_still_renders(tmp_path: Path) -> None:
+    """Test that an unusable cache directory falls back to in-memory caching."""
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    engine = TemplateEngine(cache_dir=blocker / "cache", precompiled_dir=None)
+
+    assert engine.bytecode_cache is None
+    assert "FROM python:3.12" in engine.render(
+        "docker/Dockerfile.j2", {"python_version": "3.12"}
+    )
+
+
+def test_precompiled_templates_are_used_without_sources(
+    templates_copy: Path, tmp_path: Path
+) -> None:
+    """Test that precompiled modules are loaded instead of the template sources."""
+    compiled_dir = tmp_path / "compiled"
+    names = precompile_templates(compiled_dir, templates_dir=templates_copy)
+    expected = TemplateEngine(templates_copy, use_bytecode_cache=False).render(
+        "git/.gitignore.j2"
+    )
+    for name in names:
+        (templates_copy / name).unlink()
+
+    engine = TemplateEngine(
+        templates_copy, precompiled_dir=compiled_dir, use_bytecode_cache=False
+    )
+
+    assert len(list(compiled_dir.glob("*.py"))) == len(names)
+    assert engine.render("git/.gitignore.j2") == expected
+
+
+def test_precompiled_templates_are_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that precompiled modules are only loaded with SCOFFY_PRECOMPILED=1."""
+    monkeypatch.delenv("SCOFFY_PRECOMPILED", raising=False)
+    assert default_precompiled_dir() is None
+
+    monkeypatch.setenv("SCOFFY_PRECOMPILED", "1")
+    assert default_precompiled_dir() == PRECOMPILED_DIR
+
+
+def test_get_engine_is_shared() -> None:
+    """Test that get_engine returns a single process-wide engine."""
+    assert get_engine() is get_engine()
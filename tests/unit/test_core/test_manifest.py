@@ -0,0 +1,90 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.core.engine import TemplateEngine
+from src.core.manifest import MANIFEST_PATH, Manifest, ManifestEntry, context_hash
+from src.core.scaffold import build_context, scaffold
+
+logger = logging.getLogger(__name__)
+
+
+def test_referenced_variables_come_from_the_template_ast(
+    engine: TemplateEngine,
+) -> None:
+    """Test that only variables a template reads are reported."""
+    mypy_vars = engine.referenced_variables("code_quality/mypy.ini.j2")
+    compose_vars = engine.referenced_variables("docker/docker-compose.yml.j2")
+
+    assert "redis_port" in compose_vars
+    assert "redis_port" not in mypy_vars
+    assert "modules" in mypy_vars
+    assert "module" not in mypy_vars
+
+
+def test_context_hash_ignores_unreferenced_keys(engine: TemplateEngine) -> None:
+    """Test that changing an unrelated option keeps a template's context hash."""
+    base = build_context({"use_redis": True})
+    changed = {**base, "redis_port": 6380}
+
+    mypy = "code_quality/mypy.ini.j2"
+    compose = "docker/docker-compose.yml.j2"
+
+    assert context_hash(engine, mypy, base) == context_hash(engine, mypy, changed)
+    assert context_hash(engine, compose, base) != context_hash(engine, compose, changed)
+
+
+def test_context_hash_distinguishes_missing_from_none(engine: TemplateEngine) -> None:
+    """Test that an absent option and an explicit None hash differently."""
+    template = "docker/docker-compose.yml.j2"
+
+    assert context_hash(engine, template, {}) != context_hash(
+        engine, template, {"app_name": None}
+    )
+
+
+def test_context_hash_covers_included_templates(
+    templates_copy: Path, tmp_path: Path
+) -> None:
+    """Test that a key read only by an included partial changes the hash."""
+    (templates_copy / "git" / "_footer.j2").write_text("{{ footer }}\n")
+    (templates_copy / "git" / "page.j2").write_text(
+        '{{ title }}\n{% include "git/_footer.j2" %}\n'
+    )
+    engine = TemplateEngine(templates_copy, cache_dir=tmp_path / "cache")
+
+    base = {"title": "a", "footer": "b"}
+
+    assert engine.referenced_variables("git/page.j2") == {"title", "footer"}
+    assert context_hash(engine, "git/page.j2", base) != context_hash(
+        engine, "git/page.j2", {**base, "footer": "c"}
+    )
+
+
+def test_manifest_round_trips(tmp_path: Path) -> None:
+    """Test that a manifest survives serialisation unchanged."""
+    manifest = Manifest(
+        context={"use_redis": True},
+        files={"Dockerfile": ManifestEntry("docker/Dockerfile.j2", "a", "b", "c")},
+    )
+
+    assert Manifest.from_bytes(manifest.to_bytes()) == manifest
+
+
+def test_manifest_rejects_unknown_version() -> None:
+    """Test that manifests written by an incompatible scoffy are refused."""
+    with pytest.raises(ValueError, match="unsupported manifest version"):
+        Manifest.from_bytes(b'{"version": 99}')
+
+
+def test_scaffold_writes_manifest(engine: TemplateEngine, tmp_path: Path) -> None:
+    """Test that a freshly scaffolded project records its manifest."""
+    scaffold(build_context({"use_redis": True}), tmp_path, engine=engine)
+
+    manifest = Manifest.load(tmp_path)
+
+    assert (tmp_path / MANIFEST_PATH).is_file()
+    assert manifest is not None
+    assert manifest.context["use_redis"] is True
+    assert manifest.files["Dockerfile"].template == "docker/Dockerfile.j2"
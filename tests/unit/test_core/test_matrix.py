@@ -0,0 +1,81 @@
+import itertools
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.core.engine import TemplateEngine
+from src.core.matrix import (
+    VALIDATORS,
+    full_combinations,
+    pairwise_combinations,
+    run_matrix,
+    validate_project,
+)
+
+logger = logging.getLogger(__name__)
+
+SPACE = {
+    "a": (None, 1, 2),
+    "b": (False, True),
+    "c": ("x", "y", "z"),
+    "d": (False, True),
+}
+
+
+def test_full_combinations_is_the_product() -> None:
+    """Test that the full matrix enumerates every combination once."""
+    combinations = list(full_combinations(SPACE))
+
+    assert len(combinations) == 3 * 2 * 3 * 2
+    assert len({tuple(sorted(c.items(), key=str)) for c in combinations}) == 36
+
+
+def test_pairwise_combinations_cover_every_pair() -> None:
+    """Test that every value pair of any two options appears in some row."""
+    rows = pairwise_combinations(SPACE)
+
+    for first, second in itertools.combinations(SPACE, 2):
+        pairs = {(row[first], row[second]) for row in rows}
+        assert pairs == set(itertools.product(SPACE[first], SPACE[second]))
+    assert len(rows) < 36
+
+
+def test_compose_validator_rejects_empty_sections() -> None:
+    """Test that compose keys emptied by template logic are reported."""
+    validator = VALIDATORS["docker-compose.yml"]
+    validator("services:\n  app:\n    depends_on:\n      - db\n")
+
+    with pytest.raises(ValueError, match=r"services\.app\.depends_on is empty"):
+        validator("services:\n  app:\n    depends_on:\n")
+
+
+def test_validate_project_reports_unparsable_files(templates_copy: Path) -> None:
+    """Test that a template rendering invalid JSON is reported with its options."""
+    launch = templates_copy / "vscode" / "launch.json.j2"
+    launch.write_text(
+        launch.read_text().replace('"version": "0.2.0",', '"version": "0.2.0",,', 1)
+    )
+    engine = TemplateEngine(
+        templates_copy, precompiled_dir=None, use_bytecode_cache=False
+    )
+
+    files, failures = validate_project({"use_redis": True}, engine)
+
+    assert files > 0
+    assert [failure.path for failure in failures] == [".vscode/launch.json"]
+    assert failures[0].error.startswith("JSONDecodeError")
+    assert failures[0].options == {"use_redis": True}
+
+
+def test_run_matrix_across_processes(tmp_path: Path) -> None:
+    """Test that worker processes render and validate combinations."""
+    combinations = pairwise_combinations(
+        {"database_type": (None, "postgresql", "mongodb"), "use_redis": (False, True)}
+    )
+
+    report = run_matrix(combinations, workers=2, cache_dir=tmp_path / "cache")
+
+    assert report.ok, [failure.format() for failure in report.failures]
+    assert report.combinations == len(combinations)
+    assert report.files > len(combinations)
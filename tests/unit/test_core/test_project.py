@@ -0,0 +1,129 @@
+import io
+import logging
+import tarfile
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+from src.core.engine import TemplateEngine
+from src.core.manifest import MANIFEST_PATH
+from src.core.project import generate, iter_project, stream
+from src.core.scaffold import (
+    PROJECT_TEMPLATES,
+    RenderedFile,
+    build_context,
+    scaffold,
+)
+from src.core.sinks import DirectorySink, TarSink, ZipSink
+
+logger = logging.getLogger(__name__)
+
+
+def test_generate_returns_files_in_memory(engine: TemplateEngine) -> None:
+    """Test that generate maps every enabled output path to its bytes."""
+    project = generate({"database_type": "postgresql"}, engine=engine)
+    context = build_context({"database_type": "postgresql"})
+
+    assert list(project) == [
+        *(spec.output for spec in PROJECT_TEMPLATES if spec.enabled(context)),
+        MANIFEST_PATH,
+    ]
+    assert "postgres:" in project.text("docker-compose.yml")
+    assert project.context["database_type"] == "postgresql"
+    with pytest.raises(KeyError):
+        project["missing.txt"]
+
+
+def test_generate_resolves_the_context_once(
+    engine: TemplateEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that generate builds the context only once."""
+    calls: list[object] = []
+
+    def counting(spec: object = None) -> dict[str, object]:
+        calls.append(spec)
+        return build_context({"use_redis": True})
+
+    monkeypatch.setattr("src.core.project.build_context", counting)
+
+    project = generate({"use_redis": True}, engine=engine)
+
+    assert calls == [{"use_redis": True}]
+    assert project.context["use_redis"] is True
+
+
+def test_generate_matches_scaffold_output(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that the in-memory project is byte-identical to a scaffold run."""
+    options = {"database_type": "mongodb", "use_redis": True}
+    scaffold(build_context(options), tmp_path, engine=engine)
+
+    project = generate(options, engine=engine)
+
+    assert {path: (tmp_path / path).read_bytes() for path in project} == dict(project)
+
+
+def test_generate_without_manifest(engine: TemplateEngine) -> None:
+    """Test that the manifest can be left out of the generated files."""
+    assert MANIFEST_PATH not in generate(engine=engine, manifest=False)
+
+
+def test_directory_sink_writes_project(engine: TemplateEngine, tmp_path: Path) -> None:
+    """Test that the directory sink writes every file below its destination."""
+    sink = DirectorySink(tmp_path / "svc", workers=2)
+
+    project = generate(engine=engine, sink=sink)
+
+    assert sink.written == [tmp_path / "svc" / path for path in project]
+    assert (tmp_path / "svc" / "Dockerfile").read_bytes() == project["Dockerfile"]
+
+
+def test_tar_sink_streams_gzipped_archive(engine: TemplateEngine) -> None:
+    """Test that the tar sink writes a gzip tarball under the given prefix."""
+    buffer = io.BytesIO()
+
+    project = generate(engine=engine, sink=TarSink(buffer, prefix="svc", mtime=0))
+
+    buffer.seek(0)
+    with tarfile.open(fileobj=buffer, mode="r:gz") as archive:
+        names = archive.getnames()
+        dockerfile = archive.extractfile("svc/Dockerfile")
+        assert dockerfile is not None
+        assert dockerfile.read() == project["Dockerfile"]
+    assert names == [f"svc/{path}" for path in project]
+
+
+def test_zip_sink_writes_archive(engine: TemplateEngine) -> None:
+    """Test that the zip sink writes every file into a zip archive."""
+    buffer = io.BytesIO()
+
+    project = generate(engine=engine, sink=ZipSink(buffer))
+
+    with zipfile.ZipFile(buffer) as archive:
+        assert archive.namelist() == list(project)
+        assert archive.read(".gitignore") == project[".gitignore"]
+
+
+def test_stream_hands_files_to_sink_one_by_one(engine: TemplateEngine) -> None:
+    """Test that stream feeds the sink lazily, ending with the manifest."""
+    seen: list[str] = []
+
+    class RecordingSink:
+        def write(self, files: Iterable[RenderedFile]) -> None:
+            assert not isinstance(files, list | tuple)
+            seen.extend(rendered.path for rendered in files)
+
+    stream(RecordingSink(), {"use_redis": True}, engine=engine, workers=4)
+
+    assert seen == list(generate({"use_redis": True}, engine=engine))
+    assert seen[-1] == MANIFEST_PATH
+
+
+def test_streamed_manifest_matches_generated_one(engine: TemplateEngine) -> None:
+    """Test that hashing files on the fly yields the same manifest."""
+    streamed = {rendered.path: rendered for rendered in iter_project(engine=engine)}
+
+    assert streamed[MANIFEST_PATH].content == generate(engine=engine)[MANIFEST_PATH]
@@ -0,0 +1,228 @@
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.engine import TemplateEngine
+from src.core.resource import (
+    default_orm,
+    generate_resource,
+    load_resource,
+    parse_resource,
+    resource_context,
+)
+from src.core.scaffold import build_context, scaffold
+
+logger = logging.getLogger(__name__)
+
+ORDER_LINE: dict[str, Any] = {
+    "name": "order-line",
+    "fields": {
+        "quantity": {"type": "int", "sortable": True, "filterable": True},
+        "code": {"type": "str", "unique": True, "filterable": True},
+        "status": {"type": "str", "filterable": True},
+        "note": {"type": "text", "required": False},
+    },
+}
+
+
+def test_parse_resource_derives_names() -> None:
+    """Test that the class, module, plural and table names follow the name."""
+    resource = parse_resource(ORDER_LINE)
+
+    assert resource.name == "OrderLine"
+    assert resource.module == "order_line"
+    assert resource.plural == "order_lines"
+    assert resource.table == "order_lines"
+    assert [item.name for item in resource.sortable] == ["quantity"]
+
+
+def test_parse_resource_accepts_type_shorthand() -> None:
+    """Test that a field may be given as just its type."""
+    resource = parse_resource(
+        {"name": "category", "plural": "categories", "fields": {"title": "str"}}
+    )
+
+    assert resource.plural == "categories"
+    assert resource.fields[0].type == "str"
+    assert resource.fields[0].required
+
+
+def test_only_fields_without_another_index_get_their_own() -> None:
+    """Test that unique and sortable fields do not get a second index."""
+    indexed = {item.name: item.indexed for item in parse_resource(ORDER_LINE).fields}
+
+    assert indexed == {
+        "quantity": False,
+        "code": False,
+        "status": True,
+        "note": False,
+    }
+
+
+@pytest.mark.parametrize(
+    ("fields", "message"),
+    [
+        ({"id": "int"}, "reserved"),
+        ({"cursor": "str"}, "reserved"),
+        ({"Title": "str"}, "lowercase Python identifier"),
+        ({"title": "varchar"}, "unknown type"),
+        ({"title": {"type": "str", "indexed": True}}, "unknown option"),
+        ({"data": {"type": "json", "filterable": True}}, "cannot be filterable"),
+        ({"rank": {"type": "int", "sortable": True, "required": False}}, "required"),
+        ({"count": {"type": "int", "default": "now"}}, "default 'now'"),
+        ({True: "bool"}, "quote it"),
+    ],
+)
+def test_parse_resource_rejects_invalid_fields(
+    fields: dict[Any, Any], message: str
+) -> None:
+    """Test that mistakes in a definition are reported with a ValueError."""
+    with pytest.raises(ValueError, match=message):
+        parse_resource({"name": "thing", "fields": fields})
+
+
+@pytest.mark.parametrize(
+    ("definition", "message"),
+    [
+        ({"name": "Product Line"}, "'product line' is not a lowercase identifier"),
+        ({"name": "class"}, "'class' is a Python keyword"),
+        ({"name": "2fa"}, "module '2fa'"),
+        ({"name": "thing", "plural": "the-things"}, "plural 'the-things'"),
+        ({"name": "thing", "table": "import"}, "table 'import'"),
+        ({"name": "thing", "max_page_size": [1]}, "max_page_size must be an integer"),
+        ({"name": "thing", "default_page_size": {}}, "must be an integer"),
+        ({"name": "thing", "max_page_size": 0}, "must be at least 1"),
+        ({"name": "thing", "default_page_size": 300}, "exceeds max_page_size 200"),
+    ],
+)
+def test_parse_resource_rejects_invalid_names_and_page_sizes(
+    definition: dict[str, Any], message: str
+) -> None:
+    """Test that names that are not identifiers and bad page sizes are refused."""
+    with pytest.raises(ValueError, match=message):
+        parse_resource({**definition, "fields": {"title": "str"}})
+
+
+def test_load_resource_reports_invalid_yaml(tmp_path: Path) -> None:
+    """Test that a YAML syntax error becomes a ValueError."""
+    definition = tmp_path / "thing.yaml"
+    definition.write_text("name: thing\nfields: [unclosed\n")
+
+    with pytest.raises(ValueError, match="not valid YAML"):
+        load_resource(definition)
+
+
+def test_resource_context_collects_imports() -> None:
+    """Test that schema and repository imports follow the field types."""
+    resource = parse_resource(
+        {
+            "name": "event",
+            "fields": {
+                "starts": {"type": "datetime", "default": "now", "sortable": True},
+                "cost": {"type": "decimal"},
+            },
+        }
+    )
+
+    context = resource_context(resource, "sqlalchemy", {"project_name": "x"})[
+        "resource"
+    ]
+
+    assert context["schema_imports"] == [
+        "from datetime import UTC, datetime",
+        "from decimal import Decimal",
+        "from typing import Literal",
+    ]
+    assert context["repository_imports"] == [
+        "from collections.abc import Sequence",
+        "from datetime import datetime",
+        "from typing import Annotated, Any",
+    ]
+    assert context["sort_types"] == {"starts": "datetime"}
+
+
+@pytest.mark.parametrize(
+    ("options", "orm"),
+    [
+        ({"database_type": "postgresql"}, "sqlalchemy"),
+        ({"database_type": "sqlite"}, "sqlalchemy"),
+        ({"database_type": "mongodb"}, "beanie"),
+    ],
+)
+def test_default_orm_follows_database_type(options: dict[str, str], orm: str) -> None:
+    """Test that the ORM is picked from the project's database."""
+    assert default_orm(build_context(options)) == orm
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"database_type": "mongodb", "mongo_driver": "motor"}]
+)
+def test_default_orm_needs_a_supported_database(options: dict[str, str]) -> None:
+    """Test that projects without an ORM-backed database need --orm."""
+    with pytest.raises(ValueError, match="--orm"):
+        default_orm(build_context(options))
+
+
+def test_generate_resource_writes_into_project(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that the resource is generated for the project's database."""
+    scaffold(build_context({"database_type": "mongodb"}), tmp_path, engine=engine)
+
+    result = generate_resource(parse_resource(ORDER_LINE), tmp_path, engine=engine)
+
+    assert result.orm == "beanie"
+    assert result.kept == []
+    assert tmp_path / "app" / "routers" / "order_line.py" in result.written
+    assert (tmp_path / "app" / "models" / "__init__.py").read_text() == ""
+    model = (tmp_path / "app" / "models" / "order_line.py").read_text()
+    assert "class OrderLine(Document):" in model
+
+
+def test_generate_resource_outside_a_project_needs_orm(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that a directory without manifest asks for --orm."""
+    with pytest.raises(ValueError, match=r"has no \.scoffy/manifest\.json"):
+        generate_resource(parse_resource(ORDER_LINE), tmp_path, engine=engine)
+
+    assert not (tmp_path / "app").exists()
+
+
+def test_generate_resource_keeps_shared_files(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that a second resource reuses the shared modules as they are."""
+    generate_resource(parse_resource(ORDER_LINE), tmp_path, "tortoise", engine=engine)
+    (tmp_path / "app" / "pagination.py").write_text("# edited\n")
+
+    result = generate_resource(
+        parse_resource({"name": "invoice", "fields": {"total": "decimal"}}),
+        tmp_path,
+        "tortoise",
+        engine=engine,
+    )
+
+    assert "app/pagination.py" in result.kept
+    assert "app/models/__init__.py" in result.kept
+    assert (tmp_path / "app" / "pagination.py").read_text() == "# edited\n"
+    assert (tmp_path / "app" / "models" / "invoice.py").exists()
+
+
+def test_generate_resource_replaces_files_only_with_force(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that regenerating a resource needs force."""
+    resource = parse_resource(ORDER_LINE)
+    generate_resource(resource, tmp_path, "sqlalchemy", engine=engine)
+    model = tmp_path / "app" / "models" / "order_line.py"
+    model.write_text("# edited\n")
+
+    with pytest.raises(FileExistsError, match=r"app/models/order_line\.py"):
+        generate_resource(resource, tmp_path, "sqlalchemy", engine=engine)
+    assert model.read_text() == "# edited\n"
+
+    generate_resource(resource, tmp_path, "sqlalchemy", force=True, engine=engine)
+    assert "class OrderLine(Base):" in model.read_text()
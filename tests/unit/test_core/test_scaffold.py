@@ -0,0 +1,105 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.core.engine import TemplateEngine
+from src.core.scaffold import (
+    PROJECT_TEMPLATES,
+    TemplateSpec,
+    build_context,
+    render_project,
+    scaffold,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_render_project_covers_every_template(engine: TemplateEngine) -> None:
+    """Test that a project renders one file per registered template."""
+    context = build_context()
+    files = render_project(context, engine=engine)
+
+    assert [rendered.path for rendered in files] == [
+        spec.output for spec in PROJECT_TEMPLATES if spec.enabled(context)
+    ]
+    assert all(rendered.content for rendered in files)
+
+
+def test_render_project_is_deterministic_across_worker_counts(
+    engine: TemplateEngine,
+) -> None:
+    """Test that parallel rendering yields the same files in the same order."""
+    context = build_context({"database_type": "postgresql", "use_redis": True})
+
+    serial = render_project(context, engine=engine, workers=1)
+    parallel = render_project(context, engine=engine, workers=8)
+
+    assert serial == parallel
+
+
+def test_render_project_skips_disabled_templates(engine: TemplateEngine) -> None:
+    """Test that templates whose condition is false are not rendered."""
+    templates = (
+        TemplateSpec("docker/Dockerfile.j2", "Dockerfile"),
+        TemplateSpec(
+            "docker/.dockerignore.j2",
+            ".dockerignore",
+            when=lambda context: context.get("use_docker", False),
+        ),
+    )
+
+    files = render_project(build_context(), templates, engine=engine)
+
+    assert [rendered.path for rendered in files] == ["Dockerfile"]
+
+
+def test_scaffold_writes_project_tree(engine: TemplateEngine, tmp_path: Path) -> None:
+    """Test that scaffold writes every rendered file below the destination."""
+    destination = tmp_path / "service"
+
+    written = scaffold(build_context(), destination, engine=engine, workers=4)
+
+    assert written[0] == destination / "Dockerfile"
+    assert (destination / ".vscode" / "launch.json").is_file()
+    assert "FROM python:3.12" in (destination / "Dockerfile").read_text()
+    assert not list(destination.rglob("*.tmp"))
+
+
+def test_optimize_startup_adds_benchmark_script(engine: TemplateEngine) -> None:
+    """Test that the startup benchmark is only generated when requested."""
+    default = render_project(build_context(), engine=engine)
+    optimized = render_project(build_context({"optimize_startup": True}), engine=engine)
+
+    assert "scripts/bench_startup.py" not in [rendered.path for rendered in default]
+    assert "scripts/bench_startup.py" in [rendered.path for rendered in optimized]
+
+
+def test_database_module_follows_database_type(engine: TemplateEngine) -> None:
+    """Test that app/database.py is only generated when a database is chosen."""
+    without = render_project(build_context(), engine=engine)
+    with_db = render_project(build_context({"database_type": "mysql"}), engine=engine)
+
+    assert "app/main.py" in [rendered.path for rendered in without]
+    assert "app/database.py" not in [rendered.path for rendered in without]
+    assert "app/database.py" in [rendered.path for rendered in with_db]
+
+
+@pytest.mark.parametrize(
+    ("profile", "limit"), [("memory:1.5g", 1536), ("balanced", 2048)]
+)
+def test_db_profile_sizes_match_the_compose_template(
+    engine: TemplateEngine, profile: str, limit: int
+) -> None:
+    """Test that the validated budget is the one docker-compose.yml gets."""
+    context = build_context({"database_type": "postgresql", "db_profile": profile})
+
+    compose = engine.render("docker/docker-compose.yml.j2", context)
+
+    assert f"mem_limit: {limit}m" in compose
+
+
+def test_build_context_rejects_unknown_db_profile() -> None:
+    """Test that an unparsable db_profile fails instead of tuning nothing."""
+    with pytest.raises(ValueError, match="memory:<size>"):
+        build_context({"db_profile": "memory:lots"})
@@ -0,0 +1,69 @@
+import json
+import logging
+import threading
+from pathlib import Path
+
+from src.core import timing
+from src.core.engine import TemplateEngine
+from src.core.scaffold import build_context, scaffold
+from src.core.timing import Tracer, span, tracing
+
+logger = logging.getLogger(__name__)
+
+
+def test_span_is_a_shared_noop_without_tracer() -> None:
+    """Test that spans cost no allocation when tracing is off."""
+    assert span("a", "x") is span("b", "y")
+    with span("a", "x"):
+        pass
+
+
+def test_tracing_records_spans_from_all_threads() -> None:
+    """Test that spans opened in worker threads reach the active tracer."""
+    tracer = Tracer()
+
+    def work() -> None:
+        with span("worker", "test"):
+            pass
+
+    with tracing(tracer), span("main", "test"):
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+    assert timing._tracer is None
+    assert {(span.name, span.thread_id) for span in tracer.spans} == {
+        ("main", threading.get_ident()),
+        ("worker", worker.ident),
+    }
+
+
+def test_scaffold_reports_each_phase(engine: TemplateEngine, tmp_path: Path) -> None:
+    """Test that scaffolding times loading and rendering per template and writes."""
+    tracer = Tracer()
+    context = build_context({"database_type": "postgresql"})
+
+    with tracing(tracer):
+        scaffold(context, tmp_path, engine=engine)
+
+    recorded = {(span.category, span.name) for span in tracer.spans}
+    assert ("load", "docker/Dockerfile.j2") in recorded
+    assert ("render", "app/database.py.j2") in recorded
+    assert ("manifest", "build manifest") in recorded
+    assert ("write", "write files") in recorded
+    assert "write files" in tracer.format_table()
+
+
+def test_chrome_trace_uses_complete_events() -> None:
+    """Test that the trace is Chrome trace-event JSON with microsecond times."""
+    tracer = Tracer()
+    with tracing(tracer), span("render", "render", template="a.j2"):
+        pass
+
+    events = json.loads(tracer.to_chrome_trace())["traceEvents"]
+
+    assert len(events) == 1
+    assert events[0]["ph"] == "X"
+    assert events[0]["cat"] == "render"
+    assert events[0]["args"] == {"template": "a.j2"}
+    assert events[0]["dur"] >= 0
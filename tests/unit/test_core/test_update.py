@@ -0,0 +1,136 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from src.core.engine import TemplateEngine
+from src.core.manifest import MANIFEST_PATH
+from src.core.scaffold import (
+    PROJECT_TEMPLATES,
+    TemplateSpec,
+    build_context,
+    scaffold,
+)
+from src.core.update import update_project
+
+logger = logging.getLogger(__name__)
+
+
+def test_update_without_changes_touches_nothing(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that updating with the same options renders and writes nothing."""
+    context = build_context({"use_redis": True})
+    scaffold(context, tmp_path, engine=engine)
+    before = {path: path.stat().st_mtime_ns for path in tmp_path.rglob("*")}
+
+    result = update_project(tmp_path, engine=engine)
+
+    assert result.written == []
+    assert result.skipped == [
+        spec.output for spec in PROJECT_TEMPLATES if spec.enabled(context)
+    ]
+    assert {path: path.stat().st_mtime_ns for path in tmp_path.rglob("*")} == before
+
+
+def test_update_rerenders_only_templates_referencing_changed_keys(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that changing redis_port leaves mypy.ini alone."""
+    scaffold(build_context({"use_redis": True}), tmp_path, engine=engine)
+
+    result = update_project(tmp_path, {"redis_port": 6380}, engine=engine)
+
+    assert "mypy.ini" in result.skipped
+    assert "docker-compose.yml" in result.written
+    assert '"6380:6379"' in (tmp_path / "docker-compose.yml").read_text()
+    assert "6380" in (tmp_path / MANIFEST_PATH).read_text()
+
+
+def test_update_does_not_rewrite_identical_output(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that a re-rendered file with identical bytes is not rewritten."""
+    scaffold(build_context(), tmp_path, engine=engine)
+    dockerfile = tmp_path / "Dockerfile"
+    mtime = dockerfile.stat().st_mtime_ns
+
+    # docker-compose.yml.j2 already defaults debug to 'False', so it is
+    # re-rendered because its context changed but produces the same bytes.
+    result = update_project(tmp_path, {"debug": "False"}, engine=engine)
+
+    assert "docker-compose.yml" in result.unchanged
+    assert "Dockerfile" in result.skipped
+    assert dockerfile.stat().st_mtime_ns == mtime
+
+
+def test_update_restores_deleted_files(engine: TemplateEngine, tmp_path: Path) -> None:
+    """Test that a file missing on disk is regenerated."""
+    scaffold(build_context(), tmp_path, engine=engine)
+    (tmp_path / "ruff.toml").unlink()
+
+    result = update_project(tmp_path, engine=engine)
+
+    assert result.written == ["ruff.toml"]
+    assert (tmp_path / "ruff.toml").is_file()
+
+
+def test_update_removes_files_of_disabled_templates(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that outputs of templates that got disabled are removed."""
+    templates = (
+        TemplateSpec("docker/Dockerfile.j2", "Dockerfile"),
+        TemplateSpec(
+            "docker/.dockerignore.j2",
+            ".dockerignore",
+            when=lambda context: context.get("use_docker", True),
+        ),
+    )
+    scaffold(build_context(), tmp_path, templates, engine=engine)
+
+    result = update_project(tmp_path, {"use_docker": False}, templates, engine=engine)
+
+    assert result.removed == [".dockerignore"]
+    assert not (tmp_path / ".dockerignore").exists()
+
+
+def test_update_without_manifest_is_refused(
+    engine: TemplateEngine, tmp_path: Path
+) -> None:
+    """Test that a directory scoffy did not generate is left untouched."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "Dockerfile").write_text("FROM scratch\n")
+
+    with pytest.raises(FileNotFoundError, match="only projects generated by scoffy"):
+        update_project(project, {"use_redis": True}, engine=engine)
+
+    assert [path.name for path in project.iterdir()] == ["Dockerfile"]
+
+
+def test_update_rerenders_templates_whose_imports_changed(
+    templates_copy: Path, tmp_path: Path
+) -> None:
+    """Test that editing an imported template marks its users as stale."""
+    (templates_copy / "git" / "macros.j2").write_text(
+        "{% macro ignore(path) %}{{ path }}{% endmacro %}"
+    )
+    (templates_copy / "git" / "ignore.j2").write_text(
+        '{% from "git/macros.j2" import ignore %}{{ ignore("build/") }}\n'
+    )
+    templates = (TemplateSpec("git/ignore.j2", ".ignore"),)
+    engine = TemplateEngine(templates_copy, use_bytecode_cache=False)
+    scaffold(build_context(), tmp_path, templates, engine=engine)
+    (templates_copy / "git" / "macros.j2").write_text(
+        "{% macro ignore(path) %}/{{ path }}{% endmacro %}"
+    )
+
+    result = update_project(
+        tmp_path,
+        templates=templates,
+        engine=TemplateEngine(templates_copy, use_bytecode_cache=False),
+    )
+
+    assert result.written == [".ignore"]
+    assert (tmp_path / ".ignore").read_text() == "/build/"
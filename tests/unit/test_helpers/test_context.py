@@ -0,0 +1,56 @@
+import logging
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.helpers.context import db_profile_memory_mb, load_context_file
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize(
+    ("profile", "memory_mb"),
+    [
+        (None, 0),
+        ("", 0),
+        ("dev-fast", 1024),
+        (" Balanced ", 2048),
+        ("memory:4g", 4096),
+        ("memory:1.5GiB", 1536),
+        ("memory: 512mb", 512),
+        ("memory:768", 768),
+    ],
+)
+def test_db_profile_memory_mb_parses_profiles(profile: Any, memory_mb: int) -> None:
+    """Test that named profiles and memory sizes give their budget in MiB."""
+    assert db_profile_memory_mb(profile) == memory_mb
+
+
+@pytest.mark.parametrize(
+    "profile", ["fast", "memory:", "memory:4 gigs", "memory:0g", "memory:1.5m", "4g"]
+)
+def test_db_profile_memory_mb_rejects_unknown_values(profile: str) -> None:
+    """Test that values the compose template would ignore raise ValueError."""
+    with pytest.raises(ValueError, match="db_profile must be"):
+        db_profile_memory_mb(profile)
+
+
+@pytest.mark.parametrize(
+    ("name", "text", "message"),
+    [
+        ("options.yaml", "use_redis: [true\n", "not valid YAML"),
+        ("options.json", '{"use_redis": true', "not valid JSON"),
+        ("options.yaml", "- use_redis\n", "must contain a mapping"),
+        ("options.json", "[1]", "must contain a mapping"),
+    ],
+)
+def test_load_context_file_rejects_malformed_files(
+    tmp_path: Path, name: str, text: str, message: str
+) -> None:
+    """Test that syntax errors and non-mappings raise ValueError."""
+    path = tmp_path / name
+    path.write_text(text)
+
+    with pytest.raises(ValueError, match=message):
+        load_context_file(path)
@@ -0,0 +1,65 @@
+import logging
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from src.helpers import filesystem
+from src.helpers.filesystem import write_files_atomically
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_write_files_atomically_writes_all_files(tmp_path: Path, workers: int) -> None:
+    """Test that every file is written with its content and order is kept."""
+    files = [(tmp_path / "a.txt", b"a"), (tmp_path / "nested" / "b.txt", b"b")]
+
+    written = write_files_atomically(files, workers=workers)
+
+    assert written == [tmp_path / "a.txt", tmp_path / "nested" / "b.txt"]
+    assert (tmp_path / "a.txt").read_bytes() == b"a"
+    assert (tmp_path / "nested" / "b.txt").read_bytes() == b"b"
+
+
+def test_write_files_atomically_replaces_existing_file(tmp_path: Path) -> None:
+    """Test that an existing file is replaced without leaving temporaries."""
+    target = tmp_path / "config.ini"
+    target.write_bytes(b"old")
+
+    write_files_atomically([(target, b"new")], durable=False)
+
+    assert target.read_bytes() == b"new"
+    assert [path.name for path in tmp_path.iterdir()] == ["config.ini"]
+
+
+def test_write_files_atomically_leaves_nothing_behind_on_failure(
+    tmp_path: Path,
+) -> None:
+    """Test that a failing batch renames nothing into place."""
+    blocker = tmp_path / "blocker"
+    blocker.write_bytes(b"")
+    files = [(tmp_path / "ok.txt", b"ok"), (blocker / "child.txt", b"x")]
+
+    with pytest.raises(FileExistsError):
+        write_files_atomically(files, workers=2)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["blocker"]
+
+
+def test_write_files_atomically_uses_regular_file_modes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that new files follow the umask and replaced files keep their mode."""
+    script = tmp_path / "run.sh"
+    script.write_bytes(b"old")
+    script.chmod(0o755)
+    monkeypatch.setattr(filesystem, "_UMASK", 0o027)
+    # Setting the umask from a writer would race with other threads.
+    monkeypatch.setattr(os, "umask", pytest.fail)
+
+    write_files_atomically([(tmp_path / "new.txt", b"new"), (script, b"new")])
+
+    assert stat.S_IMODE((tmp_path / "new.txt").stat().st_mode) == 0o640
+    assert stat.S_IMODE(script.stat().st_mode) == 0o755
@@ -0,0 +1,59 @@
+import logging
+
+from src.helpers.importtime import (
+    ImportRecord,
+    StartupReport,
+    parse_importtime,
+    strip_importtime,
+)
+
+logger = logging.getLogger(__name__)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2014 |       2500 |     click.core
+import time:       366 |       2866 |   click
+import time:       900 |       3766 | src.commands
+Usage: scoffy [OPTIONS] COMMAND [ARGS]...
+"""
+
+
+def test_parse_importtime_reads_every_timing_line() -> None:
+    """Test that importtime lines are parsed and other output is ignored."""
+    records = parse_importtime(SAMPLE)
+
+    assert [record.module for record in records] == [
+        "_io",
+        "click.core",
+        "click",
+        "src.commands",
+    ]
+    assert records[1] == ImportRecord("click.core", 2014, 2500, 2)
+    assert records[-1].depth == 0
+
+
+def test_strip_importtime_keeps_other_output() -> None:
+    """Test that only the importtime lines are removed."""
+    assert strip_importtime(SAMPLE) == "Usage: scoffy [OPTIONS] COMMAND [ARGS]..."
+
+
+def test_startup_report_summarises_imports() -> None:
+    """Test that the report totals self time and ranks the slowest modules."""
+    report = StartupReport(["--help"], wall_ms=12.5, records=parse_importtime(SAMPLE))
+
+    assert report.import_ms == 3.4
+    assert report.slowest(1)[0].module == "click.core"
+    assert "scoffy --help" in report.format()
+
+
+def test_startup_report_flags_framework_imports() -> None:
+    """Test that framework packages imported at startup are reported."""
+    records = [
+        ImportRecord("sqlalchemy.orm", 10, 10, 1),
+        ImportRecord("sqlalchemy", 10, 20, 0),
+        ImportRecord("click", 10, 10, 0),
+    ]
+    report = StartupReport(["--help"], wall_ms=1.0, records=records)
+
+    assert report.forbidden() == ["sqlalchemy", "sqlalchemy.orm"]